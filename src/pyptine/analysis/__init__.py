@@ -1,12 +1,15 @@
 """Data analysis module for pyptine.
 
 Provides methods for advanced statistical calculations on indicator data,
-including year-over-year growth, month-over-month changes, and moving averages.
+including year-over-year growth, month-over-month changes, moving averages and moving minima/maxima.
 """
 
 from pyptine.analysis.metrics import (
+    calculate_metrics,
     calculate_mom_change,
     calculate_moving_average,
+    calculate_moving_max,
+    calculate_moving_min,
     calculate_yoy_growth,
 )
 
@@ -14,4 +17,7 @@ __all__ = [
     "calculate_yoy_growth",
     "calculate_mom_change",
     "calculate_moving_average",
+    "calculate_moving_min",
+    "calculate_moving_max",
+    "calculate_metrics",
 ]
@@ -0,0 +1,227 @@
+"""Numerical kernels for rolling statistics.
+
+The kernels are plain Python loops over float64 arrays that reproduce the
+results of ``Series.rolling(window).mean()``, ``.min()``, ``.max()`` and
+``Series.ewm(span, adjust=False).mean()``. When numba is installed they are
+JIT-compiled (and cached on disk); otherwise callers should keep using pandas,
+which is faster than an interpreted loop.
+
+Moving averages over small windows, the common case for monthly and
+quarterly series, use a kernel that sums each window's values directly
+instead of keeping a running sum.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
+
+# Largest window summed directly by _small_window_moving_average()
+SMALL_WINDOW_MAX = 8
+
+
+def _moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over ``window`` points, NaN until the window is full.
+
+    Any NaN inside a window makes that output NaN, matching pandas' default
+    ``min_periods=window``. The running sum uses Kahan compensation so results
+    do not drift on long series. A prefix-sum difference (``c[w:] - c[:-w]``)
+    would also be O(n), but subtracting two large cumulative totals loses
+    the low digits of the window sum, badly so for large values.
+
+    Args:
+        values: float64 input values
+        window: Window size (at least 1)
+
+    Returns:
+        Array of moving averages, same length as values
+    """
+    n = len(values)
+    out = np.empty(n, dtype=np.float64)
+    total = 0.0
+    compensation = 0.0
+    nan_count = 0
+
+    for i in range(n):
+        value = values[i]
+        if value != value:
+            nan_count += 1
+        else:
+            y = value - compensation
+            t = total + y
+            compensation = (t - total) - y
+            total = t
+
+        if i >= window:
+            old = values[i - window]
+            if old != old:
+                nan_count -= 1
+            else:
+                y = -old - compensation
+                t = total + y
+                compensation = (t - total) - y
+                total = t
+
+        if i + 1 < window or nan_count > 0:
+            out[i] = np.nan
+        else:
+            out[i] = total / window
+
+    return out
+
+
+def _small_window_moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over a small ``window``, summing each window directly.
+
+    For windows up to SMALL_WINDOW_MAX the inner loop is short enough that
+    adding the window's values at every position beats keeping a running sum,
+    and there is no compensation state to carry. A NaN anywhere in the window
+    propagates to that output, as in _moving_average().
+
+    Args:
+        values: float64 input values
+        window: Window size (1 to SMALL_WINDOW_MAX)
+
+    Returns:
+        Array of moving averages, same length as values
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        total = values[i]
+        for offset in range(1, window):
+            total += values[i - offset]
+        out[i] = total / window
+    return out
+
+
+def _exponential_moving_average(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponentially weighted mean with ``adjust=False`` semantics.
+
+    Missing values carry the previous average forward, and the weight of the
+    previous average keeps decaying across them (pandas' ``ignore_na=False``).
+
+    Args:
+        values: float64 input values
+        alpha: Smoothing factor, ``2 / (span + 1)``
+
+    Returns:
+        Array of exponential moving averages, same length as values
+    """
+    n = len(values)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+
+    decay = 1.0 - alpha
+    weighted = values[0]
+    old_weight = 1.0
+    out[0] = weighted
+
+    for i in range(1, n):
+        value = values[i]
+        is_observation = value == value
+
+        if weighted == weighted:
+            old_weight *= decay
+            if is_observation:
+                if weighted != value:
+                    weighted = (old_weight * weighted + alpha * value) / (old_weight + alpha)
+                old_weight = 1.0
+        elif is_observation:
+            weighted = value
+
+        out[i] = weighted
+
+    return out
+
+
+def _rolling_extremum(values: np.ndarray, window: int, maximum: bool) -> np.ndarray:
+    """Trailing minimum or maximum over ``window`` points, NaN until the window is full.
+
+    Keeps a monotonic deque of indices whose values could still be the
+    extremum of a later window, so each value is pushed and popped at most
+    once: O(n) whatever the window size. As with _moving_average(), any NaN
+    inside a window makes that output NaN.
+
+    Args:
+        values: float64 input values
+        window: Window size (at least 1)
+        maximum: True for the rolling maximum, False for the minimum
+
+    Returns:
+        Array of rolling extrema, same length as values
+    """
+    n = len(values)
+    out = np.empty(n, dtype=np.float64)
+    # Each index enters the deque once, so a flat array with head/tail never wraps
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    nan_count = 0
+
+    for i in range(n):
+        value = values[i]
+        if value != value:
+            nan_count += 1
+        else:
+            while tail > head and (
+                values[deque[tail - 1]] <= value if maximum else values[deque[tail - 1]] >= value
+            ):
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+
+        if i >= window:
+            old = values[i - window]
+            if old != old:
+                nan_count -= 1
+        while tail > head and deque[head] <= i - window:
+            head += 1
+
+        if i + 1 < window or nan_count > 0:
+            out[i] = np.nan
+        else:
+            out[i] = values[deque[head]]
+
+    return out
+
+
+def _exponential_moving_average_batch(matrix: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponential moving average of every row of a 2-D array.
+
+    Rows are independent series; when compiled, they are processed in
+    parallel (``prange``).
+
+    Args:
+        matrix: float64 array with one series per row
+        alpha: Smoothing factor, ``2 / (span + 1)``
+
+    Returns:
+        Array of exponential moving averages, same shape as matrix
+    """
+    out = np.empty_like(matrix)
+    for i in prange(matrix.shape[0]):
+        out[i] = exponential_moving_average(matrix[i], alpha)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    moving_average = njit(cache=True)(_moving_average)
+    small_window_moving_average = njit(cache=True)(_small_window_moving_average)
+    exponential_moving_average = njit(cache=True)(_exponential_moving_average)
+    rolling_extremum = njit(cache=True)(_rolling_extremum)
+    exponential_moving_average_batch = njit(cache=True, parallel=True)(
+        _exponential_moving_average_batch
+    )
+else:
+    moving_average = _moving_average
+    small_window_moving_average = _small_window_moving_average
+    exponential_moving_average = _exponential_moving_average
+    rolling_extremum = _rolling_extremum
+    exponential_moving_average_batch = _exponential_moving_average_batch
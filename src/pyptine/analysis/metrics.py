@@ -1,17 +1,30 @@
-"""Statistical metrics for data analysis."""
+"""Statistical metrics for data analysis.
+
+Metric columns are always float64: periods where a metric is undefined (the
+first year for YoY growth, the first window-1 periods for a moving average,
+or every period when the value column is not numeric) hold NaN, never None.
+"""
 
 import logging
-from typing import Any, cast
+from typing import Any, Optional, cast
 
 try:
+    import numpy as np
     import pandas as pd
 
+    from pyptine.analysis import _kernels
+    from pyptine.processors.dataframe import _series_to_list, records_to_dataframe
+
     PANDAS_AVAILABLE = True
 except ImportError:
     PANDAS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Periods such as "2023", "2023-01", "2023M01" or "2023Q1": a year and an
+# optional month/quarter/semester number
+_PERIOD_KEY_PATTERN = r"^(\d{4})(?:\D{0,3}(\d{1,2}))?$"
+
 
 def calculate_yoy_growth(
     data: list[dict[str, Any]],
@@ -30,7 +43,7 @@ def calculate_yoy_growth(
         period_column: Name of the column containing time period (default: "Period")
 
     Returns:
-        List of data points with added 'yoy_growth' column (None for first year)
+        List of data points with added 'yoy_growth' column (NaN for first year)
 
     Raises:
         ValueError: If required columns are missing or if no period data is available
@@ -42,7 +55,7 @@ def calculate_yoy_growth(
         ...     {"Period": "2023", "value": 120},
         ... ]
         >>> result = calculate_yoy_growth(data)
-        >>> # result[0]['yoy_growth'] is None
+        >>> # result[0]['yoy_growth'] is nan
         >>> # result[1]['yoy_growth'] is 10.0 (10% growth)
         >>> # result[2]['yoy_growth'] is ~9.09% growth
     """
@@ -57,20 +70,9 @@ def calculate_yoy_growth(
     if value_column not in data[0] or period_column not in data[0]:
         raise ValueError(f"Data must contain '{value_column}' and '{period_column}' columns")
 
-    df = pd.DataFrame(data).copy()
+    df = calculate_yoy_growth_df(records_to_dataframe(data), value_column, period_column)
 
-    # Ensure period is sorted
-    df = df.sort_values(by=period_column)
-
-    # Calculate YoY growth
-    df["yoy_growth"] = None
-    if value_column in df.columns and df[value_column].dtype in [float, int]:
-        # Calculate percentage change year-over-year
-        df["yoy_growth"] = df[value_column].pct_change() * 100
-
-    logger.debug(f"Calculated YoY growth for {len(df)} data points")
-
-    return cast(list[dict[str, Any]], df.to_dict(orient="records"))
+    return _add_columns(data, df, ["yoy_growth"])
 
 
 def calculate_mom_change(
@@ -90,7 +92,7 @@ def calculate_mom_change(
         period_column: Name of the column containing time period (default: "Period")
 
     Returns:
-        List of data points with added 'mom_change' column (None for first period)
+        List of data points with added 'mom_change' column (NaN for first period)
 
     Raises:
         ValueError: If required columns are missing
@@ -102,7 +104,7 @@ def calculate_mom_change(
         ...     {"Period": "2023-03", "value": 102},
         ... ]
         >>> result = calculate_mom_change(data)
-        >>> # result[0]['mom_change'] is None
+        >>> # result[0]['mom_change'] is nan
         >>> # result[1]['mom_change'] is 5.0 (5% growth)
         >>> # result[2]['mom_change'] is ~-2.86% (decline)
     """
@@ -117,20 +119,9 @@ def calculate_mom_change(
     if value_column not in data[0] or period_column not in data[0]:
         raise ValueError(f"Data must contain '{value_column}' and '{period_column}' columns")
 
-    df = pd.DataFrame(data).copy()
-
-    # Ensure period is sorted
-    df = df.sort_values(by=period_column)
-
-    # Calculate MoM change
-    df["mom_change"] = None
-    if value_column in df.columns and df[value_column].dtype in [float, int]:
-        # Calculate percentage change month-over-month
-        df["mom_change"] = df[value_column].pct_change() * 100
-
-    logger.debug(f"Calculated MoM change for {len(df)} data points")
+    df = calculate_mom_change_df(records_to_dataframe(data), value_column, period_column)
 
-    return cast(list[dict[str, Any]], df.to_dict(orient="records"))
+    return _add_columns(data, df, ["mom_change"])
 
 
 def calculate_moving_average(
@@ -151,7 +142,7 @@ def calculate_moving_average(
         period_column: Name of the column containing time period (default: "Period")
 
     Returns:
-        List of data points with added 'moving_avg' column (None for first window-1 periods)
+        List of data points with added 'moving_avg' column (NaN for first window-1 periods)
 
     Raises:
         ValueError: If required columns are missing or window size is invalid
@@ -164,8 +155,8 @@ def calculate_moving_average(
         ...     {"Period": "2023-04", "value": 120},
         ... ]
         >>> result = calculate_moving_average(data, window=3)
-        >>> # result[0]['moving_avg'] is None
-        >>> # result[1]['moving_avg'] is None
+        >>> # result[0]['moving_avg'] is nan
+        >>> # result[1]['moving_avg'] is nan
         >>> # result[2]['moving_avg'] is 105.0 (mean of 100, 110, 105)
         >>> # result[3]['moving_avg'] is 111.67 (mean of 110, 105, 120)
     """
@@ -183,19 +174,100 @@ def calculate_moving_average(
     if value_column not in data[0] or period_column not in data[0]:
         raise ValueError(f"Data must contain '{value_column}' and '{period_column}' columns")
 
-    df = pd.DataFrame(data).copy()
+    df = calculate_moving_average_df(
+        records_to_dataframe(data), window, value_column, period_column
+    )
 
-    # Ensure period is sorted
-    df = df.sort_values(by=period_column)
+    return _add_columns(data, df, ["moving_avg"])
 
-    # Calculate moving average
-    df["moving_avg"] = None
-    if value_column in df.columns and df[value_column].dtype in [float, int]:
-        df["moving_avg"] = df[value_column].rolling(window=window, center=False).mean()
 
-    logger.debug(f"Calculated {window}-period moving average for {len(df)} data points")
+def calculate_moving_min(
+    data: list[dict[str, Any]],
+    window: int = 3,
+    value_column: str = "value",
+    period_column: str = "Period",
+) -> list[dict[str, Any]]:
+    """Calculate the minimum over a trailing time window.
+
+    Returns a list of data points with an added 'moving_min' column. Runs in
+    linear time whatever the window size.
+
+    Args:
+        data: List of data dictionaries with at least 'value' and period columns
+        window: Number of periods in the window (default: 3)
+        value_column: Name of the column containing values (default: "value")
+        period_column: Name of the column containing time period (default: "Period")
+
+    Returns:
+        List of data points with added 'moving_min' column (NaN for first window-1 periods)
+
+    Raises:
+        ValueError: If required columns are missing or window size is invalid
+
+    Example:
+        >>> result = calculate_moving_min(data, window=3)
+        >>> # result[2]['moving_min'] is the lowest of the first three values
+    """
+    return _calculate_moving_extremum(data, window, value_column, period_column, maximum=False)
+
+
+def calculate_moving_max(
+    data: list[dict[str, Any]],
+    window: int = 3,
+    value_column: str = "value",
+    period_column: str = "Period",
+) -> list[dict[str, Any]]:
+    """Calculate the maximum over a trailing time window.
+
+    Returns a list of data points with an added 'moving_max' column. Runs in
+    linear time whatever the window size.
+
+    Args:
+        data: List of data dictionaries with at least 'value' and period columns
+        window: Number of periods in the window (default: 3)
+        value_column: Name of the column containing values (default: "value")
+        period_column: Name of the column containing time period (default: "Period")
+
+    Returns:
+        List of data points with added 'moving_max' column (NaN for first window-1 periods)
+
+    Raises:
+        ValueError: If required columns are missing or window size is invalid
+
+    Example:
+        >>> result = calculate_moving_max(data, window=3)
+        >>> # result[2]['moving_max'] is the highest of the first three values
+    """
+    return _calculate_moving_extremum(data, window, value_column, period_column, maximum=True)
+
+
+def _calculate_moving_extremum(
+    data: list[dict[str, Any]],
+    window: int,
+    value_column: str,
+    period_column: str,
+    maximum: bool,
+) -> list[dict[str, Any]]:
+    """Shared implementation of calculate_moving_min() and calculate_moving_max()."""
+    if not PANDAS_AVAILABLE:
+        raise ImportError(
+            "pandas is required for moving min/max calculation. Install with: pip install pandas"
+        )
+
+    if not data:
+        return []
+
+    if window < 1:
+        raise ValueError(f"Window size must be at least 1, got {window}")
+
+    if value_column not in data[0] or period_column not in data[0]:
+        raise ValueError(f"Data must contain '{value_column}' and '{period_column}' columns")
+
+    df = _moving_extremum_df(
+        records_to_dataframe(data), window, value_column, period_column, maximum
+    )
 
-    return cast(list[dict[str, Any]], df.to_dict(orient="records"))
+    return _add_columns(data, df, ["moving_max" if maximum else "moving_min"])
 
 
 def calculate_exponential_moving_average(
@@ -245,16 +317,657 @@ def calculate_exponential_moving_average(
     if value_column not in data[0] or period_column not in data[0]:
         raise ValueError(f"Data must contain '{value_column}' and '{period_column}' columns")
 
-    df = pd.DataFrame(data).copy()
+    df = calculate_exponential_moving_average_df(
+        records_to_dataframe(data), span, value_column, period_column
+    )
+
+    return _add_columns(data, df, ["ema"])
+
+
+def calculate_exponential_moving_average_batch(
+    series: list[Any],
+    span: int = 3,
+) -> list["np.ndarray"]:
+    """Calculate the exponential moving average of several independent series.
+
+    Each series is a sequence of values already in period order, e.g. the
+    value columns of several indicators fetched together with AsyncINE. The
+    series are padded into one matrix and processed in a single call: with
+    numba installed the series run in parallel on all cores, otherwise pandas
+    computes all columns at once.
+
+    Args:
+        series: Value sequences (lists or arrays); lengths may differ, and
+            None is treated as a missing value
+        span: Span parameter for EMA calculation (default: 3)
+
+    Returns:
+        One float64 array of EMA values per input series, same lengths
+
+    Raises:
+        ValueError: If span is invalid
+
+    Example:
+        >>> responses = await asyncio.gather(*(ine.get_data(v) for v in varcds))
+        >>> values = [[row["value"] for row in r.data] for r in responses]
+        >>> emas = calculate_exponential_moving_average_batch(values, span=12)
+    """
+    if not PANDAS_AVAILABLE:
+        raise ImportError(
+            "pandas is required for EMA calculation. Install with: pip install pandas"
+        )
+
+    if span < 1:
+        raise ValueError(f"Span must be at least 1, got {span}")
+
+    if not series:
+        return []
+
+    lengths = [len(values) for values in series]
+    matrix = np.full((len(series), max(lengths)), np.nan)
+    for row, values, length in zip(matrix, series, lengths):
+        row[:length] = values
+
+    if _kernels.NUMBA_AVAILABLE:
+        matrix[np.isinf(matrix)] = np.nan
+        result = _kernels.exponential_moving_average_batch(matrix, 2.0 / (span + 1))
+    else:
+        result = pd.DataFrame(matrix.T).ewm(span=span, adjust=False).mean().to_numpy().T
+
+    return [row[:length].copy() for row, length in zip(result, lengths)]
+
+
+def calculate_metrics(
+    data: list[dict[str, Any]],
+    metrics: list[str],
+    value_column: str = "value",
+    period_column: str = "Period",
+) -> list[dict[str, Any]]:
+    """Calculate several metrics over the same data at once.
+
+    Equivalent to chaining :func:`calculate_yoy_growth`,
+    :func:`calculate_mom_change`, :func:`calculate_moving_average` and
+    :func:`calculate_exponential_moving_average`, but the rows are converted
+    to columns and back only once instead of once per metric.
+
+    Args:
+        data: List of data dictionaries with at least 'value' and period columns
+        metrics: Metric specs - "yoy", "mom", "ma", "ema", "min" or "max", the
+            last four with an optional window/span such as "ma:12" (default: 3)
+        value_column: Name of the column containing values (default: "value")
+        period_column: Name of the column containing time period (default: "Period")
+
+    Returns:
+        List of data points with the requested metric columns added
+
+    Raises:
+        ValueError: If required columns are missing or a metric spec is invalid
+
+    Example:
+        >>> result = calculate_metrics(data, ["yoy", "ma:2"])
+        >>> # Each row now has 'yoy_growth' and 'moving_avg'
+    """
+    if not PANDAS_AVAILABLE:
+        raise ImportError(
+            "pandas is required for metric calculation. Install with: pip install pandas"
+        )
+
+    _parse_metric_specs(metrics)
+
+    if not data:
+        return []
+
+    if value_column not in data[0] or period_column not in data[0]:
+        raise ValueError(f"Data must contain '{value_column}' and '{period_column}' columns")
+
+    df = calculate_metrics_df(records_to_dataframe(data), metrics, value_column, period_column)
+
+    return _add_columns(data, df, metric_columns(metrics))
+
+
+def _add_columns(
+    data: list[dict[str, Any]], df: "pd.DataFrame", columns: list[str]
+) -> list[dict[str, Any]]:
+    """Return shallow copies of the input rows, in df's order, with df's new columns set.
+
+    df must have been built from data with records_to_dataframe() (so its
+    index gives each row's position in data) and may have been reordered.
+    Only the new columns are converted from df; the other values are the
+    caller's own, and the input rows are not modified.
+    """
+    rows = [data[position].copy() for position in df.index.tolist()]
+    for column in columns:
+        for row, value in zip(rows, _series_to_list(df[column])):
+            row[column] = value
+    return rows
+
+
+def _require_columns(df: "pd.DataFrame", value_column: str, period_column: str) -> None:
+    """Raise ValueError if the value or period column is missing from df."""
+    if value_column not in df.columns or period_column not in df.columns:
+        raise ValueError(f"Data must contain '{value_column}' and '{period_column}' columns")
+
+
+def _numeric_values(series: "pd.Series") -> Optional["pd.Series"]:
+    """Return the values as float64, or None when they are not numeric.
+
+    Any integer or float dtype counts as numeric, including float32 and the
+    nullable Int64/Float64 dtypes (whose missing values become NaN); booleans
+    do not.
+    """
+    dtype = series.dtype
+    if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        return None
+    if dtype == np.float64:
+        return series
+    return series.astype(np.float64)
+
+
+def _sort_by_period(df: "pd.DataFrame", period_column: str) -> "pd.DataFrame":
+    """Return a new DataFrame ordered by period.
+
+    Frames that are already in period order, such as the result of a previous
+    analysis step in a chain, are only shallow-copied instead of re-sorted.
+    """
+    if df[period_column].is_monotonic_increasing:
+        return df.copy(deep=False)
+    return df.sort_values(by=period_column)
+
+
+def _percent_change(series: "pd.Series") -> "np.ndarray":
+    """Percentage change between consecutive values of a numeric series.
+
+    Same result as ``series.pct_change() * 100`` (NaN next to a missing value,
+    ``±inf`` or NaN for a change from zero), computed with one vectorized
+    division over the values.
+    """
+    values = series.to_numpy(dtype=np.float64)
+    out = np.empty(len(values), dtype=np.float64)
+    if len(values) == 0:
+        return out
+
+    out[0] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(values[1:], values[:-1], out=out[1:])
+    out[1:] -= 1.0
+    out[1:] *= 100.0
+    return out
+
+
+def _period_keys(periods: "pd.Series") -> Optional["np.ndarray"]:
+    """Encode each period as ``year * 100 + sub-period`` (0 for annual data).
+
+    Categorical periods are parsed once per category. Returns None when any
+    period does not look like a year with an optional sub-period, or when a
+    period occurs more than once, since rows then cannot be matched by period.
+    Repeated labels (several regions or series in one frame) are detected with
+    a hash check before any label is parsed.
+    """
+    if not periods.is_unique:
+        return None
+
+    if isinstance(periods.dtype, pd.CategoricalDtype):
+        codes = periods.cat.codes.to_numpy()
+        if (codes < 0).any():
+            return None
+        labels = pd.Series(periods.cat.categories.astype(str))
+    else:
+        codes = None
+        labels = periods.astype(str)
+
+    parts = labels.str.extract(_PERIOD_KEY_PATTERN)
+    if parts[0].isna().any():
+        return None
+
+    keys = parts[0].astype(np.int64).to_numpy() * 100
+    keys += parts[1].fillna("0").astype(np.int64).to_numpy()
+    if codes is not None:
+        keys = keys[codes]
+
+    if len(np.unique(keys)) != len(keys):
+        return None
+    return keys
+
+
+def _year_over_year(values: "pd.Series", keys: "np.ndarray") -> "np.ndarray":
+    """Percentage change from the same period of the previous year.
+
+    The previous-year row of every period is found with one binary search
+    over the sorted period keys; periods without one get NaN.
+
+    Args:
+        values: Numeric values
+        keys: Period keys from _period_keys(), aligned with values
+
+    Returns:
+        Array of percentage changes, same length as values
+    """
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    targets = keys - 100
+    positions = np.minimum(np.searchsorted(sorted_keys, targets), len(keys) - 1)
+    found = sorted_keys[positions] == targets
+
+    current = values.to_numpy(dtype=np.float64)
+    previous = np.where(found, current[order[positions]], np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (current / previous - 1.0) * 100.0
+
+
+def _yoy_growth(values: "pd.Series", periods: "pd.Series") -> Any:
+    """Year-over-year growth of period-ordered values (see calculate_yoy_growth_df)."""
+    keys = _period_keys(periods)
+    if keys is None:
+        return _percent_change(values)
+    return _year_over_year(values, keys)
+
+
+def _kernel_input(values: "pd.Series") -> "np.ndarray":
+    """Values as a float64 array for the kernels, with ±inf treated as missing.
+
+    pandas' rolling and ewm windows replace infinite values with NaN before
+    computing; doing the same here keeps the kernels' results identical.
+    """
+    array = values.to_numpy(dtype=np.float64)
+    infinite = np.isinf(array)
+    if infinite.any():
+        array = np.where(infinite, np.nan, array)
+    return array
+
 
-    # Ensure period is sorted
-    df = df.sort_values(by=period_column)
+def _moving_average(values: "pd.Series", window: int) -> Any:
+    """Trailing moving average, using the compiled kernel when numba is installed."""
+    if _kernels.NUMBA_AVAILABLE:
+        array = _kernel_input(values)
+        if window <= _kernels.SMALL_WINDOW_MAX:
+            return _kernels.small_window_moving_average(array, window)
+        return _kernels.moving_average(array, window)
+    return values.rolling(window=window, center=False).mean()
 
-    # Calculate exponential moving average
-    df["ema"] = None
-    if value_column in df.columns and df[value_column].dtype in [float, int]:
-        df["ema"] = df[value_column].ewm(span=span, adjust=False).mean()
+
+def _rolling_extremum(values: "pd.Series", window: int, maximum: bool) -> Any:
+    """Trailing minimum or maximum, using the compiled kernel when numba is installed."""
+    if _kernels.NUMBA_AVAILABLE:
+        return _kernels.rolling_extremum(_kernel_input(values), window, maximum)
+    # pandas keeps a monotonic deque per window too, so both paths are O(n)
+    rolling = values.rolling(window=window)
+    return rolling.max() if maximum else rolling.min()
+
+
+def _exponential_moving_average(values: "pd.Series", span: int) -> Any:
+    """Exponential moving average, using the compiled kernel when numba is installed."""
+    if _kernels.NUMBA_AVAILABLE:
+        return _kernels.exponential_moving_average(_kernel_input(values), 2.0 / (span + 1))
+    return values.ewm(span=span, adjust=False).mean()
+
+
+def calculate_yoy_growth_df(
+    df: "pd.DataFrame",
+    value_column: str = "value",
+    period_column: str = "Period",
+) -> "pd.DataFrame":
+    """Calculate year-over-year growth rates on a DataFrame.
+
+    DataFrame counterpart of :func:`calculate_yoy_growth`. The input is not
+    modified; a new DataFrame sorted by period with an added 'yoy_growth'
+    column is returned.
+
+    Periods that are years with an optional sub-period ("2023", "2023-01",
+    "2023Q1") are matched to the same sub-period of the previous year, and
+    get NaN when that period is missing. Other or repeated periods fall back
+    to the change from the preceding row.
+
+    Args:
+        df: DataFrame with at least the value and period columns
+        value_column: Name of the column containing values (default: "value")
+        period_column: Name of the column containing time period (default: "Period")
+
+    Returns:
+        New DataFrame with added 'yoy_growth' column
+
+    Raises:
+        ValueError: If required columns are missing
+    """
+    if df.empty:
+        return df.copy()
+
+    _require_columns(df, value_column, period_column)
+
+    df = _sort_by_period(df, period_column)
+
+    values = _numeric_values(df[value_column])
+    df["yoy_growth"] = np.nan
+    if values is not None:
+        df["yoy_growth"] = _yoy_growth(values, df[period_column])
+
+    logger.debug(f"Calculated YoY growth for {len(df)} data points")
+
+    return df
+
+
+def calculate_mom_change_df(
+    df: "pd.DataFrame",
+    value_column: str = "value",
+    period_column: str = "Period",
+) -> "pd.DataFrame":
+    """Calculate month-over-month percentage changes on a DataFrame.
+
+    DataFrame counterpart of :func:`calculate_mom_change`. The input is not
+    modified; a new DataFrame sorted by period with an added 'mom_change'
+    column is returned.
+
+    Args:
+        df: DataFrame with at least the value and period columns
+        value_column: Name of the column containing values (default: "value")
+        period_column: Name of the column containing time period (default: "Period")
+
+    Returns:
+        New DataFrame with added 'mom_change' column
+
+    Raises:
+        ValueError: If required columns are missing
+    """
+    if df.empty:
+        return df.copy()
+
+    _require_columns(df, value_column, period_column)
+
+    df = _sort_by_period(df, period_column)
+
+    values = _numeric_values(df[value_column])
+    df["mom_change"] = np.nan
+    if values is not None:
+        df["mom_change"] = _percent_change(values)
+
+    logger.debug(f"Calculated MoM change for {len(df)} data points")
+
+    return df
+
+
+def calculate_moving_average_df(
+    df: "pd.DataFrame",
+    window: int = 3,
+    value_column: str = "value",
+    period_column: str = "Period",
+) -> "pd.DataFrame":
+    """Calculate simple moving average on a DataFrame.
+
+    DataFrame counterpart of :func:`calculate_moving_average`. The input is not
+    modified; a new DataFrame sorted by period with an added 'moving_avg'
+    column is returned.
+
+    Args:
+        df: DataFrame with at least the value and period columns
+        window: Number of periods to include in the moving average (default: 3)
+        value_column: Name of the column containing values (default: "value")
+        period_column: Name of the column containing time period (default: "Period")
+
+    Returns:
+        New DataFrame with added 'moving_avg' column
+
+    Raises:
+        ValueError: If required columns are missing or window size is invalid
+    """
+    if window < 1:
+        raise ValueError(f"Window size must be at least 1, got {window}")
+
+    if df.empty:
+        return df.copy()
+
+    _require_columns(df, value_column, period_column)
+
+    df = _sort_by_period(df, period_column)
+
+    values = _numeric_values(df[value_column])
+    df["moving_avg"] = np.nan
+    if values is not None:
+        df["moving_avg"] = _moving_average(values, window)
+
+    logger.debug(f"Calculated {window}-period moving average for {len(df)} data points")
+
+    return df
+
+
+def calculate_exponential_moving_average_df(
+    df: "pd.DataFrame",
+    span: int = 3,
+    value_column: str = "value",
+    period_column: str = "Period",
+) -> "pd.DataFrame":
+    """Calculate exponential moving average on a DataFrame.
+
+    DataFrame counterpart of :func:`calculate_exponential_moving_average`. The
+    input is not modified; a new DataFrame sorted by period with an added 'ema'
+    column is returned.
+
+    Args:
+        df: DataFrame with at least the value and period columns
+        span: Span parameter for EMA calculation (default: 3)
+        value_column: Name of the column containing values (default: "value")
+        period_column: Name of the column containing time period (default: "Period")
+
+    Returns:
+        New DataFrame with added 'ema' column
+
+    Raises:
+        ValueError: If required columns are missing or span is invalid
+    """
+    if span < 1:
+        raise ValueError(f"Span must be at least 1, got {span}")
+
+    if df.empty:
+        return df.copy()
+
+    _require_columns(df, value_column, period_column)
+
+    df = _sort_by_period(df, period_column)
+
+    values = _numeric_values(df[value_column])
+    df["ema"] = np.nan
+    if values is not None:
+        df["ema"] = _exponential_moving_average(values, span)
 
     logger.debug(f"Calculated EMA (span={span}) for {len(df)} data points")
 
-    return cast(list[dict[str, Any]], df.to_dict(orient="records"))
+    return df
+
+
+def calculate_moving_min_df(
+    df: "pd.DataFrame",
+    window: int = 3,
+    value_column: str = "value",
+    period_column: str = "Period",
+) -> "pd.DataFrame":
+    """Calculate the trailing-window minimum on a DataFrame.
+
+    DataFrame counterpart of :func:`calculate_moving_min`. The input is not
+    modified; a new DataFrame sorted by period with an added 'moving_min'
+    column is returned.
+
+    Args:
+        df: DataFrame with at least the value and period columns
+        window: Number of periods in the window (default: 3)
+        value_column: Name of the column containing values (default: "value")
+        period_column: Name of the column containing time period (default: "Period")
+
+    Returns:
+        New DataFrame with added 'moving_min' column
+
+    Raises:
+        ValueError: If required columns are missing or window size is invalid
+    """
+    return _moving_extremum_df(df, window, value_column, period_column, maximum=False)
+
+
+def calculate_moving_max_df(
+    df: "pd.DataFrame",
+    window: int = 3,
+    value_column: str = "value",
+    period_column: str = "Period",
+) -> "pd.DataFrame":
+    """Calculate the trailing-window maximum on a DataFrame.
+
+    DataFrame counterpart of :func:`calculate_moving_max`. The input is not
+    modified; a new DataFrame sorted by period with an added 'moving_max'
+    column is returned.
+
+    Args:
+        df: DataFrame with at least the value and period columns
+        window: Number of periods in the window (default: 3)
+        value_column: Name of the column containing values (default: "value")
+        period_column: Name of the column containing time period (default: "Period")
+
+    Returns:
+        New DataFrame with added 'moving_max' column
+
+    Raises:
+        ValueError: If required columns are missing or window size is invalid
+    """
+    return _moving_extremum_df(df, window, value_column, period_column, maximum=True)
+
+
+def _moving_extremum_df(
+    df: "pd.DataFrame", window: int, value_column: str, period_column: str, maximum: bool
+) -> "pd.DataFrame":
+    """Shared implementation of calculate_moving_min_df() and calculate_moving_max_df()."""
+    if window < 1:
+        raise ValueError(f"Window size must be at least 1, got {window}")
+
+    if df.empty:
+        return df.copy()
+
+    _require_columns(df, value_column, period_column)
+
+    df = _sort_by_period(df, period_column)
+
+    column = "moving_max" if maximum else "moving_min"
+    values = _numeric_values(df[value_column])
+    df[column] = np.nan
+    if values is not None:
+        df[column] = _rolling_extremum(values, window, maximum)
+
+    logger.debug(f"Calculated {window}-period {column} for {len(df)} data points")
+
+    return df
+
+
+# Metric name -> (added column, default window/span)
+_METRICS: dict[str, tuple[str, Optional[int]]] = {
+    "yoy": ("yoy_growth", None),
+    "mom": ("mom_change", None),
+    "ma": ("moving_avg", 3),
+    "ema": ("ema", 3),
+    "min": ("moving_min", 3),
+    "max": ("moving_max", 3),
+}
+
+
+def _parse_metric_specs(metrics: list[str]) -> list[tuple[str, Optional[int]]]:
+    """Parse specs such as "yoy" or "ma:12" into (name, window/span) pairs.
+
+    Raises:
+        ValueError: If a spec is unknown, malformed or repeated
+    """
+    parsed: list[tuple[str, Optional[int]]] = []
+    for spec in metrics:
+        name, _, param = spec.strip().lower().partition(":")
+        if name not in _METRICS:
+            raise ValueError(f"Unknown metric '{spec}', expected one of {set(_METRICS)}")
+        if any(name == seen for seen, _ in parsed):
+            raise ValueError(f"Metric '{name}' requested more than once")
+
+        size = _METRICS[name][1]
+        if param:
+            if size is None:
+                raise ValueError(f"Metric '{name}' takes no parameter, got '{spec}'")
+            try:
+                size = int(param)
+            except ValueError:
+                raise ValueError(f"Invalid parameter in metric '{spec}'") from None
+        if name == "ema" and size is not None and size < 1:
+            raise ValueError(f"Span must be at least 1, got {size}")
+        if size is not None and size < 1:
+            raise ValueError(f"Window size must be at least 1, got {size}")
+
+        parsed.append((name, size))
+    return parsed
+
+
+def metric_columns(metrics: list[str]) -> list[str]:
+    """Return the columns that :func:`calculate_metrics_df` adds for the given specs.
+
+    Args:
+        metrics: Metric specs, e.g. ["yoy", "ma:12"]
+
+    Returns:
+        Column names, in the order the specs are given
+
+    Raises:
+        ValueError: If a metric spec is invalid
+    """
+    return [_METRICS[name][0] for name, _ in _parse_metric_specs(metrics)]
+
+
+def calculate_metrics_df(
+    df: "pd.DataFrame",
+    metrics: list[str],
+    value_column: str = "value",
+    period_column: str = "Period",
+) -> "pd.DataFrame":
+    """Calculate several metrics on a DataFrame in one pass.
+
+    Equivalent to chaining the ``calculate_*_df`` functions, but the frame is
+    sorted and the values column extracted once, and all requested columns
+    are added to the same new DataFrame. The input is not modified.
+
+    Metrics are given as ``"yoy"``, ``"mom"``, ``"ma"``, ``"ema"``, ``"min"`` or
+    ``"max"``, the last four optionally with a window/span (``"ma:12"``,
+    ``"ema:10"``; default 3). They add the 'yoy_growth', 'mom_change',
+    'moving_avg', 'ema', 'moving_min' and 'moving_max' columns, in the order
+    requested. The rolling minimum and maximum are NaN until the window is
+    full or while it contains a missing value, like the moving average.
+
+    Args:
+        df: DataFrame with at least the value and period columns
+        metrics: Metric specs to calculate
+        value_column: Name of the column containing values (default: "value")
+        period_column: Name of the column containing time period (default: "Period")
+
+    Returns:
+        New DataFrame sorted by period with the metric columns added
+
+    Raises:
+        ValueError: If required columns are missing or a metric spec is invalid
+
+    Example:
+        >>> result = calculate_metrics_df(df, ["yoy", "ma:12"])
+        >>> result[["Period", "yoy_growth", "moving_avg"]].tail()
+    """
+    specs = _parse_metric_specs(metrics)
+
+    if df.empty:
+        return df.copy()
+
+    _require_columns(df, value_column, period_column)
+
+    df = _sort_by_period(df, period_column)
+    values = _numeric_values(df[value_column])
+
+    for name, size in specs:
+        column = _METRICS[name][0]
+        if values is None:
+            df[column] = np.nan
+        elif name == "yoy":
+            df[column] = _yoy_growth(values, df[period_column])
+        elif name == "mom":
+            df[column] = _percent_change(values)
+        elif name == "ma":
+            df[column] = _moving_average(values, cast(int, size))
+        elif name == "ema":
+            df[column] = _exponential_moving_average(values, cast(int, size))
+        else:
+            df[column] = _rolling_extremum(values, cast(int, size), name == "max")
+
+    logger.debug(f"Calculated metrics {[name for name, _ in specs]} for {len(df)} data points")
+
+    return df
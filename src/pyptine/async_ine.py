@@ -2,12 +2,16 @@
 
 import logging
 from collections.abc import AsyncIterator
-from typing import Any, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
 
 from pyptine.client.async_data import AsyncDataClient
 from pyptine.client.metadata import MetadataClient
 from pyptine.models.response import DataResponse
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +25,12 @@ class AsyncINE:
     Args:
         language: Language for API responses ("EN" or "PT", default: "EN")
         timeout: Request timeout in seconds (default: 30)
+        cache_enabled: Revalidate cached responses with ETag/Last-Modified
+            instead of re-downloading them (default: False)
+        cache_dir: Directory for the response cache (default: user cache dir)
+        max_concurrent: Maximum number of requests sent to the API at once (default: 8)
+        prefetch_metadata: Fetch indicator metadata concurrently with data requests
+            (default: False)
 
     Example:
         >>> async with AsyncINE(language="EN") as ine:
@@ -43,10 +53,18 @@ class AsyncINE:
         self,
         language: str = "EN",
         timeout: int = 30,
+        cache_enabled: bool = False,
+        cache_dir: Optional[Path] = None,
+        max_concurrent: int = AsyncDataClient.MAX_CONCURRENT,
+        prefetch_metadata: bool = False,
     ) -> None:
         """Initialize async INE client."""
         self.language = language.upper()
         self.timeout = timeout
+        self.cache_enabled = cache_enabled
+        self.cache_dir = cache_dir
+        self.max_concurrent = max_concurrent
+        self.prefetch_metadata = prefetch_metadata
         self.data_client: Optional[AsyncDataClient] = None
         self.metadata_client: Optional[MetadataClient] = None
 
@@ -65,6 +83,10 @@ class AsyncINE:
             language=self.language,
             timeout=self.timeout,
             metadata_client=self.metadata_client,
+            cache_enabled=self.cache_enabled,
+            cache_dir=self.cache_dir,
+            max_concurrent=self.max_concurrent,
+            prefetch_metadata=self.prefetch_metadata,
         )
         await self.data_client.__aenter__()
         return self
@@ -135,6 +157,34 @@ class AsyncINE:
         async for chunk in self.data_client.get_all_data(varcd, dimensions, chunk_size):
             yield chunk
 
+    async def get_all_dataframe(
+        self,
+        varcd: str,
+        dimensions: Optional[dict[str, str]] = None,
+        chunk_size: int = 40000,
+    ) -> "pd.DataFrame":
+        """Fetch all data for an indicator into a single DataFrame.
+
+        Chunks are converted as they arrive and their raw rows released, keeping
+        peak memory close to the size of the final DataFrame.
+
+        Args:
+            varcd: Indicator code
+            dimensions: Optional dimension filters
+            chunk_size: Number of records per chunk (default: 40,000)
+
+        Returns:
+            pandas DataFrame with all data points
+
+        Example:
+            >>> async with AsyncINE() as ine:
+            ...     df = await ine.get_all_dataframe("0004127")
+        """
+        if not self.data_client:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+
+        return await self.data_client.get_all_dataframe(varcd, dimensions, chunk_size)
+
     async def get_metadata(self, varcd: str) -> Any:
         """Fetch indicator metadata.
 
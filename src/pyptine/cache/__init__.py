@@ -1,9 +1,11 @@
 """Caching system for pyptine package."""
 
 from pyptine.cache.backend import CacheBackend
+from pyptine.cache.conditional import ConditionalCache
 from pyptine.cache.disk import DiskCache
 
 __all__ = [
     "CacheBackend",
+    "ConditionalCache",
     "DiskCache",
 ]
@@ -0,0 +1,162 @@
+"""SQLite store of response bodies and validators for conditional requests."""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from platformdirs import user_cache_dir
+
+from pyptine.cache.backend import CacheBackend
+from pyptine.utils.exceptions import CacheError
+
+logger = logging.getLogger(__name__)
+
+
+class ConditionalCache(CacheBackend):
+    """SQLite-backed cache of response bodies with their HTTP validators.
+
+    Each entry holds the raw response body together with its ``ETag`` and
+    ``Last-Modified`` headers and a freshness deadline. Within the freshness
+    window the body can be reused without contacting the server; after it,
+    the validators let the client revalidate with ``If-None-Match`` /
+    ``If-Modified-Since`` and reuse the body on ``304 Not Modified``.
+
+    Entries are dictionaries with the keys ``body`` (bytes), ``etag``,
+    ``last_modified`` and ``fresh_until`` (Unix timestamp).
+
+    The connection may be used from several threads (the async client reads
+    and writes from worker threads); every access is serialized with a lock.
+
+    Args:
+        cache_dir: Directory for cache storage (None for default)
+        default_ttl: Freshness window in seconds when set() gets no ttl
+
+    Example:
+        >>> cache = ConditionalCache()
+        >>> cache.set("key", {"body": b"{}", "etag": '"abc"', "last_modified": None})
+        >>> cache.get("key")["etag"]
+        '"abc"'
+    """
+
+    DEFAULT_TTL = 600  # 10 minutes
+    DB_NAME = "conditional.sqlite"
+
+    def __init__(self, cache_dir: Optional[Path] = None, default_ttl: int = DEFAULT_TTL) -> None:
+        """Initialize conditional request cache."""
+        self.cache_dir = (
+            Path(user_cache_dir("pyptine", "pyptine")) if cache_dir is None else Path(cache_dir)
+        )
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.cache_dir / self.DB_NAME), check_same_thread=False
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+                "fresh_until REAL NOT NULL, body BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            raise CacheError(f"Failed to open conditional request cache: {e}") from e
+
+        logger.debug(f"Using conditional request cache at: {self.cache_dir / self.DB_NAME}")
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Get a cached entry, fresh or stale.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Entry dictionary or None if not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, fresh_until, body FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        etag, last_modified, fresh_until, body = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh_until": fresh_until,
+            "body": bytes(body),
+        }
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a response body and its validators.
+
+        Args:
+            key: Cache key
+            value: Dictionary with ``body`` and optional ``etag``/``last_modified``
+            ttl: Freshness window in seconds (None for default)
+        """
+        fresh_until = time.time() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, last_modified, fresh_until, body) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    value.get("etag"),
+                    value.get("last_modified"),
+                    fresh_until,
+                    sqlite3.Binary(value["body"]),
+                ),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> bool:
+        """Delete a cached entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if key existed and was deleted
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+        except sqlite3.Error as e:
+            raise CacheError(f"Failed to clear conditional request cache: {e}") from e
+
+    def size(self) -> int:
+        """Get number of cached entries.
+
+        Returns:
+            Number of entries in cache
+        """
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def get_cache_dir(self) -> Path:
+        """Get cache directory path.
+
+        Returns:
+            Path to cache directory
+        """
+        return self.cache_dir
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -21,6 +21,10 @@ class DiskCache(CacheBackend):
     - Metadata cache: 7 days (indicator metadata, dimensions, catalogue)
     - Data cache: 1 day (indicator data)
 
+    The databases use SQLite's write-ahead log, so a cache write appends to
+    the log instead of rewriting pages under an exclusive lock, and readers
+    (other threads or clients sharing the cache) are not blocked by writers.
+
     Args:
         cache_dir: Directory for cache storage (None for default)
         metadata_ttl: Metadata cache TTL in seconds (default: 7 days)
@@ -81,6 +85,7 @@ class DiskCache(CacheBackend):
             allowable_codes=[200],
             allowable_methods=["GET", "HEAD"],
             stale_if_error=True,
+            wal=True,
         )
 
     def get(self, key: str) -> Optional[Any]:
@@ -217,12 +222,17 @@ class DiskCache(CacheBackend):
             Total size in bytes
         """
         total = 0
+        pending = [str(path)]
         try:
-            for entry in os.scandir(path):
-                if entry.is_file():
-                    total += entry.stat().st_size
-                elif entry.is_dir():
-                    total += self._get_directory_size(Path(entry.path))
+            # One scandir pass per directory; the iterators are closed as soon
+            # as they are exhausted, and symlinks are neither followed nor counted
+            while pending:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
         except Exception as e:
             logger.debug(f"Error calculating directory size: {e}")
         return total
@@ -1,9 +1,10 @@
 """Command-line interface for pyptine."""
 
-import sys
+from collections.abc import Iterator
 from functools import wraps
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, TypeVar
 
 import click
 from click import Context
@@ -31,21 +32,76 @@ from pyptine.cli.utils import (
     print_success,
     spinner_task,
 )
-from pyptine.utils.exceptions import INEError
+
+# Shared option types, built once and reused by every command
+LANG_CHOICE = click.Choice(("EN", "PT"), case_sensitive=False)
+FORMAT_CHOICE = click.Choice(("csv", "json"), case_sensitive=False)
+
+T = TypeVar("T")
+
+
+def take_results(matches: Iterator[T], limit: Optional[int], count: bool) -> tuple[list[T], int]:
+    """Take the results to display from a lazy iterator of matches.
+
+    Unless ``count`` is set, at most one match past ``limit`` is read, so
+    the rest of the catalogue is never scanned just to report a total.
+
+    Args:
+        matches: Iterator of matching items
+        limit: Maximum number of items to take (None for all)
+        count: Consume the remaining matches to count them
+
+    Returns:
+        Tuple of (items to display, number of further matches); without
+        ``count`` the second value is only 1 (more exist) or 0
+    """
+    shown = list(islice(matches, limit))
+    if limit is None:
+        return shown, 0
+    if count:
+        return shown, sum(1 for _ in matches)
+    return shown, int(next(matches, None) is not None)
+
+
+def print_remaining(shown: int, remaining: int, count: bool, noun: str) -> None:
+    """Tell the user that more results exist than were displayed.
+
+    Args:
+        shown: Number of items displayed
+        remaining: Further matches, as returned by take_results()
+        count: Whether remaining is an exact count
+        noun: What is being listed (e.g. "results")
+    """
+    if not remaining:
+        return
+    if count:
+        print_info(
+            "Results", f"Showing {shown} of {shown + remaining} {noun}. Use --limit to see more."
+        )
+    else:
+        print_info(
+            "Results",
+            f"Showing {shown} of {shown}+ {noun} found. "
+            "Use --limit to see more, or --count for the total.",
+        )
 
 
 def handle_exceptions(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator to handle common exceptions for CLI commands."""
 
+    # handle_cli_error distinguishes INEError from unexpected errors itself,
+    # so a single except clause covers both cases.
+    _handle = handle_cli_error
+
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> None:
         try:
             func(*args, **kwargs)
-        except INEError as e:
-            handle_cli_error(e, verbose=False)
+        except click.exceptions.Exit:
+            # Deliberate exits from the command (Exit subclasses RuntimeError)
+            raise
         except Exception as e:
-            # Catch any other unexpected exceptions
-            handle_cli_error(e, verbose=False)
+            _handle(e, verbose=False)
 
     return wrapper
 
@@ -85,7 +141,7 @@ def cli(ctx: Context) -> None:  # type: ignore[misc]
     "--lang",
     "-l",
     default="EN",
-    type=click.Choice(["EN", "PT"], case_sensitive=False),
+    type=LANG_CHOICE,
     help="Language (EN or PT)",
 )
 @click.option(
@@ -94,6 +150,11 @@ def cli(ctx: Context) -> None:  # type: ignore[misc]
     type=int,
     help="Maximum number of results to display",
 )
+@click.option(
+    "--count",
+    is_flag=True,
+    help="Count every match to report the total (scans the whole catalogue)",
+)
 @click.option(
     "--timeout",
     "-w",
@@ -108,6 +169,7 @@ def search(
     subtheme: Optional[str],
     lang: str,
     limit: Optional[int],
+    count: bool,
     timeout: int,
 ) -> None:
     """Search for indicators by keyword.
@@ -118,6 +180,7 @@ def search(
         pyptine search "population" --theme "Population"
         pyptine search "employment" --lang PT --limit 10
         pyptine search "gdp" --timeout 20
+        pyptine search "gdp" --limit 5 --count
     """
     ine = INE(language=lang, cache=True, timeout=timeout)
 
@@ -129,7 +192,8 @@ def search(
         # Fast path: catalogue is already cached
         with spinner_task("Searching indicators...") as progress:
             task_id = progress.add_task("[cyan]Searching...", total=None)
-            results = ine.search(query, theme=theme, subtheme=subtheme)
+            matches = ine.isearch(query, theme=theme, subtheme=subtheme)
+            results, remaining = take_results(matches, limit or None, count)
             progress.update(task_id, completed=True)
     else:
         # Slow path: need to download catalogue with progress bar
@@ -154,29 +218,21 @@ def search(
             def progress_callback(downloaded: int, total: int) -> None:
                 progress.update(download_task, completed=downloaded)
 
-            results = ine.search(
+            matches = ine.isearch(
                 query, theme=theme, subtheme=subtheme, progress_callback=progress_callback
             )
+            results, remaining = take_results(matches, limit or None, count)
 
     if not results:
         print_error("No Results", f"No indicators found for '{query}'")
-        sys.exit(1)
-
-    total_found = len(results)
-
-    # Apply limit if specified
-    if limit:
-        results = results[:limit]
+        raise click.exceptions.Exit(1)
 
     # Display results in a table
-    table = create_indicators_table(results, limit=len(results))
+    table = create_indicators_table(results)
     console.print(table)
 
     # Summary
-    if total_found > len(results):
-        print_info(
-            "Results", f"Showing {len(results)} of {total_found} results. Use --limit to see more."
-        )
+    print_remaining(len(results), remaining, count, "results")
 
 
 @cli.command()
@@ -185,7 +241,7 @@ def search(
     "--lang",
     "-l",
     default="EN",
-    type=click.Choice(["EN", "PT"], case_sensitive=False),
+    type=LANG_CHOICE,
     help="Language (EN or PT)",
 )
 @handle_exceptions
@@ -229,7 +285,7 @@ def info(varcd: str, lang: str) -> None:
 @click.option(
     "--output-format",
     "-f",
-    type=click.Choice(["csv", "json"], case_sensitive=False),
+    type=FORMAT_CHOICE,
     default="csv",
     help="Output format (csv or json)",
 )
@@ -237,7 +293,7 @@ def info(varcd: str, lang: str) -> None:
     "--lang",
     "-l",
     default="EN",
-    type=click.Choice(["EN", "PT"], case_sensitive=False),
+    type=LANG_CHOICE,
     help="Language (EN or PT)",
 )
 @click.option(
@@ -280,7 +336,7 @@ def download(
                 print_error(
                     "Invalid Format", f"Dimension format should be 'DimN=value', got '{dim}'"
                 )
-                sys.exit(1)
+                raise click.exceptions.Exit(1)
             key, value = dim.split("=", 1)
             dimensions[key] = value
 
@@ -305,19 +361,25 @@ def download(
 
         task_id = progress.add_task(f"[cyan]Saving to {output_format.upper()}...", total=None)
         if output_format.lower() == "csv":
-            response.to_csv(
+
+            def rows_callback(written: int, total: int) -> None:
+                progress.update(task_id, completed=written, total=total)
+
+            bytes_written = response.to_csv(
                 output_path,
                 include_metadata=not no_metadata,
+                stream=True,
+                progress_callback=rows_callback,
             )
         else:  # json
-            response.to_json(
+            bytes_written = response.to_json(
                 output_path,
                 pretty=True,
             )
         progress.update(task_id, total=1, completed=1)
 
     # Success message
-    file_size = output_path.stat().st_size / 1024  # Convert to KB
+    file_size = bytes_written / 1024  # Convert to KB
     print_success("Download Complete", f"Data saved to {output_path} ({file_size:.1f} KB)")
 
 
@@ -327,7 +389,7 @@ def download(
     "--lang",
     "-l",
     default="EN",
-    type=click.Choice(["EN", "PT"], case_sensitive=False),
+    type=LANG_CHOICE,
     help="Language (EN or PT)",
 )
 @handle_exceptions
@@ -349,7 +411,7 @@ def dimensions(varcd: str, lang: str) -> None:
 
     if not dims:
         print_error("No Dimensions", f"No dimensions found for indicator {varcd}")
-        sys.exit(1)
+        raise click.exceptions.Exit(1)
 
     # Display dimensions table
     table = create_dimensions_table(dims)
@@ -358,16 +420,17 @@ def dimensions(varcd: str, lang: str) -> None:
     # Display dimension values
     for dim in dims:
         console.print(
-            f"\n[bold cyan]Dim{dim.id}: {dim.name}[/bold cyan] ({len(dim.values)} values)"
+            f"\n[bold cyan]{dim.api_key}: {dim.name}[/bold cyan] ({len(dim.values)} values)"
         )
 
-        # Show all values (or first 20 if too many)
-        values_to_show = dim.values[:20]
-        for val in values_to_show:
-            console.print(f"  [cyan]{val.code}[/cyan] → {val.label}")
+        # Show all values (or first 20 if too many), rendered in a single print
+        lines = [f"  [cyan]{val.code}[/cyan] → {val.label}" for val in dim.values[:20]]
 
         if len(dim.values) > 20:
-            console.print(f"  [dim]... and {len(dim.values) - 20} more values[/dim]")
+            lines.append(f"  [dim]... and {len(dim.values) - 20} more values[/dim]")
+
+        if lines:
+            console.print("\n".join(lines), highlight=False)
 
 
 @cli.group()
@@ -388,7 +451,7 @@ def list_commands() -> None:
     "--lang",
     "-l",
     default="EN",
-    type=click.Choice(["EN", "PT"], case_sensitive=False),
+    type=LANG_CHOICE,
     help="Language (EN or PT)",
 )
 @handle_exceptions
@@ -431,7 +494,7 @@ def list_themes(lang: str) -> None:
 
     if not themes:
         print_error("No Themes", "No themes found in the catalogue")
-        sys.exit(1)
+        raise click.exceptions.Exit(1)
 
     # Display themes in table
     table = create_themes_table(themes)
@@ -448,7 +511,7 @@ def list_themes(lang: str) -> None:
     "--lang",
     "-l",
     default="EN",
-    type=click.Choice(["EN", "PT"], case_sensitive=False),
+    type=LANG_CHOICE,
     help="Language (EN or PT)",
 )
 @click.option(
@@ -458,8 +521,13 @@ def list_themes(lang: str) -> None:
     default=20,
     help="Maximum number of indicators to display",
 )
+@click.option(
+    "--count",
+    is_flag=True,
+    help="Count every indicator to report the total (scans the whole catalogue)",
+)
 @handle_exceptions
-def list_indicators(theme: Optional[str], lang: str, limit: int) -> None:
+def list_indicators(theme: Optional[str], lang: str, limit: int, count: bool) -> None:
     """List available indicators."""
     ine = INE(language=lang, cache=True)
 
@@ -471,7 +539,8 @@ def list_indicators(theme: Optional[str], lang: str, limit: int) -> None:
         # Fast path: catalogue is already cached
         with spinner_task("Fetching indicators...") as progress:
             task_id = progress.add_task("[cyan]Fetching...", total=None)
-            indicators = ine.search(query="", theme=theme)
+            matches = ine.browser.iter_indicators(theme=theme)
+            indicators, remaining = take_results(matches, limit, count)
             progress.update(task_id, completed=True)
     else:
         # Slow path: need to download catalogue with progress bar
@@ -494,28 +563,22 @@ def list_indicators(theme: Optional[str], lang: str, limit: int) -> None:
             def progress_callback(downloaded: int, total: int) -> None:
                 progress.update(download_task, completed=downloaded)
 
-            indicators = ine.search(query="", theme=theme, progress_callback=progress_callback)
+            matches = ine.browser.iter_indicators(theme=theme, progress_callback=progress_callback)
+            indicators, remaining = take_results(matches, limit, count)
 
     if not indicators:
         if theme:
             print_error("No Results", f"No indicators found for theme '{theme}'")
         else:
             print_error("No Results", "No indicators found in the catalogue")
-        sys.exit(1)
-
-    # Apply limit
-    total = len(indicators)
-    indicators = indicators[:limit]
+        raise click.exceptions.Exit(1)
 
     # Display table
-    table = create_indicators_table(indicators, limit=len(indicators))
+    table = create_indicators_table(indicators)
     console.print(table)
 
     # Show info about remaining results
-    if total > limit:
-        print_info(
-            "Results", f"Showing {len(indicators)} of {total} indicators. Use --limit to see more."
-        )
+    print_remaining(len(indicators), remaining, count, "indicators")
 
 
 @cli.group()
@@ -1,13 +1,15 @@
 """Utilities for CLI formatting and output."""
 
 import platform
-import sys
+from functools import lru_cache
 from typing import Any, Optional
 
+import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
+from rich.text import Text
 
 from pyptine.utils.exceptions import INEError
 
@@ -22,6 +24,46 @@ console = Console()
 error_console = Console(stderr=True, style="red")
 
 
+@lru_cache(maxsize=64)
+def _panel_title(symbol: str, title: str, style: str) -> Text:
+    """Build (and cache) a styled panel title.
+
+    Args:
+        symbol: Status symbol shown before the title
+        title: Title text
+        style: Rich colour name for the title
+
+    Returns:
+        Styled Text object
+    """
+    return Text(f"{symbol} {title}", style=f"bold {style}")
+
+
+def _print_panel(
+    target: Console, symbol: str, title: str, message: str, style: str, pad: bool
+) -> None:
+    """Render a bordered status panel.
+
+    Message and title are plain Text rather than markup strings, so Rich does
+    not need to parse markup for every message.
+
+    Args:
+        target: Console to print to
+        symbol: Status symbol shown before the title
+        title: Panel title
+        message: Panel body (may be empty)
+        style: Rich colour name used for title, body and border
+        pad: Pad the body even when the message is empty
+    """
+    panel = Panel(
+        Text(message, style=style),
+        title=_panel_title(symbol, title, style),
+        border_style=style,
+        padding=(0, 1) if pad or message else (0, 0),
+    )
+    target.print(panel)
+
+
 def print_error(title: str, message: str) -> None:
     """Print an error message with consistent formatting.
 
@@ -29,12 +71,7 @@ def print_error(title: str, message: str) -> None:
         title: Error title
         message: Error message details
     """
-    error_panel = Panel(
-        f"[red]{message}[/red]",
-        title=f"[bold red]{ERROR_SYMBOL} {title}[/bold red]",
-        border_style="red",
-    )
-    error_console.print(error_panel)
+    _print_panel(error_console, ERROR_SYMBOL, title, message, "red", pad=True)
 
 
 def print_success(title: str, message: str = "") -> None:
@@ -44,14 +81,7 @@ def print_success(title: str, message: str = "") -> None:
         title: Success title
         message: Optional additional message
     """
-    content = f"[green]{message}[/green]" if message else ""
-    success_panel = Panel(
-        content,
-        title=f"[bold green]{SUCCESS_SYMBOL} {title}[/bold green]",
-        border_style="green",
-        padding=(0, 1) if message else (0, 0),
-    )
-    console.print(success_panel)
+    _print_panel(console, SUCCESS_SYMBOL, title, message, "green", pad=False)
 
 
 def print_info(title: str, message: str = "") -> None:
@@ -61,14 +91,7 @@ def print_info(title: str, message: str = "") -> None:
         title: Info title
         message: Optional additional message
     """
-    content = f"[cyan]{message}[/cyan]" if message else ""
-    info_panel = Panel(
-        content,
-        title=f"[bold cyan]{INFO_SYMBOL} {title}[/bold cyan]",
-        border_style="cyan",
-        padding=(0, 1) if message else (0, 0),
-    )
-    console.print(info_panel)
+    _print_panel(console, INFO_SYMBOL, title, message, "cyan", pad=False)
 
 
 def create_indicators_table(indicators: Any, limit: Optional[int] = None) -> Table:
@@ -86,9 +109,12 @@ def create_indicators_table(indicators: Any, limit: Optional[int] = None) -> Tab
     table.add_column("Title", style="white")
     table.add_column("Theme", style="magenta")
 
-    for ind in indicators[:limit] if limit else indicators:
-        theme = ind.theme or "-"
-        table.add_row(ind.varcd, ind.title, theme)
+    # Only slice when the limit actually truncates the list
+    rows = indicators if not limit or limit >= len(indicators) else indicators[:limit]
+
+    add_row = table.add_row
+    for ind in rows:
+        add_row(ind.varcd, ind.title, ind.theme or "-")
 
     return table
 
@@ -108,7 +134,7 @@ def create_dimensions_table(dimensions: Any) -> Table:
     table.add_column("Values", style="green", justify="right")
 
     for dim in dimensions:
-        table.add_row(f"Dim{dim.id}", dim.name, str(len(dim.values)))
+        table.add_row(dim.api_key, dim.name, str(len(dim.values)))
 
     return table
 
@@ -157,7 +183,7 @@ def handle_cli_error(exception: Exception, verbose: bool = False) -> None:
         verbose: If True, include full traceback
 
     Raises:
-        SystemExit: Always exits with code 1
+        click.exceptions.Exit: Always exits with code 1
     """
     if isinstance(exception, INEError):
         print_error("API Error", str(exception))
@@ -167,7 +193,7 @@ def handle_cli_error(exception: Exception, verbose: bool = False) -> None:
     if verbose:
         console.print_exception()
 
-    sys.exit(1)
+    raise click.exceptions.Exit(1)
 
 
 def format_indicator_info(indicator: Any, metadata: Any) -> str:
@@ -177,43 +203,73 @@ def format_indicator_info(indicator: Any, metadata: Any) -> str:
         indicator: Indicator object
         metadata: Indicator metadata
 
+    Returns:
+        Formatted string with indicator details
+    """
+    return _format_indicator_fields(
+        indicator.varcd,
+        indicator.title,
+        indicator.description,
+        indicator.theme,
+        indicator.subtheme,
+        indicator.periodicity,
+        indicator.last_period,
+        metadata.unit,
+        indicator.source,
+    )
+
+
+@lru_cache(maxsize=128)
+def _format_indicator_fields(
+    varcd: str,
+    title: str,
+    description: Optional[str],
+    theme: Optional[str],
+    subtheme: Optional[str],
+    periodicity: Optional[str],
+    last_period: Optional[str],
+    unit: Optional[str],
+    source: Optional[str],
+) -> str:
+    """Build the indicator info markup from primitive fields (memoized).
+
     Returns:
         Formatted string with indicator details
     """
     lines = []
 
     # Code
-    lines.append(f"[cyan]Code:[/cyan] {indicator.varcd}")
+    lines.append(f"[cyan]Code:[/cyan] {varcd}")
 
     # Title
-    lines.append(f"[cyan]Title:[/cyan] {indicator.title}")
+    lines.append(f"[cyan]Title:[/cyan] {title}")
 
     # Description
-    if indicator.description:
-        lines.append(f"[cyan]Description:[/cyan] {indicator.description}")
+    if description:
+        lines.append(f"[cyan]Description:[/cyan] {description}")
 
     # Theme
-    if indicator.theme:
-        lines.append(f"[cyan]Theme:[/cyan] {indicator.theme}")
+    if theme:
+        lines.append(f"[cyan]Theme:[/cyan] {theme}")
 
     # Subtheme
-    if indicator.subtheme:
-        lines.append(f"[cyan]Subtheme:[/cyan] {indicator.subtheme}")
+    if subtheme:
+        lines.append(f"[cyan]Subtheme:[/cyan] {subtheme}")
 
     # Periodicity
-    if indicator.periodicity:
-        lines.append(f"[cyan]Periodicity:[/cyan] {indicator.periodicity}")
+    if periodicity:
+        lines.append(f"[cyan]Periodicity:[/cyan] {periodicity}")
 
     # Last period
-    if indicator.last_period:
-        lines.append(f"[cyan]Last Period:[/cyan] {indicator.last_period}")
+    if last_period:
+        lines.append(f"[cyan]Last Period:[/cyan] {last_period}")
 
     # Unit
-    if metadata.unit:
-        lines.append(f"[cyan]Unit:[/cyan] {metadata.unit}")
+    if unit:
+        lines.append(f"[cyan]Unit:[/cyan] {unit}")
 
     # Source
-    if indicator.source:
-        lines.append(f"[cyan]Source:[/cyan] {indicator.source}")
+    if source:
+        lines.append(f"[cyan]Source:[/cyan] {source}")
 
     return "\n".join(lines)
@@ -0,0 +1,76 @@
+"""Conversion of raw API data points into DataResponse rows.
+
+Shared by DataClient and AsyncDataClient. A response usually holds many
+thousands of points with the same keys, so the key handling (dropping
+internal ``_`` fields, renaming ``valor`` to ``value``) is worked out once per
+key layout as a list of (output key, input key) pairs.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def _key_pairs(keys: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Return the (output key, input key) pairs for a data point with these keys.
+
+    Args:
+        keys: Keys of the raw data point, in order
+
+    Returns:
+        Pairs for the kept keys, with ``valor`` renamed to ``value``
+    """
+    return tuple(
+        ("value" if key == "valor" else key, key) for key in keys if not key.startswith("_")
+    )
+
+
+def process_data_points(data_array: list[Any]) -> list[dict[str, Any]]:
+    """Process all data points of a response in one pass.
+
+    Drops keys starting with ``_``, renames ``valor`` to ``value``, converts
+    the value to float (None if it cannot be converted) and skips points that
+    end up empty or are not dictionaries.
+
+    Args:
+        data_array: Raw data points from the API response
+
+    Returns:
+        List of processed data point dictionaries
+    """
+    processed_data: list[dict[str, Any]] = []
+    append = processed_data.append
+    layout: tuple[str, ...] = ()
+    pairs: tuple[tuple[str, str], ...] = ()
+
+    for data_point in data_array:
+        try:
+            # Compared in order, so each row keeps its own key order
+            keys = tuple(data_point)
+            if keys != layout:
+                if not isinstance(data_point, dict):
+                    raise TypeError(f"expected a dict, got {type(data_point).__name__}")
+                pairs = _key_pairs(keys)
+                layout = keys
+            processed = {out_key: data_point[key] for out_key, key in pairs}
+        except Exception as e:
+            logger.warning(f"Failed to process data point {data_point}: {str(e)}")
+            continue
+
+        value = processed.get("value")
+        if value is not None and type(value) is not float:
+            try:
+                processed["value"] = float(value)
+            except (ValueError, TypeError) as e:
+                logger.warning(
+                    f"Could not convert value '{value}' to float. Setting to None. Error: {e}"
+                )
+                processed["value"] = None
+
+        if processed:
+            append(processed)
+
+    return processed_data
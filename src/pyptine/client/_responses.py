@@ -0,0 +1,365 @@
+"""Parsing of data API response envelopes into DataResponse objects.
+
+Shared by DataClient and AsyncDataClient (through DataParsingMixin), which
+differ only in how they fetch a response, not in how they read it: the header
+and data point lookups (with their fallbacks to older lowercase keys), the
+metadata fallback for a missing unit or title, the TTL cache of that metadata
+and dimension validation all live here.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Optional, Union
+
+from pyptine.client._points import process_data_points
+from pyptine.client.metadata import MetadataClient
+from pyptine.models.indicator import IndicatorMetadata
+from pyptine.models.response import DataResponse
+from pyptine.utils.exceptions import DataProcessingError, DimensionError
+
+logger = logging.getLogger(__name__)
+
+# Indicator metadata by (varcd, language), with the monotonic time it was fetched
+MetadataCache = dict[tuple[str, str], tuple[float, IndicatorMetadata]]
+
+
+def canonical_envelope(
+    response: Union[dict[str, Any], list[dict[str, Any]]],
+) -> Optional[dict[str, Any]]:
+    """Return the response envelope if it has the canonical shape.
+
+    The canonical envelope is a dict with an ``IndicadorCod`` key, possibly
+    wrapped in a one-element list.
+
+    Args:
+        response: Raw JSON response from API (can be dict or list)
+
+    Returns:
+        The envelope dictionary, or None for other response shapes
+    """
+    envelope = response[0] if isinstance(response, list) and len(response) == 1 else response
+    if isinstance(envelope, dict) and "IndicadorCod" in envelope:
+        return envelope
+    return None
+
+
+def header_fields(
+    varcd: str, envelope: dict[str, Any], language: str
+) -> tuple[str, str, str, Optional[str]]:
+    """Extract indicator header fields from a response envelope.
+
+    PascalCase keys are preferred, falling back to the older lowercase names.
+
+    Args:
+        varcd: Requested indicator code (fallback)
+        envelope: Response envelope dictionary
+        language: Client language (fallback)
+
+    Returns:
+        Tuple of (varcd, title, language, unit)
+    """
+    varcd_val = envelope.get("IndicadorCod") or envelope.get("indicador", varcd)
+    title = (
+        envelope.get("IndicadorDsg") or envelope.get("IndicadorNome") or envelope.get("nome", "")
+    )
+    language = envelope.get("Lingua") or envelope.get("lang", language)
+    unit = envelope.get("UnidadeMedida") or envelope.get("unidade")
+    return varcd_val, title, language, unit
+
+
+def envelope_points(envelope: dict[str, Any]) -> list[Any]:
+    """Collect the raw data points of a response envelope.
+
+    ``Dados`` (or the older ``dados``) is either an object with one list of
+    points per period, which is flattened, or already a flat list.
+
+    Args:
+        envelope: Response envelope dictionary
+
+    Returns:
+        Raw data points, in order
+    """
+    dados = envelope.get("Dados") or envelope.get("dados")
+    if isinstance(dados, dict):
+        return [
+            point
+            for period_data in dados.values()
+            if isinstance(period_data, list)
+            for point in period_data
+        ]
+    if isinstance(dados, list):
+        return dados
+    return []
+
+
+def build_data_response(
+    varcd: str,
+    varcd_val: str,
+    title: str,
+    language: str,
+    unit: Optional[str],
+    processed_data: list[dict[str, Any]],
+    get_metadata: Optional[Callable[[str], IndicatorMetadata]] = None,
+) -> DataResponse:
+    """Fill in missing unit/title from metadata and build the DataResponse.
+
+    Args:
+        varcd: Requested indicator code
+        varcd_val: Indicator code reported by the response
+        title: Indicator title
+        language: Response language
+        unit: Unit of measure, if known
+        processed_data: Processed data points
+        get_metadata: Metadata lookup used when the unit is missing (None to skip)
+
+    Returns:
+        DataResponse object
+    """
+    if unit is None and get_metadata is not None:
+        try:
+            metadata = get_metadata(varcd)
+            unit = metadata.unit
+            if not title:
+                title = metadata.title
+        except Exception as e:
+            logger.debug(f"Could not fetch unit from metadata for {varcd}: {e}")
+
+    # Validate the scalar fields from the API, but attach the rows after
+    # construction: they were already processed, and validating list[dict]
+    # again costs time proportional to the row count
+    response = DataResponse(varcd=varcd_val, title=title, language=language, unit=unit)
+    response.data = processed_data
+    return response
+
+
+def get_cached_metadata(
+    cache: MetadataCache,
+    varcd: str,
+    language: str,
+    ttl: float,
+    metadata_client: Optional[MetadataClient],
+) -> IndicatorMetadata:
+    """Get indicator metadata through a TTL cache.
+
+    Entries are keyed by (varcd, language) and expire after ``ttl`` seconds,
+    so paginated fetches and repeated validations don't re-request metadata
+    for every chunk.
+
+    Args:
+        cache: The client's metadata cache
+        varcd: Indicator code
+        language: Client language
+        ttl: Seconds an entry stays valid
+        metadata_client: Client used on a cache miss
+
+    Returns:
+        IndicatorMetadata object
+
+    Raises:
+        DataProcessingError: If the entry is missing and there is no metadata client
+    """
+    key = (varcd, language)
+    now = time.monotonic()
+
+    entry = cache.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+
+    if metadata_client is None:
+        raise DataProcessingError(f"No MetadataClient available to fetch metadata for {varcd}")
+
+    metadata = metadata_client.get_metadata(varcd)
+    cache[key] = (now, metadata)
+    return metadata
+
+
+def has_fresh_metadata(cache: MetadataCache, varcd: str, language: str, ttl: float) -> bool:
+    """Check whether metadata for an indicator is cached and within its TTL.
+
+    Args:
+        cache: The client's metadata cache
+        varcd: Indicator code
+        language: Client language
+        ttl: Seconds an entry stays valid
+
+    Returns:
+        True if get_cached_metadata() would not need to fetch
+    """
+    entry = cache.get((varcd, language))
+    return entry is not None and time.monotonic() - entry[0] < ttl
+
+
+class DataParsingMixin:
+    """Response parsing and metadata lookups shared by the data clients.
+
+    Mixed into DataClient and AsyncDataClient, which provide ``language``,
+    ``metadata_client``, an empty ``_metadata_cache`` and their own
+    _parse_legacy() for the response shapes only one of them handles.
+    """
+
+    METADATA_CACHE_TTL = 600  # seconds
+
+    language: str
+    metadata_client: Optional[MetadataClient]
+    _metadata_cache: MetadataCache
+
+    def _parse_data_response(
+        self, varcd: str, response: Union[dict[str, Any], list[dict[str, Any]]]
+    ) -> DataResponse:
+        """Parse data API response into DataResponse model.
+
+        The canonical envelope (``{"IndicadorCod": ..., "Dados": {...}}``, possibly
+        wrapped in a one-element list) takes a straight-line fast path; other
+        shapes go through _parse_legacy().
+
+        Args:
+            varcd: Indicator code (used if response is a list)
+            response: Raw JSON response from API (can be dict or list)
+
+        Returns:
+            Parsed DataResponse object
+
+        Raises:
+            DataProcessingError: If parsing fails
+        """
+        try:
+            envelope = canonical_envelope(response)
+            if envelope is not None:
+                return self._parse_canonical(varcd, envelope)
+            return self._parse_legacy(varcd, response)
+
+        except Exception as e:
+            logger.error(f"Failed to parse data response: {str(e)}")
+            raise DataProcessingError(f"Failed to parse data: {str(e)}") from e
+
+    def _parse_canonical(self, varcd: str, response: dict[str, Any]) -> DataResponse:
+        """Parse a response envelope (a dict with an ``IndicadorCod`` key).
+
+        Header and data keys fall back to their older lowercase names
+        (``IndicadorNome``/``nome``, ``lang``, ``unidade``, ``dados``) exactly
+        as in _parse_legacy(); only the list and shape handling is skipped.
+
+        Args:
+            varcd: Requested indicator code
+            response: Envelope with ``IndicadorCod`` and ``Dados`` keys
+
+        Returns:
+            Parsed DataResponse object
+        """
+        return self._build_data_response(
+            varcd,
+            *header_fields(varcd, response, self.language),
+            process_data_points(envelope_points(response)),
+        )
+
+    def _parse_legacy(
+        self, varcd: str, response: Union[dict[str, Any], list[dict[str, Any]]]
+    ) -> DataResponse:
+        """Parse older or alternative response shapes (implemented by each client)."""
+        raise NotImplementedError
+
+    def _build_data_response(
+        self,
+        varcd: str,
+        varcd_val: str,
+        title: str,
+        language: str,
+        unit: Optional[str],
+        processed_data: list[dict[str, Any]],
+    ) -> DataResponse:
+        """Build the DataResponse, filling a missing unit/title from cached metadata.
+
+        Args:
+            varcd: Requested indicator code
+            varcd_val: Indicator code reported by the response
+            title: Indicator title
+            language: Response language
+            unit: Unit of measure, if known
+            processed_data: Processed data points
+
+        Returns:
+            DataResponse object
+        """
+        return build_data_response(
+            varcd,
+            varcd_val,
+            title,
+            language,
+            unit,
+            processed_data,
+            self._get_cached_metadata if self.metadata_client else None,
+        )
+
+    def _get_cached_metadata(self, varcd: str) -> IndicatorMetadata:
+        """Get indicator metadata through the client's TTL cache (see get_cached_metadata).
+
+        Args:
+            varcd: Indicator code
+
+        Returns:
+            IndicatorMetadata object
+        """
+        return get_cached_metadata(
+            self._metadata_cache,
+            varcd,
+            self.language,
+            self.METADATA_CACHE_TTL,
+            self.metadata_client,
+        )
+
+    def _has_fresh_metadata(self, varcd: str) -> bool:
+        """Check whether metadata for an indicator is cached and within its TTL.
+
+        Args:
+            varcd: Indicator code
+
+        Returns:
+            True if _get_cached_metadata() would not need to fetch
+        """
+        return has_fresh_metadata(
+            self._metadata_cache, varcd, self.language, self.METADATA_CACHE_TTL
+        )
+
+    def clear_metadata_cache(self) -> None:
+        """Clear cached metadata used for parsing and dimension validation."""
+        self._metadata_cache.clear()
+
+    def validate_dimensions(self, varcd: str, dimensions: dict[str, str]) -> bool:
+        """Validate dimension filters against indicator metadata.
+
+        This method checks if the provided dimension codes and values are valid
+        for the indicator.
+
+        Args:
+            varcd: Indicator code
+            dimensions: Dimension filters to validate (e.g., {"Dim1": "2023"})
+
+        Returns:
+            True if dimensions are valid
+
+        Raises:
+            DimensionError: If metadata client is not available, or if any
+                            dimension key or value is invalid.
+        """
+        if not self.metadata_client:
+            raise DimensionError("MetadataClient not available for dimension validation.")
+
+        available_dimensions = self._get_cached_metadata(varcd).dimension_index
+
+        for dim_key, dim_value in dimensions.items():
+            dimension = available_dimensions.get(dim_key)
+            if dimension is None:
+                raise DimensionError(
+                    f"Invalid dimension key '{dim_key}' for indicator {varcd}. "
+                    f"Available keys: {list(available_dimensions.keys())}"
+                )
+
+            valid_values = dimension.value_codes
+
+            if dim_value not in valid_values:
+                raise DimensionError(
+                    f"Invalid value '{dim_value}' for dimension '{dim_key}' "
+                    f"of indicator {varcd}. Available values: {list(valid_values)}"
+                )
+
+        return True
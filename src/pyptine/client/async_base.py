@@ -1,16 +1,105 @@
 """Async HTTP client for INE Portugal API."""
 
+import asyncio
+import hashlib
 import logging
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any, Optional, Union
 
 import httpx
 
 from pyptine.__version__ import __version__
+from pyptine.cache.conditional import ConditionalCache
 from pyptine.utils.exceptions import APIError, RateLimitError
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - only needed by httpx for HTTP/2
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Pool key: (event loop, timeout, User-Agent)
+_PoolKey = tuple[asyncio.AbstractEventLoop, float, str]
+
+# Open httpx clients shared by the AsyncINEClient instances of an event loop,
+# keyed by _PoolKey, with the number of instances using each one
+_CLIENT_POOL: dict[_PoolKey, tuple[httpx.AsyncClient, int]] = {}
+
+
+def _acquire_client(timeout: float, user_agent: str = "") -> tuple[_PoolKey, httpx.AsyncClient]:
+    """Get the shared HTTP client for the running event loop, creating it if needed.
+
+    Clients that are open at the same time in one event loop reuse the same
+    connection pool, so concurrent ``async with`` blocks do not each pay for
+    new TCP connections and TLS handshakes.
+
+    Clients are only shared between instances with the same timeout and
+    User-Agent, so a subclass that overrides ``USER_AGENT`` gets its own.
+
+    Args:
+        timeout: Request timeout in seconds
+        user_agent: User-Agent header (default: AsyncINEClient.USER_AGENT)
+
+    Returns:
+        Tuple of (pool key, HTTP client); pass the key to _release_client()
+    """
+    user_agent = user_agent or AsyncINEClient.USER_AGENT
+    key = (asyncio.get_running_loop(), timeout, user_agent)
+    entry = _CLIENT_POOL.get(key)
+    if entry is None or entry[0].is_closed:
+        client = httpx.AsyncClient(
+            headers={
+                "User-Agent": user_agent,
+                "Accept": "application/json, text/xml",
+                "Accept-Encoding": "gzip, deflate",
+            },
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=64),
+            # With h2 installed, concurrent requests are multiplexed over one
+            # connection; HTTP/1.1 stays enabled for servers without HTTP/2
+            http2=HTTP2_AVAILABLE,
+        )
+        _CLIENT_POOL[key] = (client, 1)
+        return key, client
+
+    client, users = entry
+    _CLIENT_POOL[key] = (client, users + 1)
+    return key, client
+
+
+async def _release_client(key: _PoolKey) -> None:
+    """Release a shared HTTP client, closing it once its last user is done.
+
+    Args:
+        key: Pool key returned by _acquire_client()
+    """
+    entry = _CLIENT_POOL.get(key)
+    if entry is None:
+        return
+
+    client, users = entry
+    if users > 1:
+        _CLIENT_POOL[key] = (client, users - 1)
+        return
+
+    # Remove the entry before awaiting, so a concurrent acquire opens a new client
+    del _CLIENT_POOL[key]
+    await client.aclose()
+    logger.debug("Closed async HTTP client")
+
 
 class AsyncINEClient:
     """Async HTTP client for INE Portugal API.
@@ -22,10 +111,25 @@ class AsyncINEClient:
     - User-agent identification
     - Error handling and response validation
 
+    When ``cache_enabled`` is set, response bodies are kept in an on-disk
+    ConditionalCache: they are reused as-is for ``cache_ttl`` seconds, and after
+    that revalidated with ``If-None-Match``/``If-Modified-Since`` so that an
+    unchanged resource costs a ``304 Not Modified`` instead of a full download.
+
+    Instances that are open at the same time in one event loop, with the same
+    timeout, share a single ``httpx.AsyncClient`` and its connection pool; the
+    client is closed when the last of them exits. When the ``h2`` package is
+    installed, that client also negotiates HTTP/2.
+
     Args:
         language: Language for API responses ("EN" or "PT")
         timeout: Request timeout in seconds
         max_retries: Maximum number of retry attempts
+        cache_enabled: Enable the conditional request cache (streamed requests,
+            i.e. ``stream_json`` data fetches, bypass it)
+        cache_dir: Directory for cache storage
+        cache_ttl: Seconds a cached response is reused without revalidation
+        max_concurrent: Maximum number of requests sent to the API at once
 
     Example:
         >>> async with AsyncINEClient(language="EN") as client:
@@ -35,6 +139,7 @@ class AsyncINEClient:
     BASE_URL = "https://www.ine.pt"
     DEFAULT_TIMEOUT = 30
     MAX_RETRIES = 3
+    MAX_CONCURRENT = 8
     USER_AGENT = f"pyptine/{__version__} (Python INE API Client - Async)"
 
     def __init__(
@@ -42,17 +147,35 @@ class AsyncINEClient:
         language: str = "EN",
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = MAX_RETRIES,
+        cache_enabled: bool = False,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: int = ConditionalCache.DEFAULT_TTL,
+        max_concurrent: int = MAX_CONCURRENT,
     ) -> None:
         """Initialize async INE client."""
         self.language = language.upper()
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_concurrent = max(1, max_concurrent)
         self.client: Optional[httpx.AsyncClient] = None
+        self._pool_key: Optional[_PoolKey] = None
+        self._pooled_client: Optional[httpx.AsyncClient] = None
+        # Nesting depth of ``async with`` blocks on this instance
+        self._entries = 0
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
 
         # Validate language
         if self.language not in ("EN", "PT"):
             raise ValueError(f"Language must be 'EN' or 'PT', got: {language}")
 
+        self.cache_enabled = cache_enabled
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.cache: Optional[ConditionalCache] = None
+        if cache_enabled:
+            self.cache = ConditionalCache(cache_dir=cache_dir, default_ttl=cache_ttl)
+
         logger.info(
             f"Initialized async INE client (language={self.language}, "
             f"timeout={self.timeout}s, max_retries={self.max_retries})"
@@ -60,21 +183,33 @@ class AsyncINEClient:
 
     async def __aenter__(self) -> "AsyncINEClient":
         """Async context manager entry."""
-        self.client = httpx.AsyncClient(
-            headers={
-                "User-Agent": self.USER_AGENT,
-                "Accept": "application/json, text/xml",
-                "Accept-Encoding": "gzip, deflate",
-            },
-            timeout=self.timeout,
-        )
+        self._entries += 1
+        if self._entries > 1:
+            # Already open: the outer block owns the pooled client and cache
+            return self
+        self._pool_key, self._pooled_client = _acquire_client(self.timeout, self.USER_AGENT)
+        self.client = self._pooled_client
+        if self.cache_enabled and self.cache is None:
+            # Closed by a previous __aexit__; reopen so caching stays on
+            self.cache = ConditionalCache(cache_dir=self.cache_dir, default_ttl=self.cache_ttl)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
-        if self.client:
+        self._entries -= 1
+        if self._entries > 0:
+            return
+        if self.client is not None and self.client is not self._pooled_client:
+            # A client set on the instance is owned by it, not by the pool
             await self.client.aclose()
             logger.debug("Closed async HTTP client")
+        if self._pool_key is not None:
+            await _release_client(self._pool_key)
+            self._pool_key = None
+            self._pooled_client = None
+        if self.cache:
+            self.cache.close()
+            self.cache = None
 
     async def _make_request(
         self,
@@ -95,10 +230,15 @@ class AsyncINEClient:
         Raises:
             APIError: If request fails
             RateLimitError: If rate limited
+            ValueError: If response_format is not supported
         """
         if not self.client:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
 
+        # Reject the format before spending a request on it
+        if response_format not in ("json", "xml"):
+            raise ValueError(f"Unsupported response format: {response_format}")
+
         url = self.BASE_URL + endpoint
 
         # Add language to params
@@ -107,29 +247,176 @@ class AsyncINEClient:
 
         logger.debug(f"Making async request to {endpoint} with params: {params}")
 
-        try:
-            start_time = time.time()
-            response = await self.client.get(url, params=params)
-            elapsed = time.time() - start_time
-
-            logger.debug(
-                f"Async request completed in {elapsed:.2f}s (status={response.status_code})"
-            )
-
-            # Handle rate limiting
-            if response.status_code == 429:
-                raise RateLimitError("Too many requests to INE API")
+        cache_key = self._cache_key(endpoint, params) if self.cache else None
+        # The lookup copies the cached body out of SQLite, which can be several
+        # MB for data responses, so it runs in a worker thread like the writes
+        cached = (
+            await asyncio.to_thread(self.cache.get, cache_key) if self.cache and cache_key else None
+        )
 
-            # Raise for HTTP errors
-            response.raise_for_status()
+        try:
+            if cached and cached["fresh_until"] > time.time():
+                logger.debug(f"Using cached response for {endpoint}")
+                response = httpx.Response(200, content=cached["body"])
+            else:
+                async with self._request_slot():
+                    response = await self._get_with_validators(url, params, cache_key, cached)
 
             # Parse response based on format
             if response_format == "json":
                 return self._parse_json_response(response)
-            elif response_format == "xml":
-                return self._parse_xml_response(response)
+            return self._parse_xml_response(response)
+
+        except httpx.TimeoutException:
+            logger.error(f"Async request timeout after {self.timeout}s")
+            raise APIError(0, f"Request timeout after {self.timeout}s") from None
+
+        except httpx.HTTPError as e:
+            status_code = getattr(e.response, "status_code", 0) if hasattr(e, "response") else 0
+            logger.error(f"HTTP error: {status_code} - {str(e)}")
+
+            if status_code == 404:
+                raise APIError(404, "Resource not found") from None
             else:
-                raise ValueError(f"Unsupported response format: {response_format}")
+                raise APIError(status_code, str(e)) from e
+
+    async def _get_with_validators(
+        self,
+        url: str,
+        params: dict[str, Any],
+        cache_key: Optional[str],
+        cached: Optional[dict[str, Any]],
+    ) -> httpx.Response:
+        """Send a GET request, revalidating a cached body when there is one.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            cache_key: Conditional cache key (None when caching is disabled)
+            cached: Stale cache entry to revalidate, if any
+
+        Returns:
+            Successful response (the cached body on 304 Not Modified)
+
+        Raises:
+            RateLimitError: If rate limited
+            httpx.HTTPStatusError: For HTTP error statuses
+        """
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        assert self.client is not None
+        start_time = time.time()
+        if headers:
+            response = await self.client.get(url, params=params, headers=headers)
+        else:
+            response = await self.client.get(url, params=params)
+        elapsed = time.time() - start_time
+
+        logger.debug(f"Async request completed in {elapsed:.2f}s (status={response.status_code})")
+
+        # Handle rate limiting
+        if response.status_code == 429:
+            raise RateLimitError("Too many requests to INE API")
+
+        if response.status_code == 304 and cached and self.cache and cache_key:
+            logger.debug("Resource not modified; reusing cached response")
+            await asyncio.to_thread(self.cache.set, cache_key, cached)
+            return httpx.Response(200, content=cached["body"])
+
+        # Raise for HTTP errors
+        response.raise_for_status()
+
+        if self.cache and cache_key:
+            # The sqlite write and commit run in a worker thread so that they
+            # do not block the event loop
+            await asyncio.to_thread(
+                self.cache.set,
+                cache_key,
+                {
+                    "body": response.content,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                },
+            )
+
+        return response
+
+    def _request_slot(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent requests to the API.
+
+        Returns:
+            Semaphore allowing max_concurrent requests at once
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    def _cache_key(self, endpoint: str, params: dict[str, Any]) -> str:
+        """Build a conditional cache key from the endpoint and query parameters.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters (including language)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+        return hashlib.blake2b(f"{endpoint}?{query}".encode(), digest_size=16).hexdigest()
+
+    @asynccontextmanager
+    async def _stream_request(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator["AsyncResponseReader"]:
+        """Make async HTTP request to INE API without buffering the body.
+
+        The conditional request cache is not used: storing the body would mean
+        buffering it, which is what streaming avoids.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Yields:
+            Reader over the (decoded) response body bytes
+
+        Raises:
+            APIError: If request fails
+            RateLimitError: If rate limited
+
+        Example:
+            >>> async with client._stream_request("/endpoint", {"p": "v"}) as body:
+            ...     first_kb = await body.read(1024)
+        """
+        if not self.client:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+
+        url = self.BASE_URL + endpoint
+
+        # Add language to params
+        params = {} if params is None else params.copy()
+        params["lang"] = self.language
+
+        logger.debug(f"Making streaming async request to {endpoint} with params: {params}")
+
+        try:
+            stream = self.client.stream("GET", url, params=params)
+            async with self._request_slot(), stream as response:
+                # Handle rate limiting
+                if response.status_code == 429:
+                    raise RateLimitError("Too many requests to INE API")
+
+                # Raise for HTTP errors
+                response.raise_for_status()
+
+                yield AsyncResponseReader(response.aiter_bytes())
 
         except httpx.TimeoutException:
             logger.error(f"Async request timeout after {self.timeout}s")
@@ -145,7 +432,7 @@ class AsyncINEClient:
                 raise APIError(status_code, str(e)) from e
 
     def _parse_json_response(self, response: httpx.Response) -> dict[str, Any]:
-        """Parse JSON response.
+        """Parse JSON response (with orjson when installed).
 
         Args:
             response: HTTP response
@@ -157,8 +444,17 @@ class AsyncINEClient:
             APIError: If JSON parsing fails
         """
         try:
-            data: dict[str, Any] = response.json()
-            logger.debug(f"Parsed JSON response with {len(str(data))} characters")
+            content = response.content
+            data: dict[str, Any]
+            if ORJSON_AVAILABLE:
+                try:
+                    data = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    # e.g. non-UTF-8 body: let the HTTP client detect the encoding
+                    data = response.json()
+            else:
+                data = response.json()
+            logger.debug(f"Parsed JSON response of {len(content)} bytes")
             return data
         except ValueError as e:
             logger.error(f"Failed to parse JSON response: {str(e)}")
@@ -183,3 +479,82 @@ class AsyncINEClient:
         except Exception as e:
             logger.error(f"Failed to parse XML response: {str(e)}")
             raise APIError(0, f"Invalid XML response: {str(e)}") from e
+
+
+class AsyncResponseReader:
+    """Async file-like adapter over a streamed response body.
+
+    Exposes ``await read(n)`` and ``await readinto(buffer)`` on top of an async
+    byte iterator, which is the interface incremental parsers such as ijson
+    expect. The current chunk is consumed by offset, so each call copies only
+    the bytes it returns, and ``readinto`` lets callers reuse their own buffer.
+
+    Args:
+        chunks: Async iterator of body chunks
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._chunk = b""
+        self._pos = 0
+
+    async def _fill(self) -> bool:
+        """Make sure unread bytes are available; return False at end of body."""
+        while self._pos >= len(self._chunk):
+            try:
+                self._chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self._chunk, self._pos = b"", 0
+                return False
+            self._pos = 0
+        return True
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes (all remaining bytes if size < 0).
+
+        Like a raw file read, this may return fewer than size bytes; it only
+        returns b"" once the body is exhausted.
+
+        Args:
+            size: Maximum number of bytes to return
+
+        Returns:
+            Bytes read
+        """
+        if size < 0:
+            parts = [self._chunk[self._pos :]]
+            async for chunk in self._chunks:
+                parts.append(chunk)
+            self._chunk, self._pos = b"", 0
+            return b"".join(parts)
+
+        if not await self._fill():
+            return b""
+
+        if self._pos == 0 and size >= len(self._chunk):
+            # Hand over the whole chunk without copying it
+            data, self._chunk = self._chunk, b""
+            return data
+
+        end = self._pos + size
+        data = self._chunk[self._pos : end]
+        self._pos = end
+        return data
+
+    async def readinto(self, buffer: Union[bytearray, memoryview]) -> int:
+        """Read up to len(buffer) bytes directly into buffer.
+
+        Args:
+            buffer: Writable buffer to fill
+
+        Returns:
+            Number of bytes written (0 once the body is exhausted)
+        """
+        if not await self._fill():
+            return 0
+
+        view = memoryview(buffer).cast("B")
+        size = min(len(view), len(self._chunk) - self._pos)
+        view[:size] = memoryview(self._chunk)[self._pos : self._pos + size]
+        self._pos += size
+        return size
@@ -1,23 +1,59 @@
 """Async data client for INE Portugal API."""
 
+import asyncio
 import logging
+from collections import deque
 from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Any, Optional, Union, cast
 
-from pyptine.client.async_base import AsyncINEClient
+from pyptine.client._points import process_data_points
+from pyptine.client._responses import (
+    DataParsingMixin,
+    MetadataCache,
+    envelope_points,
+    header_fields,
+)
+from pyptine.client.async_base import AsyncINEClient, AsyncResponseReader
 from pyptine.client.metadata import MetadataClient
+from pyptine.models.indicator import IndicatorMetadata
 from pyptine.models.response import DataResponse
-from pyptine.utils.exceptions import DataProcessingError, DimensionError
+from pyptine.utils.exceptions import (
+    APIError,
+    DataProcessingError,
+    RateLimitError,
+)
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import pandas as pd
+
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+_DADOS_KEYS = ("Dados", "dados")
+_SCALAR_EVENTS = frozenset(("string", "number", "boolean", "null"))
 
-class AsyncDataClient(AsyncINEClient):
+
+class AsyncDataClient(DataParsingMixin, AsyncINEClient):
     """Async client for INE data API endpoint.
 
     Provides async methods for fetching and parsing indicator data with support
     for dimension filtering and pagination for large datasets.
 
+    With ``prefetch_metadata`` enabled, indicator metadata (used to fill in a
+    missing unit or title) is fetched in a worker thread while the data request
+    is in flight, so a cold request costs one round trip instead of two.
+
     Example:
         >>> async with AsyncDataClient(language="EN") as client:
         ...     response = await client.get_data("0004167")
@@ -26,15 +62,40 @@ class AsyncDataClient(AsyncINEClient):
 
     DATA_ENDPOINT = "/ine/json_indicador/pindica.jsp"
     DEFAULT_PAGE_SIZE = 40000
+    DEFAULT_MAX_INFLIGHT = 4
+    CURSOR_FIELD = "next_cursor"
+    TOTAL_FIELD = "TotalRegistos"
+    PARSE_OFFLOAD_THRESHOLD = 50000  # data points
 
     def __init__(
         self,
         language: str = "EN",
         timeout: int = 30,
         metadata_client: Optional[MetadataClient] = None,
+        max_inflight: int = DEFAULT_MAX_INFLIGHT,
+        stream_json: bool = False,
+        cache_enabled: bool = False,
+        cache_dir: Optional[Path] = None,
+        max_concurrent: int = AsyncINEClient.MAX_CONCURRENT,
+        prefetch_metadata: bool = False,
     ):
-        super().__init__(language, timeout)
+        super().__init__(
+            language,
+            timeout,
+            cache_enabled=cache_enabled,
+            cache_dir=cache_dir,
+            max_concurrent=max_concurrent,
+        )
         self.metadata_client = metadata_client
+        self.prefetch_metadata = prefetch_metadata
+        self.max_inflight = max(1, max_inflight)
+        self._metadata_cache: MetadataCache = {}
+
+        if stream_json and not IJSON_AVAILABLE:
+            raise ImportError(
+                "ijson is required for streaming JSON parsing. Install with: pip install ijson"
+            )
+        self.stream_json = stream_json
 
     async def get_data(
         self,
@@ -61,17 +122,11 @@ class AsyncDataClient(AsyncINEClient):
         """
         logger.info(f"Fetching data asynchronously for indicator {varcd}")
 
+        await self._load_dimension_metadata(varcd, dimensions)
         params = self._build_params(varcd, dimensions)
 
         try:
-            raw_response = await self._make_request(
-                self.DATA_ENDPOINT, params=params, response_format="json"
-            )
-
-            # Parse response
-            data_response = self._parse_data_response(
-                varcd, cast(Union[dict[str, Any], list[dict[str, Any]]], raw_response)
-            )
+            data_response, _, _ = await self._request_data(varcd, params)
 
             logger.info(f"Retrieved {len(data_response.data)} data points for {varcd}")
 
@@ -92,6 +147,17 @@ class AsyncDataClient(AsyncINEClient):
         Implements asynchronous chunked data fetching to handle large datasets
         efficiently without blocking.
 
+        Pagination is negotiated on the first response: if the server returns a
+        ``next_cursor`` field, subsequent chunks are requested with that cursor
+        (keyset pagination, constant cost per page). Otherwise, or if the server
+        rejects a cursor with a 4xx error other than 429, it falls back to
+        ``start``/``count`` offsets with up to ``max_inflight`` chunk requests
+        in flight at once; any other error on a cursor request is raised. When the first
+        response reports the total number of records (``TotalRegistos``), only
+        the offsets below that total are requested; without it, the end is
+        detected by a short chunk and requests speculatively issued past the end
+        of the data are cancelled. Chunks are always yielded in offset order.
+
         Args:
             varcd: Indicator code
             dimensions: Optional dimension filters
@@ -109,24 +175,94 @@ class AsyncDataClient(AsyncINEClient):
         logger.info(f"Fetching all data asynchronously for {varcd} with chunk_size={chunk_size}")
 
         offset = 0
+        cursor: Optional[str] = None
+        total: Optional[int] = None
         total_fetched = 0
         chunk_count = 0
 
+        # Validate dimensions and build the shared parameters once; only the
+        # offset or cursor changes from one chunk to the next
+        await self._load_dimension_metadata(varcd, dimensions)
+        base_params = self._build_params(varcd, dimensions, limit=chunk_size)
+
+        # Serial phase: the first chunk, plus any chunks the server pages by cursor
         while True:
             chunk_count += 1
-            logger.debug(f"Fetching chunk {chunk_count} with offset={offset}")
-
-            params = self._build_params(varcd, dimensions, offset=offset, limit=chunk_size)
+            logger.debug(f"Fetching chunk {chunk_count} with offset={offset} cursor={cursor}")
 
             try:
-                raw_response = await self._make_request(
-                    self.DATA_ENDPOINT, params=params, response_format="json"
+                data_response, next_cursor, chunk_total = await self._fetch_chunk(
+                    varcd, base_params, offset=offset, cursor=cursor
                 )
-
-                # Parse response
-                data_response = self._parse_data_response(
-                    varcd, cast(Union[dict[str, Any], list[dict[str, Any]]], raw_response)
+            except Exception as e:
+                if not self._is_cursor_rejection(e, cursor):
+                    logger.error(f"Failed to fetch chunk {chunk_count} for {varcd}: {str(e)}")
+                    raise
+
+                # Server rejected the cursor: resume with offset pagination
+                # after the rows already received
+                logger.warning(
+                    f"Cursor pagination failed for {varcd} ({str(e)}); "
+                    f"falling back to offset={total_fetched}"
                 )
+                chunk_count -= 1
+                offset = total_fetched
+                break
+
+            if total is None:
+                total = chunk_total
+
+            chunk_size_received = len(data_response.data)
+            total_fetched += chunk_size_received
+
+            logger.info(
+                f"Chunk {chunk_count}: Retrieved {chunk_size_received} data points "
+                f"(total so far: {total_fetched})"
+            )
+
+            yield data_response
+
+            # Stop when the server has no further cursor, when we received fewer
+            # data points than requested, or when the reported total is reached
+            if (
+                (cursor is not None and not next_cursor)
+                or chunk_size_received < chunk_size
+                or (not next_cursor and total is not None and total_fetched >= total)
+            ):
+                logger.info(f"Completed fetch for {varcd}: total {total_fetched} data points")
+                return
+
+            if not next_cursor:
+                offset += chunk_size
+                break
+
+            cursor = str(next_cursor)
+
+        # Offset phase: keep a window of requests in flight, consumed in order
+        pending: deque[asyncio.Task[tuple[DataResponse, Optional[str], Optional[int]]]] = deque()
+        next_offset = offset
+
+        try:
+            while True:
+                while len(pending) < self.max_inflight and (total is None or next_offset < total):
+                    pending.append(
+                        asyncio.create_task(
+                            self._fetch_chunk(varcd, base_params, offset=next_offset)
+                        )
+                    )
+                    next_offset += chunk_size
+
+                if not pending:
+                    logger.info(f"Completed fetch for {varcd}: total {total_fetched} data points")
+                    return
+
+                chunk_count += 1
+
+                try:
+                    data_response, _, _ = await pending.popleft()
+                except Exception as e:
+                    logger.error(f"Failed to fetch chunk {chunk_count} for {varcd}: {str(e)}")
+                    raise
 
                 chunk_size_received = len(data_response.data)
                 total_fetched += chunk_size_received
@@ -141,13 +277,168 @@ class AsyncDataClient(AsyncINEClient):
                 # If we received fewer data points than requested, we've reached the end
                 if chunk_size_received < chunk_size:
                     logger.info(f"Completed fetch for {varcd}: total {total_fetched} data points")
-                    break
+                    return
+        finally:
+            # Drop speculative requests past the end of the data
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def get_all_dataframe(
+        self,
+        varcd: str,
+        dimensions: Optional[dict[str, str]] = None,
+        chunk_size: int = DEFAULT_PAGE_SIZE,
+    ) -> "pd.DataFrame":
+        """Fetch all data for an indicator into a single DataFrame.
 
-                offset += chunk_size
+        Each chunk from get_all_data() is converted as soon as it arrives and its
+        list of row dicts is released, so the raw rows and the DataFrame are
+        never both held in memory in full.
 
-            except Exception as e:
-                logger.error(f"Failed to fetch chunk {chunk_count} for {varcd}: {str(e)}")
-                raise
+        Args:
+            varcd: Indicator code
+            dimensions: Optional dimension filters
+            chunk_size: Number of data points per chunk (default: 40,000)
+
+        Returns:
+            pandas DataFrame with all data points; unlike to_dataframe(), the
+            repetitive label columns stay categorical to keep the frame small
+
+        Raises:
+            ImportError: If pandas is not installed
+
+        Example:
+            >>> async with AsyncDataClient() as client:
+            ...     df = await client.get_all_dataframe("0004167")
+            ...     print(len(df))
+        """
+        if not PANDAS_AVAILABLE:
+            raise ImportError(
+                "pandas is required to convert data to DataFrame. "
+                "Install it with: pip install pandas"
+            )
+
+        frames: list[pd.DataFrame] = []
+        async for chunk in self.get_all_data(varcd, dimensions, chunk_size):
+            frames.append(chunk._get_df())
+            # Drop the row dicts (and the chunk's reference to the frame)
+            chunk.data.clear()
+            chunk.clear_dataframe_cache()
+
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+
+        categorical = [
+            name
+            for name, dtype in frames[0].dtypes.items()
+            if isinstance(dtype, pd.CategoricalDtype)
+        ]
+        df = pd.concat(frames, ignore_index=True)
+        frames.clear()
+
+        # Chunks carry their own categories, which concat widens to strings
+        for name in categorical:
+            if name in df.columns and not isinstance(df[name].dtype, pd.CategoricalDtype):
+                df[name] = df[name].astype("category")
+
+        return df
+
+    @staticmethod
+    def _is_cursor_rejection(error: Exception, cursor: Optional[str]) -> bool:
+        """Check whether a failed chunk request means the server rejected the cursor.
+
+        Only a client error (4xx) on a cursor request qualifies; rate limiting,
+        timeouts, server errors and parse errors are not about the cursor and
+        are re-raised by the caller.
+
+        Args:
+            error: Exception raised by the chunk request
+            cursor: Cursor sent with the request (None for offset requests)
+
+        Returns:
+            True if get_all_data() should fall back to offset pagination
+        """
+        return (
+            cursor is not None
+            and isinstance(error, APIError)
+            and not isinstance(error, RateLimitError)
+            and 400 <= error.status_code < 500
+        )
+
+    async def _fetch_chunk(
+        self,
+        varcd: str,
+        base_params: dict[str, str],
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[DataResponse, Optional[str], Optional[int]]:
+        """Fetch and parse a single chunk of indicator data.
+
+        Args:
+            varcd: Indicator code
+            base_params: Validated query parameters from _build_params(), including
+                the chunk size
+            offset: Starting offset (ignored when cursor is given)
+            cursor: Keyset cursor from the previous chunk
+
+        Returns:
+            Tuple of (parsed chunk, next cursor or None, total records or None)
+        """
+        # base_params is shared by every chunk, so each one gets a fresh dict
+        # built in a single step with its own page marker
+        if cursor is not None:
+            params = {**base_params, "cursor": cursor}
+        elif offset is not None:
+            params = {**base_params, "start": str(offset)}
+        else:
+            params = base_params
+        return await self._request_data(varcd, params)
+
+    async def _request_data(
+        self, varcd: str, params: dict[str, str]
+    ) -> tuple[DataResponse, Optional[str], Optional[int]]:
+        """Request the data endpoint and parse the response.
+
+        Uses the incremental ijson parser when ``stream_json`` is enabled, so the
+        response body is never held in memory as a whole.
+
+        Args:
+            varcd: Indicator code
+            params: Query parameters from _build_params()
+
+        Returns:
+            Tuple of (parsed response, next cursor or None, total records or None)
+        """
+        if self.stream_json:
+            async with self._stream_request(self.DATA_ENDPOINT, params=params) as body:
+                return await self._parse_data_response_stream(varcd, body)
+
+        metadata_task = self._start_metadata_prefetch(varcd)
+        try:
+            raw_response = await self._make_request(
+                self.DATA_ENDPOINT, params=params, response_format="json"
+            )
+        finally:
+            if metadata_task is not None:
+                # Failures surface (and are logged) when parsing falls back to metadata
+                await asyncio.gather(metadata_task, return_exceptions=True)
+
+        response = cast(Union[dict[str, Any], list[dict[str, Any]]], raw_response)
+        if self._count_points(response) > self.PARSE_OFFLOAD_THRESHOLD:
+            # Large responses are parsed in a worker thread so the event loop keeps
+            # serving in-flight requests (e.g. prefetched chunks) meanwhile
+            data_response = await asyncio.to_thread(self._parse_data_response, varcd, response)
+        else:
+            data_response = self._parse_data_response(varcd, response)
+
+        envelope = response[0] if isinstance(response, list) and len(response) == 1 else response
+        next_cursor, total = self._paging_fields(envelope if isinstance(envelope, dict) else {})
+
+        return data_response, next_cursor, total
 
     def _build_params(
         self,
@@ -155,6 +446,7 @@ class AsyncDataClient(AsyncINEClient):
         dimensions: Optional[dict[str, str]] = None,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> dict[str, str]:
         """Build query parameters for data API request.
 
@@ -163,6 +455,7 @@ class AsyncDataClient(AsyncINEClient):
             dimensions: Optional dimension filters
             offset: Starting offset for pagination
             limit: Maximum number of records to return
+            cursor: Keyset cursor from a previous response; takes precedence over offset
 
         Returns:
             Dictionary of query parameters
@@ -176,7 +469,9 @@ class AsyncDataClient(AsyncINEClient):
         }
 
         # Add pagination parameters if provided
-        if offset is not None:
+        if cursor is not None:
+            params["cursor"] = cursor
+        elif offset is not None:
             params["start"] = str(offset)
         if limit is not None:
             params["count"] = str(limit)
@@ -189,10 +484,10 @@ class AsyncDataClient(AsyncINEClient):
 
         return params
 
-    def _parse_data_response(
+    def _parse_legacy(
         self, varcd: str, response: Union[dict[str, Any], list[dict[str, Any]]]
     ) -> DataResponse:
-        """Parse data API response into DataResponse model.
+        """Parse older or alternative response shapes.
 
         Args:
             varcd: Indicator code
@@ -200,149 +495,217 @@ class AsyncDataClient(AsyncINEClient):
 
         Returns:
             Parsed DataResponse object
+        """
+        varcd_val = varcd
+        title = ""
+        language = self.language
+        unit = None
+        data_array = []
+
+        if isinstance(response, list):
+            if len(response) == 1 and isinstance(response[0], dict):
+                response = response[0]
+            elif len(response) > 1:
+                data_array = response
+                title, unit = self._point_list_title_unit(varcd, data_array)
+
+        if isinstance(response, dict):
+            varcd_val, title, language, unit = header_fields(varcd, response, self.language)
+            data_array = envelope_points(response)
+
+        # Process data points
+        processed_data = process_data_points(data_array)
+
+        return self._build_data_response(varcd, varcd_val, title, language, unit, processed_data)
+
+    async def _parse_data_response_stream(
+        self, varcd: str, body: AsyncResponseReader
+    ) -> tuple[DataResponse, Optional[str], Optional[int]]:
+        """Incrementally parse a streamed data API response.
+
+        Data points under ``Dados``/``dados`` are built one at a time from ijson
+        events and processed as they arrive; header fields are captured from the
+        scalar events around them. Accepts the same response shapes as
+        _parse_data_response().
+
+        Args:
+            varcd: Indicator code
+            body: Streamed response body
+
+        Returns:
+            Tuple of (parsed response, next cursor or None, total records or None)
 
         Raises:
             DataProcessingError: If parsing fails
         """
         try:
-            varcd_val = varcd
-            title = ""
-            language = self.language
-            unit = None
-            data_array = []
-
-            if isinstance(response, list):
-                if len(response) == 1 and isinstance(response[0], dict):
-                    response = response[0]
-                elif len(response) > 1:
-                    data_array = response
-                    if self.metadata_client:
-                        try:
-                            metadata = self.metadata_client.get_metadata(varcd)
-                            title = metadata.title
-                            unit = metadata.unit
-                        except Exception as e:
-                            logger.warning(f"Could not fetch metadata for {varcd}: {e}")
-
-                    if not title and data_array:
-                        first_point = data_array[0]
-                        unit = first_point.get("unidade") or first_point.get("unit")
-
-            if isinstance(response, dict):
-                varcd_val = response.get("IndicadorCod") or response.get("indicador", varcd)
-                title = (
-                    response.get("IndicadorDsg")
-                    or response.get("IndicadorNome")
-                    or response.get("nome", "")
-                )
-                language = response.get("Lingua") or response.get("lang", self.language)
-                unit = response.get("UnidadeMedida") or response.get("unidade")
-
-                dados = response.get("Dados") or response.get("dados")
-                if isinstance(dados, dict):
-                    data_array = []
-                    for year_data in dados.values():
-                        if isinstance(year_data, list):
-                            data_array.extend(year_data)
-                elif isinstance(dados, list):
-                    data_array = dados
-                else:
-                    data_array = []
-
-            # Process data points
-            processed_data = []
-            for data_point in data_array:
-                processed_point = self._process_data_point(data_point)
-                if processed_point:
-                    processed_data.append(processed_point)
-
-            if unit is None and self.metadata_client:
-                try:
-                    metadata = self.metadata_client.get_metadata(varcd)
-                    unit = metadata.unit
-                    if not title:
-                        title = metadata.title
-                except Exception as e:
-                    logger.debug(f"Could not fetch unit from metadata for {varcd}: {e}")
-
-            return DataResponse(
-                varcd=varcd_val,
-                title=title,
-                language=language,
-                data=processed_data,
-                unit=unit,
+            header: dict[str, Any] = {}
+            processed_data: list[dict[str, Any]] = []
+            top_level_points: list[dict[str, Any]] = []
+
+            # Scalars directly under a top-level list element, which is either
+            # the response envelope or (for bare lists) a data point
+            item_fields: dict[str, Any] = {}
+            item_has_dados = False
+
+            builder: Any = None
+            point_prefix = ""
+
+            async for prefix, event, value in ijson.parse_async(body, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if event == "end_map" and prefix == point_prefix:
+                        processed_data.extend(process_data_points([builder.value]))
+                        builder = None
+                    continue
+
+                parts = prefix.split(".") if prefix else []
+                in_item = bool(parts) and parts[0] == "item"
+                rel = parts[1:] if in_item else parts
+
+                if event == "start_map" and self._is_stream_point(rel):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    point_prefix = prefix
+                elif len(rel) == 1:
+                    if rel[0] in _DADOS_KEYS:
+                        item_has_dados = True
+                    elif event in _SCALAR_EVENTS:
+                        (item_fields if in_item else header)[rel[0]] = value
+                elif in_item and not rel and event == "end_map":
+                    if item_has_dados:
+                        header.update(item_fields)
+                    else:
+                        top_level_points.append(item_fields)
+                    item_fields = {}
+                    item_has_dados = False
+
+            title: str = ""
+            unit: Optional[str] = None
+            if top_level_points:
+                title, unit = self._point_list_title_unit(varcd, top_level_points)
+                processed_data.extend(process_data_points(top_level_points))
+                varcd_val, language = varcd, self.language
+            else:
+                varcd_val, title, language, unit = header_fields(varcd, header, self.language)
+
+            data_response = self._build_data_response(
+                varcd, varcd_val, title, language, unit, processed_data
             )
+            return (data_response, *self._paging_fields(header))
 
         except Exception as e:
-            logger.error(f"Failed to parse data response: {str(e)}")
+            logger.error(f"Failed to parse streamed data response: {str(e)}")
             raise DataProcessingError(f"Failed to parse data: {str(e)}") from e
 
-    def _process_data_point(self, data_point: dict[str, Any]) -> Optional[dict[str, Any]]:
-        """Process a single data point from the API response.
+    def _paging_fields(self, envelope: dict[str, Any]) -> tuple[Optional[str], Optional[int]]:
+        """Extract the pagination cursor and total record count from an envelope.
 
         Args:
-            data_point: Raw data point dictionary
+            envelope: Response envelope (or streamed header fields)
 
         Returns:
-            Processed data point dictionary or None if invalid
+            Tuple of (next cursor or None, total records or None)
         """
+        next_cursor = envelope.get(self.CURSOR_FIELD)
+        total = envelope.get(self.TOTAL_FIELD)
         try:
-            processed = {}
+            total = int(total) if total is not None else None
+        except (TypeError, ValueError):
+            logger.debug(f"Ignoring non-numeric {self.TOTAL_FIELD}: {total!r}")
+            total = None
+        return (str(next_cursor) if next_cursor else None), total
 
-            for key, value in data_point.items():
-                if key.startswith("_"):
-                    continue
+    @staticmethod
+    def _count_points(response: Union[dict[str, Any], list[dict[str, Any]]]) -> int:
+        """Count the raw data points in a response without processing them.
 
-                if key == "valor" or key == "value":
-                    try:
-                        processed["value"] = float(value) if value is not None else None
-                    except (ValueError, TypeError) as e:
-                        logger.warning(
-                            f"Could not convert value '{value}' to float. Setting to None. Error: {e}"
-                        )
-                        processed["value"] = None
-                else:
-                    processed[key] = value
+        Args:
+            response: Raw JSON response from API
 
-            return processed
+        Returns:
+            Number of data points (0 for unrecognised shapes)
+        """
+        if isinstance(response, list):
+            if len(response) != 1:
+                return len(response)
+            response = response[0]
+        if not isinstance(response, dict):
+            return 0
+
+        dados = response.get("Dados") or response.get("dados")
+        if isinstance(dados, dict):
+            return sum(len(points) for points in dados.values() if isinstance(points, list))
+        if isinstance(dados, list):
+            return len(dados)
+        return 0
+
+    @staticmethod
+    def _is_stream_point(rel: list[str]) -> bool:
+        """Check if an ijson prefix (relative to the envelope) opens a data point.
 
-        except Exception as e:
-            logger.warning(f"Failed to process data point {data_point}: {str(e)}")
-            return None
+        Args:
+            rel: Prefix path components, without the top-level list "item"
+
+        Returns:
+            True for ``Dados.item`` and ``Dados.<period>.item`` paths
+        """
+        return len(rel) in (2, 3) and rel[0] in _DADOS_KEYS and rel[-1] == "item"
 
-    def validate_dimensions(self, varcd: str, dimensions: dict[str, str]) -> bool:
-        """Validate dimension filters against indicator metadata.
+    def _point_list_title_unit(
+        self, varcd: str, data_array: list[dict[str, Any]]
+    ) -> tuple[str, Optional[str]]:
+        """Resolve title and unit for a bare list of data points.
 
         Args:
             varcd: Indicator code
-            dimensions: Dimension filters to validate
+            data_array: Raw data points
 
         Returns:
-            True if dimensions are valid
-
-        Raises:
-            DimensionError: If any dimension is invalid
+            Tuple of (title, unit)
         """
-        if not self.metadata_client:
-            raise DimensionError("MetadataClient not available for dimension validation.")
+        title = ""
+        unit = None
+        if self.metadata_client:
+            try:
+                metadata = self._get_cached_metadata(varcd)
+                title = metadata.title
+                unit = metadata.unit
+            except Exception as e:
+                logger.warning(f"Could not fetch metadata for {varcd}: {e}")
 
-        metadata = self.metadata_client.get_metadata(varcd)
-        available_dimensions = {f"Dim{d.id}": d for d in metadata.dimensions}
+        if not title and data_array:
+            first_point = data_array[0]
+            unit = first_point.get("unidade") or first_point.get("unit")
 
-        for dim_key, dim_value in dimensions.items():
-            if dim_key not in available_dimensions:
-                raise DimensionError(
-                    f"Invalid dimension key '{dim_key}' for indicator {varcd}. "
-                    f"Available keys: {list(available_dimensions.keys())}"
-                )
+        return title, unit
 
-            dimension = available_dimensions[dim_key]
-            valid_values = {val.code for val in dimension.values}
+    def _start_metadata_prefetch(self, varcd: str) -> Optional["asyncio.Future[IndicatorMetadata]"]:
+        """Start fetching metadata in a worker thread if it may be needed and isn't cached.
 
-            if dim_value not in valid_values:
-                raise DimensionError(
-                    f"Invalid value '{dim_value}' for dimension '{dim_key}' "
-                    f"of indicator {varcd}. Available values: {list(valid_values)}"
-                )
+        Args:
+            varcd: Indicator code
 
-        return True
+        Returns:
+            Future resolving to the metadata, or None if no prefetch was started
+        """
+        if not (self.prefetch_metadata and self.metadata_client) or self._has_fresh_metadata(varcd):
+            return None
+
+        return asyncio.ensure_future(asyncio.to_thread(self._get_cached_metadata, varcd))
+
+    async def _load_dimension_metadata(
+        self, varcd: str, dimensions: Optional[dict[str, str]]
+    ) -> None:
+        """Fetch the metadata that dimension validation needs in a worker thread.
+
+        _build_params() validates dimensions synchronously; loading the metadata
+        here first means that validation reads the cache instead of making a
+        blocking HTTP request on the event loop.
+
+        Args:
+            varcd: Indicator code
+            dimensions: Dimension filters that will be validated, if any
+        """
+        if dimensions and self.metadata_client and not self._has_fresh_metadata(varcd):
+            await asyncio.to_thread(self._get_cached_metadata, varcd)
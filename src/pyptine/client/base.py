@@ -13,20 +13,14 @@ from pyptine.__version__ import __version__
 from pyptine.cache.disk import DiskCache
 from pyptine.utils.exceptions import APIError, RateLimitError
 
-logger = logging.getLogger(__name__)
-
-# Import cache - delay to avoid circular imports
-_disk_cache = None
+try:
+    import orjson
 
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def _get_disk_cache() -> type[DiskCache]:
-    """Lazy import of DiskCache to avoid circular imports."""
-    global _disk_cache
-    if _disk_cache is None:
-        from pyptine.cache.disk import DiskCache
-
-        _disk_cache = DiskCache
-    return _disk_cache
+logger = logging.getLogger(__name__)
 
 
 class INEClient:
@@ -45,6 +39,8 @@ class INEClient:
         cache_enabled: Enable HTTP caching
         cache_dir: Directory for cache storage
         max_retries: Maximum number of retry attempts
+        disk_cache: Existing cache to use instead of opening a new one, so
+            several clients can share the same cache sessions
 
     Example:
         >>> client = INEClient(language="EN")
@@ -63,6 +59,7 @@ class INEClient:
         cache_enabled: bool = True,
         cache_dir: Optional[Path] = None,
         max_retries: int = MAX_RETRIES,
+        disk_cache: Optional[DiskCache] = None,
     ) -> None:
         """Initialize INE client."""
         self.language = language.upper()
@@ -78,8 +75,7 @@ class INEClient:
 
         # Initialize cache if enabled
         if self.cache_enabled:
-            disk_cache = _get_disk_cache()
-            self.cache = disk_cache(cache_dir=cache_dir)
+            self.cache = disk_cache if disk_cache is not None else DiskCache(cache_dir=cache_dir)
             logger.debug(f"Cache enabled at: {self.cache.get_cache_dir()}")
 
         # Initialize session
@@ -168,7 +164,12 @@ class INEClient:
         Raises:
             APIError: If request fails
             RateLimitError: If rate limited
+            ValueError: If response_format is not supported
         """
+        # Reject the format before spending a request on it
+        if response_format not in ("json", "xml"):
+            raise ValueError(f"Unsupported response format: {response_format}")
+
         url = self.BASE_URL + endpoint
 
         # Add language to params
@@ -241,10 +242,7 @@ class INEClient:
             # Parse response based on format
             if response_format == "json":
                 return self._parse_json_response(response)
-            elif response_format == "xml":
-                return self._parse_xml_response(response)
-            else:
-                raise ValueError(f"Unsupported response format: {response_format}")
+            return self._parse_xml_response(response)
 
         except requests.Timeout:
             logger.error(f"Request timeout after {self.timeout}s")
@@ -264,7 +262,7 @@ class INEClient:
             raise APIError(0, f"Network error: {str(e)}") from e
 
     def _parse_json_response(self, response: requests.Response) -> dict[str, Any]:
-        """Parse JSON response.
+        """Parse JSON response (with orjson when installed).
 
         Args:
             response: HTTP response
@@ -276,8 +274,16 @@ class INEClient:
             APIError: If JSON parsing fails
         """
         try:
-            data = response.json()
-            logger.debug(f"Parsed JSON response with {len(str(data))} characters")
+            content = response.content
+            if ORJSON_AVAILABLE:
+                try:
+                    data = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    # e.g. non-UTF-8 body: let the HTTP client detect the encoding
+                    data = response.json()
+            else:
+                data = response.json()
+            logger.debug(f"Parsed JSON response of {len(content)} bytes")
             return cast(dict[str, Any], data)
         except ValueError as e:
             logger.error(f"Failed to parse JSON response: {str(e)}")
@@ -5,15 +5,22 @@ from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Optional, Union, cast
 
+from pyptine.cache.disk import DiskCache
+from pyptine.client._points import process_data_points
+from pyptine.client._responses import (
+    DataParsingMixin,
+    MetadataCache,
+    envelope_points,
+    header_fields,
+)
 from pyptine.client.base import INEClient
 from pyptine.client.metadata import MetadataClient  # Import MetadataClient
 from pyptine.models.response import DataResponse
-from pyptine.utils.exceptions import DataProcessingError, DimensionError
 
 logger = logging.getLogger(__name__)
 
 
-class DataClient(INEClient):
+class DataClient(DataParsingMixin, INEClient):
     """Client for INE data API endpoint.
 
     Fetches and parses indicator data with support for dimension filtering
@@ -35,9 +42,11 @@ class DataClient(INEClient):
         cache_enabled: bool = True,
         cache_dir: Optional[Path] = None,
         metadata_client: Optional[MetadataClient] = None,  # New parameter
+        disk_cache: Optional[DiskCache] = None,
     ):
-        super().__init__(language, timeout, cache_enabled, cache_dir)
+        super().__init__(language, timeout, cache_enabled, cache_dir, disk_cache=disk_cache)
         self.metadata_client = metadata_client
+        self._metadata_cache: MetadataCache = {}
 
     def get_data(
         self,
@@ -126,11 +135,15 @@ class DataClient(INEClient):
         total_fetched = 0
         chunk_count = 0
 
+        # Validate dimensions and build the shared parameters once; only the
+        # offset changes from one chunk to the next
+        base_params = self._build_params(varcd, dimensions, limit=chunk_size)
+
         while True:
             chunk_count += 1
             logger.debug(f"Fetching chunk {chunk_count} with offset={offset}")
 
-            params = self._build_params(varcd, dimensions, offset=offset, limit=chunk_size)
+            params = {**base_params, "start": str(offset)}
 
             try:
                 raw_response = self._make_request(
@@ -208,10 +221,13 @@ class DataClient(INEClient):
 
         return params
 
-    def _parse_data_response(
+    def _parse_legacy(
         self, varcd: str, response: Union[dict[str, Any], list[dict[str, Any]]]
     ) -> DataResponse:
-        """Parse data API response into DataResponse model.
+        """Parse older or alternative response shapes.
+
+        Handles lowercase field names (``indicador``, ``dados``, ...), bare lists
+        of data points, and alternative title keys.
 
         Args:
             varcd: Indicator code (used if response is a list)
@@ -219,177 +235,45 @@ class DataClient(INEClient):
 
         Returns:
             Parsed DataResponse object
-
-        Raises:
-            DataProcessingError: If parsing fails
-        """
-        try:
-            varcd_val = varcd
-            title = ""
-            language = self.language
-            unit = None
-            data_array = []
-
-            if isinstance(response, list):
-                # New API format: response is a list with a single dict
-                if len(response) == 1 and isinstance(response[0], dict):
-                    response = response[0]
-                elif len(response) > 1:
-                    # Old format: response is directly the data array
-                    data_array = response
-                    # Fetch metadata separately to get title and unit
-                    if self.metadata_client:
-                        try:
-                            metadata = self.metadata_client.get_metadata(varcd)
-                            title = metadata.title
-                            unit = metadata.unit
-                        except Exception as e:
-                            logger.warning(
-                                f"Could not fetch metadata for {varcd} when parsing list data response: {e}"
-                            )
-                    else:
-                        logger.warning(
-                            "MetadataClient not available in DataClient to fetch indicator name and unit."
-                        )
-
-                    if not title and data_array:
-                        # Fallback: try to get unit from first data point if metadata not available
-                        first_point = data_array[0]
-                        unit = first_point.get("unidade") or first_point.get("unit")
-
-            if isinstance(response, dict):
-                # Support both old and new API formats
-                # New format uses PascalCase field names
-                varcd_val = response.get("IndicadorCod") or response.get("indicador", varcd)
-                title = (
-                    response.get("IndicadorDsg")
-                    or response.get("IndicadorNome")
-                    or response.get("nome", "")
-                )
-                language = response.get("Lingua") or response.get("lang", self.language)
-                unit = response.get("UnidadeMedida") or response.get("unidade")
-
-                # Handle both old and new data array formats
-                # Old format: "dados" is a flat array
-                # New format: "Dados" is an object with years as keys
-                dados = response.get("Dados") or response.get("dados")
-                if isinstance(dados, dict):
-                    # New format: flatten all years into a single array
-                    data_array = []
-                    for year_data in dados.values():
-                        if isinstance(year_data, list):
-                            data_array.extend(year_data)
-                elif isinstance(dados, list):
-                    # Old format: already a flat array
-                    data_array = dados
-                else:
-                    data_array = []
-
-            # Process data points
-            processed_data = []
-            for data_point in data_array:
-                processed_point = self._process_data_point(data_point)
-                if processed_point:
-                    processed_data.append(processed_point)
-
-            # If unit is still None and we have metadata_client, fetch from metadata
-            if unit is None and self.metadata_client:
-                try:
-                    metadata = self.metadata_client.get_metadata(varcd)
-                    unit = metadata.unit
-                    # Also update title if it's empty
-                    if not title:
-                        title = metadata.title
-                except Exception as e:
-                    logger.debug(f"Could not fetch unit from metadata for {varcd}: {e}")
-
-            return DataResponse(
-                varcd=varcd_val,
-                title=title,
-                language=language,
-                data=processed_data,
-                unit=unit,
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to parse data response: {str(e)}")
-            raise DataProcessingError(f"Failed to parse data: {str(e)}") from e
-
-    def _process_data_point(self, data_point: dict[str, Any]) -> Optional[dict[str, Any]]:
-        """Process a single data point from the API response.
-
-        Args:
-            data_point: Raw data point dictionary
-
-        Returns:
-            Processed data point dictionary or None if invalid
         """
-        try:
-            processed = {}
-
-            # Iterate through all fields in the data point
-            for key, value in data_point.items():
-                # Skip internal fields
-                if key.startswith("_"):
-                    continue
-
-                # Handle value field specially (convert to float)
-                if key == "valor" or key == "value":
+        varcd_val = varcd
+        title = ""
+        language = self.language
+        unit = None
+        data_array = []
+
+        if isinstance(response, list):
+            # New API format: response is a list with a single dict
+            if len(response) == 1 and isinstance(response[0], dict):
+                response = response[0]
+            elif len(response) > 1:
+                # Old format: response is directly the data array
+                data_array = response
+                # Fetch metadata separately to get title and unit
+                if self.metadata_client:
                     try:
-                        processed["value"] = float(value) if value is not None else None
-                    except (ValueError, TypeError) as e:
+                        metadata = self._get_cached_metadata(varcd)
+                        title = metadata.title
+                        unit = metadata.unit
+                    except Exception as e:
                         logger.warning(
-                            f"Could not convert value '{value}' for key '{key}' to float in data point {data_point}. "
-                            f"Setting to None. Error: {e}"
+                            f"Could not fetch metadata for {varcd} when parsing list data response: {e}"
                         )
-                        processed["value"] = None
                 else:
-                    # Keep other fields as-is
-                    processed[key] = value
-
-            return processed
-
-        except Exception as e:
-            logger.warning(f"Failed to process data point {data_point}: {str(e)}")
-            return None
-
-    def validate_dimensions(self, varcd: str, dimensions: dict[str, str]) -> bool:
-        """Validate dimension filters against indicator metadata.
-
-        This method checks if the provided dimension codes and values are valid
-        for the indicator.
-
-        Args:
-            varcd: Indicator code
-            dimensions: Dimension filters to validate (e.g., {"Dim1": "2023"})
-
-        Returns:
-            True if dimensions are valid
-
-        Raises:
-            DimensionError: If metadata client is not available, or if any
-                            dimension key or value is invalid.
-        """
-        if not self.metadata_client:
-            raise DimensionError("MetadataClient not available for dimension validation.")
+                    logger.warning(
+                        "MetadataClient not available in DataClient to fetch indicator name and unit."
+                    )
 
-        metadata = self.metadata_client.get_metadata(varcd)
-        available_dimensions = {f"Dim{d.id}": d for d in metadata.dimensions}
+                if not title and data_array:
+                    # Fallback: try to get unit from first data point if metadata not available
+                    first_point = data_array[0]
+                    unit = first_point.get("unidade") or first_point.get("unit")
 
-        for dim_key, dim_value in dimensions.items():
-            if dim_key not in available_dimensions:
-                raise DimensionError(
-                    f"Invalid dimension key '{dim_key}' for indicator {varcd}. "
-                    f"Available keys: {list(available_dimensions.keys())}"
-                )
+        if isinstance(response, dict):
+            varcd_val, title, language, unit = header_fields(varcd, response, self.language)
+            data_array = envelope_points(response)
 
-            dimension = available_dimensions[dim_key]
-            valid_values = {val.code for val in dimension.values}
-
-            if dim_value not in valid_values:
-                raise DimensionError(
-                    f"Invalid value '{dim_value}' for dimension '{dim_key}' "
-                    f"of indicator {varcd}. Available values: {list(valid_values)}"
-                )
+        # Process data points
+        processed_data = process_data_points(data_array)
 
-        return True
+        return self._build_data_response(varcd, varcd_val, title, language, unit, processed_data)
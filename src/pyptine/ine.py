@@ -1,9 +1,11 @@
 """High-level API for INE Portugal data access."""
 
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Literal, Optional, Union
 
+from pyptine.cache.disk import DiskCache
 from pyptine.client.base import INEClient
 from pyptine.client.catalogue import CatalogueClient
 from pyptine.client.data import DataClient
@@ -73,12 +75,17 @@ class INE:
         self.cache_enabled = cache
         self.cache_dir = cache_dir
 
+        # All clients share one disk cache instead of each opening its own
+        # SQLite sessions on the same files
+        disk_cache = DiskCache(cache_dir=cache_dir) if cache else None
+
         # Initialize base client
         self.base_client = INEClient(
             language=self.language,
             timeout=timeout,
             cache_enabled=cache,
             cache_dir=cache_dir,
+            disk_cache=disk_cache,
         )
 
         # Initialize specialized clients
@@ -87,6 +94,7 @@ class INE:
             timeout=timeout,
             cache_enabled=cache,
             cache_dir=cache_dir,
+            disk_cache=disk_cache,
         )
 
         self.metadata_client = MetadataClient(
@@ -94,6 +102,7 @@ class INE:
             timeout=timeout,
             cache_enabled=cache,
             cache_dir=cache_dir,
+            disk_cache=disk_cache,
         )
 
         self.data_client = DataClient(
@@ -102,6 +111,7 @@ class INE:
             cache_enabled=cache,
             cache_dir=cache_dir,
             metadata_client=self.metadata_client,  # Pass metadata_client
+            disk_cache=disk_cache,
         )
 
         # Initialize catalogue browser
@@ -148,6 +158,45 @@ class INE:
             progress_callback=progress_callback,
         )
 
+    def isearch(
+        self,
+        query: str,
+        search_fields: Optional[list[str]] = None,
+        case_sensitive: bool = False,
+        theme: Optional[str] = None,
+        subtheme: Optional[str] = None,
+        progress_callback: Optional[Any] = None,
+    ) -> Iterator[Indicator]:
+        """Lazily search for indicators, yielding matches one at a time.
+
+        Same as search(), but returns a generator so callers that only need the
+        first few results don't build the full result list.
+
+        Args:
+            query: Search query string
+            search_fields: Specific fields to search (default: all)
+            case_sensitive: Perform case-sensitive search
+            theme: Optional theme name to filter by
+            subtheme: Optional subtheme name to filter by
+            progress_callback: Optional callback function(downloaded_bytes, total_bytes)
+
+        Returns:
+            Iterator over matching indicators
+
+        Example:
+            >>> from itertools import islice
+            >>> ine = INE()
+            >>> first_ten = list(islice(ine.isearch("gdp"), 10))
+        """
+        return self.browser.isearch(
+            query=query,
+            search_fields=search_fields,
+            case_sensitive=case_sensitive,
+            theme=theme,
+            subtheme=subtheme,
+            progress_callback=progress_callback,
+        )
+
     def get_data(
         self,
         varcd: str,
@@ -367,7 +416,7 @@ class INE:
     def clear_cache(self) -> None:
         """Clear all cached data.
 
-        Clears both HTTP cache and in-memory catalogue cache.
+        Clears the HTTP cache and the in-memory catalogue and metadata caches.
 
         Example:
             >>> ine = INE()
@@ -376,6 +425,7 @@ class INE:
         if self.cache_enabled and self.base_client.cache:
             self.base_client.cache.clear()
         self.browser.clear_cache()
+        self.data_client.clear_metadata_cache()
         logger.info("Cache cleared")
 
     def get_cache_info(self) -> dict[str, Any]:
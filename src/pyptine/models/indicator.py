@@ -1,6 +1,8 @@
 """Pydantic models for INE indicators and dimensions."""
 
+import sys
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -30,6 +32,27 @@ class Dimension(BaseModel):
     description: Optional[str] = Field(None, description="Dimension description")
     values: list[DimensionValue] = Field(default_factory=list, description="Available values")
 
+    @cached_property
+    def value_codes(self) -> frozenset[str]:
+        """Codes of all available values, computed once per instance.
+
+        Returns:
+            Frozen set of value codes
+        """
+        return frozenset(val.code for val in self.values)
+
+    @cached_property
+    def api_key(self) -> str:
+        """API parameter name for this dimension ("Dim1", "Dim2", ...).
+
+        Interned, so dictionary lookups with user-supplied keys of the same
+        spelling can short-circuit on identity.
+
+        Returns:
+            Parameter name used in data requests
+        """
+        return sys.intern(f"Dim{self.id}")
+
 
 class Indicator(BaseModel):
     """Indicator metadata from INE catalogue.
@@ -82,6 +105,17 @@ class IndicatorMetadata(Indicator):
     dimensions: list[Dimension] = Field(default_factory=list, description="Available dimensions")
     notes: Optional[str] = Field(None, description="Additional notes")
 
+    @cached_property
+    def dimension_index(self) -> dict[str, Dimension]:
+        """Dimensions keyed by their API parameter name ("Dim1", "Dim2", ...).
+
+        Computed once per instance.
+
+        Returns:
+            Dictionary mapping parameter names to dimensions
+        """
+        return {d.api_key: d for d in self.dimensions}
+
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -1,15 +1,21 @@
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
+from pyptine.analysis import metrics as _metrics
 from pyptine.models.indicator import Indicator
-from pyptine.processors.csv import export_to_csv
+from pyptine.processors.csv import export_rows_to_csv, export_to_csv
+from pyptine.processors.dataframe import _series_to_list, dataframe_to_records
 from pyptine.processors.json import export_to_json
+from pyptine.visualization import charts as _charts
 
 try:
+    import numpy as np
     import pandas as pd
 
     PANDAS_AVAILABLE = True
@@ -17,10 +23,49 @@ except ImportError:
     PANDAS_AVAILABLE = False
 
 
+# Upper bound on the calculate_* results memoized per DataResponse
+_MAX_METRIC_FRAMES = 8
+
+# Upper bound on the plot_* figures memoized per DataResponse
+_MAX_FIGURES = 8
+
+
+def _to_float_array(values: list[Any]) -> "np.ndarray":
+    """Convert values to a float64 array, mapping None and non-numeric entries to NaN."""
+    try:
+        return np.array(values, dtype="float64")
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(
+            dtype="float64"
+        )
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoders do not handle natively.
+
+    Args:
+        obj: Object that could not be serialized
+
+    Returns:
+        JSON-compatible representation of obj
+
+    Raises:
+        TypeError: If obj has no JSON representation
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class DataPoint(BaseModel):
     """Single data point from INE API.
 
     Represents one observation with its dimension values and the measured value.
+    Responses keep their rows as plain dicts in ``DataResponse.data``; DataPoint
+    objects are only created on request, via ``DataResponse.iter_points()``.
+    Instances are immutable.
     """
 
     value: Optional[float] = Field(None, description="Measured value")
@@ -28,16 +73,22 @@ class DataPoint(BaseModel):
     unit: Optional[str] = Field(None, description="Unit of measurement")
 
     model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
         json_schema_extra={
             "example": {
                 "value": 10295909.0,
                 "dimensions": {"Period": "2021", "Geographic localization": "Portugal"},
                 "unit": "No.",
             }
-        }
+        },
     )
 
 
+# Passed to DataPoint.model_construct() so it need not work out the set fields per point
+_DATA_POINT_FIELDS = frozenset(DataPoint.model_fields)
+
+
 class DataResponse(BaseModel):
     """Wrapper for data API response.
 
@@ -54,9 +105,205 @@ class DataResponse(BaseModel):
         default_factory=datetime.now, description="When data was extracted"
     )
 
+    # DataFrame built from ``data``, shared by to_dataframe(), to_csv(), the
+    # calculate_* methods and the plot methods
+    _df: Optional["pd.DataFrame"] = PrivateAttr(default=None)
+    # True when ``data`` was generated from ``_df`` row for row (calculate_* results)
+    _data_from_df: bool = PrivateAttr(default=False)
+    # calculate_* result frames derived from ``_df``, keyed by method and arguments
+    _metric_frames: dict[tuple[Any, ...], "pd.DataFrame"] = PrivateAttr(default_factory=dict)
+    # plot_* figures drawn from ``_df``, keyed by method and arguments; only
+    # copies are handed out, so every call gets a figure of its own
+    _figures: dict[tuple[Any, ...], Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the cached DataFrame when ``data`` changes."""
+        super().__setattr__(name, value)
+        if name == "data":
+            self._df = None
+            self._data_from_df = False
+            self._metric_frames = {}
+            self._figures = {}
+
+    def _get_df(self) -> "pd.DataFrame":
+        """Return the memoized DataFrame for ``data``, building it on first use.
+
+        The frame is rebuilt after ``data`` is reassigned or rows are added or
+        removed. The returned frame is shared; callers must not modify it in place.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        if not PANDAS_AVAILABLE:
+            raise ImportError(
+                "pandas is required to convert data to DataFrame. "
+                "Install it with: pip install pandas"
+            )
+
+        if self._df is None or len(self._df) != len(self.data):
+            self._df = self._build_dataframe()
+            self._data_from_df = False
+            self._metric_frames = {}
+            self._figures = {}
+        return self._df
+
+    def clear_dataframe_cache(self) -> None:
+        """Drop the cached DataFrame so the next use rebuilds it from ``data``.
+
+        Only needed after editing existing data points in place; reassigning
+        ``data`` or changing its length is detected automatically.
+        """
+        self._df = None
+        self._data_from_df = False
+        self._metric_frames = {}
+        self._figures = {}
+
+    def _metric_frame(
+        self, key: tuple[Any, ...], compute: Callable[["pd.DataFrame"], "pd.DataFrame"]
+    ) -> "pd.DataFrame":
+        """Return compute(DataFrame), reusing the frame from an earlier call with the same key.
+
+        Results are kept for as long as the memoized DataFrame is, so repeating
+        a calculate_* call with the same arguments (or branching several
+        analyses off one response) sorts and computes the data only once. At
+        most _MAX_METRIC_FRAMES results are kept, dropping the oldest first.
+
+        Args:
+            key: Method name and arguments identifying the result
+            compute: Function deriving the result from this response's DataFrame
+        """
+        df = self._get_df()
+        frame = self._metric_frames.get(key)
+        if frame is None:
+            frame = compute(df)
+            if len(self._metric_frames) >= _MAX_METRIC_FRAMES:
+                del self._metric_frames[next(iter(self._metric_frames))]
+            self._metric_frames[key] = frame
+        return frame
+
+    def _figure(self, key: tuple[Any, ...], draw: Callable[["pd.DataFrame"], Any]) -> Any:
+        """Return draw(DataFrame), copying the figure from an earlier call with the same key.
+
+        Drawing runs plotly express over the data; copying a stored figure
+        skips that and takes a fraction of the time, which keeps repeated plots
+        of one response (e.g. in a notebook or dashboard callback) quick. Each
+        call returns a new figure, so customizing one does not affect later
+        ones. Calls with unhashable arguments are drawn every time. At most
+        _MAX_FIGURES figures are kept, dropping the oldest first.
+
+        Args:
+            key: Method name and arguments identifying the figure
+            draw: Function drawing the figure from this response's DataFrame
+        """
+        df = self._get_df()
+        try:
+            stored = self._figures.get(key)
+        except TypeError:
+            return draw(df)
+        if stored is None:
+            figure = draw(df)
+            if len(self._figures) >= _MAX_FIGURES:
+                del self._figures[next(iter(self._figures))]
+            self._figures[key] = type(figure)(figure)
+            return figure
+        return type(stored)(stored)
+
+    def _columns(self) -> list[str]:
+        """Return column names in the order keys first appear in the data.
+
+        When no row has a key missing from the first row (the usual case),
+        that row's keys are the answer and the rows are only checked with a
+        set union, instead of being walked key by key.
+        """
+        if not self.data:
+            return []
+        columns = list(self.data[0])
+        if len(set().union(*self.data)) == len(columns):
+            return columns
+        return list(dict.fromkeys(chain.from_iterable(self.data)))
+
+    def _build_dataframe(self) -> "pd.DataFrame":
+        """Build a column-oriented DataFrame from ``data`` with explicit dtypes.
+
+        Each column is gathered into its own array in a single pass over the
+        rows (with itemgetter while every row has the key), rather than first
+        materializing a row-major object matrix:
+        'value' becomes a contiguous float64 array (non-numeric entries become
+        NaN), and repetitive string columns such as periods and region names
+        are encoded as categoricals so each distinct label is stored once.
+        """
+        if not self.data:
+            return pd.DataFrame()
+
+        n_rows = len(self.data)
+        columns: dict[str, Any] = {}
+        for name in self._columns():
+            try:
+                values = list(map(itemgetter(name), self.data))
+            except KeyError:
+                values = [point.get(name) for point in self.data]
+            if name == "value":
+                columns[name] = _to_float_array(values)
+            elif pd.api.types.infer_dtype(values, skipna=True) == "string":
+                codes, labels = pd.factorize(np.array(values, dtype=object), sort=True)
+                columns[name] = (
+                    pd.Categorical.from_codes(codes, categories=labels)
+                    if len(labels) <= n_rows // 2
+                    else values
+                )
+            else:
+                columns[name] = values
+
+        return pd.DataFrame(columns)
+
+    def _with_dataframe(self, df: "pd.DataFrame", added: Sequence[str]) -> "DataResponse":
+        """Create a new DataResponse with this response's metadata and df as its data.
+
+        The metadata comes from this (already validated) response and the rows
+        from a DataFrame, so the new model is constructed without re-validation.
+
+        When this response's rows were themselves generated from its DataFrame
+        and df keeps the same row order (as in a chain of calculate_* calls),
+        only the ``added`` columns are converted and set on copies of the
+        existing rows, instead of converting the whole frame again.
+
+        Args:
+            df: DataFrame derived from this response's DataFrame
+            added: Columns that df adds to (or replaces in) this response's data
+        """
+        source = self._df
+        if (
+            self._data_from_df
+            and source is not None
+            and not df.empty
+            and df.index.equals(source.index)
+        ):
+            data = [row.copy() for row in self.data]
+            for name in added:
+                for row, value in zip(data, _series_to_list(df[name])):
+                    row[name] = value
+        else:
+            data = dataframe_to_records(df)
+
+        response = DataResponse.model_construct(
+            varcd=self.varcd,
+            title=self.title,
+            language=self.language,
+            data=data,
+            unit=self.unit,
+            extraction_date=self.extraction_date,
+        )
+        response._df = df
+        response._data_from_df = True
+        return response
+
     def to_dataframe(self) -> "pd.DataFrame":
         """Convert data to pandas DataFrame.
 
+        The 'value' column is float64 (non-numeric entries become NaN); the
+        other columns hold plain values, even though the frame kept internally
+        stores repetitive labels as categoricals.
+
         Returns:
             pandas DataFrame with the indicator data.
 
@@ -68,31 +315,118 @@ class DataResponse(BaseModel):
             >>> df = response.to_dataframe()
             >>> print(df.head())
         """
-        if not PANDAS_AVAILABLE:
-            raise ImportError(
-                "pandas is required to convert data to DataFrame. "
-                "Install it with: pip install pandas"
+        df = self._get_df()
+        categorical = {
+            name: dtype.categories.dtype
+            for name, dtype in df.dtypes.items()
+            if isinstance(dtype, pd.CategoricalDtype)
+        }
+        return df.astype(categorical) if categorical else df.copy()
+
+    def iter_points(self) -> Iterator[DataPoint]:
+        """Iterate over the data as DataPoint objects.
+
+        Points are created lazily with ``model_construct``, skipping validation
+        since the rows were already sanitized when the response was parsed.
+        Every key other than 'value' becomes a dimension.
+
+        Yields:
+            One DataPoint per data row
+
+        Example:
+            >>> for point in response.iter_points():
+            ...     print(point.dimensions["Period"], point.value)
+        """
+        unit = self.unit
+        for row in self.data:
+            dimensions = row.copy()
+            value = dimensions.pop("value", None)
+            yield DataPoint.model_construct(
+                _DATA_POINT_FIELDS, value=value, dimensions=dimensions, unit=unit
             )
 
-        if not self.data:
-            return pd.DataFrame()
+    def iter_csv_rows(self) -> Iterator[list[Any]]:
+        """Iterate over the data as CSV rows.
+
+        The first row yielded is the header. Columns follow the order in which
+        keys first appear in the data, matching ``to_dataframe()``; missing
+        values are yielded as None.
+
+        Yields:
+            Header row followed by one row per data point
+
+        Example:
+            >>> rows = list(response.iter_csv_rows())
+            >>> rows[0]
+            ['Period', 'Geographic localization', 'value']
+        """
+        columns = self._columns()
+        yield columns
+        for point in self.data:
+            yield [point.get(column) for column in columns]
 
-        return pd.DataFrame(self.data)
+    def _iter_plain_csv_rows(self) -> Iterator[Sequence[Any]]:
+        """Like iter_csv_rows(), but with NaN written as an empty field, as pandas does.
+
+        Rows that have every column are read with a single itemgetter call.
+        Only 'value' and columns holding a float in the first row are checked
+        for NaN.
+        """
+        columns = self._columns()
+        yield columns
+        if not columns:
+            return
+
+        getter: Callable[[dict[str, Any]], Sequence[Any]] = (
+            itemgetter(*columns) if len(columns) > 1 else lambda point: (point[columns[0]],)
+        )
+        first = self.data[0]
+        float_columns = [
+            i
+            for i, column in enumerate(columns)
+            if column == "value" or isinstance(first.get(column), float)
+        ]
+
+        for point in self.data:
+            try:
+                row = getter(point)
+            except KeyError:
+                row = [point.get(column) for column in columns]
+            for i in float_columns:
+                value = row[i]
+                if value != value:
+                    row = [None if item != item else item for item in row]
+                    break
+            yield row
 
     def to_csv(
         self,
         filepath: Union[str, Path],
         include_metadata: bool = True,
+        stream: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
         **kwargs: Any,
-    ) -> None:
+    ) -> int:
         """Export data to CSV file.
 
+        Without extra keyword arguments, and when no DataFrame has been built for
+        this response yet, rows are written straight from ``data`` with the same
+        output as ``DataFrame.to_csv()`` rather than constructing a DataFrame
+        only to serialize it.
+
         Args:
             filepath: Output file path
             include_metadata: Include metadata as comment header
-            **kwargs: Additional arguments passed to df.to_csv()
+            stream: Write rows incrementally with csv.writer instead of building
+                a DataFrame first
+            progress_callback: Optional callback function(rows_written, total_rows),
+                only used when stream is True
+            **kwargs: Additional arguments passed to df.to_csv() (or csv.writer()
+                when stream is True)
+
+        Returns:
+            Number of bytes written to the file
         """
-        df = self.to_dataframe()
         metadata = {
             "indicator": self.varcd,
             "title": self.title,
@@ -100,8 +434,33 @@ class DataResponse(BaseModel):
             "language": self.language,
             "extraction_date": self.extraction_date.isoformat(),
         }
-        export_to_csv(
-            df, Path(filepath), include_metadata=include_metadata, metadata=metadata, **kwargs
+
+        if stream:
+            return export_rows_to_csv(
+                self.iter_csv_rows(),
+                Path(filepath),
+                include_metadata=include_metadata,
+                metadata=metadata,
+                total_rows=len(self.data),
+                progress_callback=progress_callback,
+                **kwargs,
+            )
+
+        if not kwargs and self._df is None:
+            return export_rows_to_csv(
+                self._iter_plain_csv_rows(),
+                Path(filepath),
+                include_metadata=include_metadata,
+                metadata=metadata,
+                lineterminator="\n",
+            )
+
+        return export_to_csv(
+            self._get_df(),
+            Path(filepath),
+            include_metadata=include_metadata,
+            metadata=metadata,
+            **kwargs,
         )
 
     def to_json(
@@ -109,16 +468,21 @@ class DataResponse(BaseModel):
         filepath: Union[str, Path],
         pretty: bool = True,
         **kwargs: Any,
-    ) -> None:
+    ) -> int:
         """Export data to JSON file.
 
         Args:
             filepath: Output file path
             pretty: Use pretty printing
-            **kwargs: Additional arguments passed to json.dump()
+            **kwargs: Additional arguments passed to export_to_json()
+
+        Returns:
+            Number of bytes written to the file
         """
-        data = self.model_dump(mode="json")
-        export_to_json(data, Path(filepath), pretty=pretty, **kwargs)
+        # Hand the fields over as-is instead of model_dump(mode="json"), which
+        # would copy every data point before the exporter walks them again
+        data = {name: getattr(self, name) for name in type(self).model_fields}
+        return export_to_json(data, Path(filepath), pretty=pretty, default=_json_default, **kwargs)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert response to dictionary.
@@ -154,16 +518,12 @@ class DataResponse(BaseModel):
             >>> df = yoy_response.to_dataframe()
             >>> print(df[['Period', 'value', 'yoy_growth']].head())
         """
-        from pyptine.analysis.metrics import calculate_yoy_growth
-
-        new_data = calculate_yoy_growth(self.data, value_column, period_column)
-        return DataResponse(
-            varcd=self.varcd,
-            title=self.title,
-            language=self.language,
-            data=new_data,
-            unit=self.unit,
-            extraction_date=self.extraction_date,
+        return self._with_dataframe(
+            self._metric_frame(
+                ("yoy", value_column, period_column),
+                lambda df: _metrics.calculate_yoy_growth_df(df, value_column, period_column),
+            ),
+            ("yoy_growth",),
         )
 
     def calculate_mom_change(
@@ -192,16 +552,12 @@ class DataResponse(BaseModel):
             >>> df = mom_response.to_dataframe()
             >>> print(df[['Period', 'value', 'mom_change']].head())
         """
-        from pyptine.analysis.metrics import calculate_mom_change
-
-        new_data = calculate_mom_change(self.data, value_column, period_column)
-        return DataResponse(
-            varcd=self.varcd,
-            title=self.title,
-            language=self.language,
-            data=new_data,
-            unit=self.unit,
-            extraction_date=self.extraction_date,
+        return self._with_dataframe(
+            self._metric_frame(
+                ("mom", value_column, period_column),
+                lambda df: _metrics.calculate_mom_change_df(df, value_column, period_column),
+            ),
+            ("mom_change",),
         )
 
     def calculate_moving_average(
@@ -233,16 +589,14 @@ class DataResponse(BaseModel):
             >>> df = ma_response.to_dataframe()
             >>> print(df[['Period', 'value', 'moving_avg']].head(15))
         """
-        from pyptine.analysis.metrics import calculate_moving_average
-
-        new_data = calculate_moving_average(self.data, window, value_column, period_column)
-        return DataResponse(
-            varcd=self.varcd,
-            title=self.title,
-            language=self.language,
-            data=new_data,
-            unit=self.unit,
-            extraction_date=self.extraction_date,
+        return self._with_dataframe(
+            self._metric_frame(
+                ("ma", window, value_column, period_column),
+                lambda df: _metrics.calculate_moving_average_df(
+                    df, window, value_column, period_column
+                ),
+            ),
+            ("moving_avg",),
         )
 
     def calculate_exponential_moving_average(
@@ -274,18 +628,53 @@ class DataResponse(BaseModel):
             >>> df = ema_response.to_dataframe()
             >>> print(df[['Period', 'value', 'ema']].head(15))
         """
-        from pyptine.analysis.metrics import calculate_exponential_moving_average
-
-        new_data = calculate_exponential_moving_average(
-            self.data, span, value_column, period_column
+        return self._with_dataframe(
+            self._metric_frame(
+                ("ema", span, value_column, period_column),
+                lambda df: _metrics.calculate_exponential_moving_average_df(
+                    df, span, value_column, period_column
+                ),
+            ),
+            ("ema",),
         )
-        return DataResponse(
-            varcd=self.varcd,
-            title=self.title,
-            language=self.language,
-            data=new_data,
-            unit=self.unit,
-            extraction_date=self.extraction_date,
+
+    def calculate_metrics(
+        self,
+        metrics: list[str],
+        value_column: str = "value",
+        period_column: str = "Period",
+    ) -> "DataResponse":
+        """Calculate several metrics at once.
+
+        Equivalent to chaining the calculate_* methods, but sorts the data and
+        builds the new DataResponse only once. Metrics are "yoy", "mom", "ma"
+        and "ema", plus the rolling "min" and "max"; all but the first two take
+        an optional window/span, as in "ma:12".
+
+        Args:
+            metrics: Metric specs, e.g. ["yoy", "mom", "ma:12", "ema:10"]
+            value_column: Name of the column containing values (default: "value")
+            period_column: Name of the column containing time period (default: "Period")
+
+        Returns:
+            New DataResponse with the requested columns ('yoy_growth',
+            'mom_change', 'moving_avg', 'ema', 'moving_min', 'moving_max') added
+
+        Raises:
+            ImportError: If pandas is not installed
+            ValueError: If a metric spec is invalid
+
+        Example:
+            >>> response = ine.get_data("0004127")
+            >>> result = response.calculate_metrics(["yoy", "ma:12"])
+            >>> df = result.to_dataframe()
+        """
+        return self._with_dataframe(
+            self._metric_frame(
+                ("metrics", tuple(metrics), value_column, period_column),
+                lambda df: _metrics.calculate_metrics_df(df, metrics, value_column, period_column),
+            ),
+            _metrics.metric_columns(metrics),
         )
 
     def plot(
@@ -325,16 +714,25 @@ class DataResponse(BaseModel):
             >>> fig.update_layout(height=600, width=1000)
             >>> fig.show()
         """
-        from pyptine.visualization.charts import plot_indicator
-
-        return plot_indicator(
-            self.data,
-            title=self.title,
-            x_column=x_column,
-            y_column=y_column,
-            chart_type=chart_type,
-            color_column=color_column,
-            **kwargs,
+        return self._figure(
+            (
+                "plot",
+                self.title,
+                chart_type,
+                x_column,
+                y_column,
+                color_column,
+                tuple(sorted(kwargs.items())),
+            ),
+            lambda df: _charts.plot_indicator(
+                df,
+                title=self.title,
+                x_column=x_column,
+                y_column=y_column,
+                chart_type=chart_type,
+                color_column=color_column,
+                **kwargs,
+            ),
         )
 
     def plot_line(
@@ -362,16 +760,25 @@ class DataResponse(BaseModel):
             >>> fig = response.plot_line(markers=True)
             >>> fig.show()
         """
-        from pyptine.visualization.charts import plot_line_chart
-
-        return plot_line_chart(
-            self.data,
-            title=self.title,
-            x_column=x_column,
-            y_column=y_column,
-            color_column=color_column,
-            markers=markers,
-            **kwargs,
+        return self._figure(
+            (
+                "plot_line",
+                self.title,
+                x_column,
+                y_column,
+                color_column,
+                markers,
+                tuple(sorted(kwargs.items())),
+            ),
+            lambda df: _charts.plot_line_chart(
+                df,
+                title=self.title,
+                x_column=x_column,
+                y_column=y_column,
+                color_column=color_column,
+                markers=markers,
+                **kwargs,
+            ),
         )
 
     def plot_bar(
@@ -397,15 +804,23 @@ class DataResponse(BaseModel):
             >>> fig = response.plot_bar()
             >>> fig.show()
         """
-        from pyptine.visualization.charts import plot_bar_chart
-
-        return plot_bar_chart(
-            self.data,
-            title=self.title,
-            x_column=x_column,
-            y_column=y_column,
-            color_column=color_column,
-            **kwargs,
+        return self._figure(
+            (
+                "plot_bar",
+                self.title,
+                x_column,
+                y_column,
+                color_column,
+                tuple(sorted(kwargs.items())),
+            ),
+            lambda df: _charts.plot_bar_chart(
+                df,
+                title=self.title,
+                x_column=x_column,
+                y_column=y_column,
+                color_column=color_column,
+                **kwargs,
+            ),
         )
 
     def plot_area(
@@ -431,15 +846,23 @@ class DataResponse(BaseModel):
             >>> fig = response.plot_area()
             >>> fig.show()
         """
-        from pyptine.visualization.charts import plot_area_chart
-
-        return plot_area_chart(
-            self.data,
-            title=self.title,
-            x_column=x_column,
-            y_column=y_column,
-            color_column=color_column,
-            **kwargs,
+        return self._figure(
+            (
+                "plot_area",
+                self.title,
+                x_column,
+                y_column,
+                color_column,
+                tuple(sorted(kwargs.items())),
+            ),
+            lambda df: _charts.plot_area_chart(
+                df,
+                title=self.title,
+                x_column=x_column,
+                y_column=y_column,
+                color_column=color_column,
+                **kwargs,
+            ),
         )
 
     def plot_scatter(
@@ -467,16 +890,25 @@ class DataResponse(BaseModel):
             >>> fig = response.plot_scatter()
             >>> fig.show()
         """
-        from pyptine.visualization.charts import plot_scatter_chart
-
-        return plot_scatter_chart(
-            self.data,
-            title=self.title,
-            x_column=x_column,
-            y_column=y_column,
-            color_column=color_column,
-            size_column=size_column,
-            **kwargs,
+        return self._figure(
+            (
+                "plot_scatter",
+                self.title,
+                x_column,
+                y_column,
+                color_column,
+                size_column,
+                tuple(sorted(kwargs.items())),
+            ),
+            lambda df: _charts.plot_scatter_chart(
+                df,
+                title=self.title,
+                x_column=x_column,
+                y_column=y_column,
+                color_column=color_column,
+                size_column=size_column,
+                **kwargs,
+            ),
         )
 
     model_config = ConfigDict(
@@ -520,5 +952,33 @@ class CatalogueResponse(BaseModel):
         """Get indicator by index."""
         return self.indicators[index]
 
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Convert the indicators to a pandas DataFrame, one row per indicator.
+
+        The columns are the Indicator fields. Rows are taken from each
+        model's field values directly, without a model_dump() per indicator.
+
+        Returns:
+            pandas DataFrame with the indicator metadata.
+
+        Raises:
+            ImportError: If pandas is not installed.
+
+        Example:
+            >>> catalogue = CatalogueClient().get_catalogue_response()
+            >>> df = catalogue.to_dataframe()
+            >>> df[df["theme"] == "Population"][["varcd", "title"]]
+        """
+        if not PANDAS_AVAILABLE:
+            raise ImportError(
+                "pandas is required to convert data to DataFrame. "
+                "Install it with: pip install pandas"
+            )
+
+        return pd.DataFrame.from_records(
+            [vars(indicator) for indicator in self.indicators],
+            columns=list(Indicator.model_fields),
+        )
+
 
 CatalogueResponse.model_rebuild()
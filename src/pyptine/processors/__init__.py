@@ -1,17 +1,20 @@
 """Data processing utilities for pyptine package."""
 
 from pyptine.processors.csv import (
+    export_rows_to_csv,
     export_to_csv,
     read_csv_with_metadata,
 )
 from pyptine.processors.dataframe import (
     aggregate_by_period,
     clean_dataframe,
+    dataframe_to_records,
     filter_by_geography,
     get_latest_period,
     json_to_dataframe,
     merge_metadata,
     pivot_by_dimension,
+    records_to_dataframe,
 )
 from pyptine.processors.excel import (
     export_multiple_sheets,
@@ -36,8 +39,11 @@ __all__ = [
     "aggregate_by_period",
     "filter_by_geography",
     "get_latest_period",
+    "dataframe_to_records",
+    "records_to_dataframe",
     # CSV export
     "export_to_csv",
+    "export_rows_to_csv",
     "read_csv_with_metadata",
     "export_multiple_sheets",
     "format_for_excel",
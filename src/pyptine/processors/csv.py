@@ -1,9 +1,14 @@
 """CSV export functionality for pyptine."""
 
+import codecs
+import csv
 import logging
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional, TextIO
+from typing import Any, Callable, Optional, TextIO
 
 import pandas as pd
 
@@ -19,7 +24,7 @@ def export_to_csv(
     metadata: Optional[dict[str, Any]] = None,
     encoding: str = "utf-8-sig",
     **kwargs: Any,
-) -> None:
+) -> int:
     """Export DataFrame to CSV with optional metadata header.
 
     Args:
@@ -30,6 +35,9 @@ def export_to_csv(
         encoding: File encoding (utf-8-sig for Excel compatibility)
         **kwargs: Additional arguments passed to df.to_csv()
 
+    Returns:
+        Number of bytes written to the file
+
     Raises:
         DataProcessingError: If export fails
 
@@ -44,35 +52,128 @@ def export_to_csv(
         # Create parent directories if needed
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write metadata header if requested
-        if include_metadata and metadata:
-            with open(filepath, "w", encoding=encoding) as f:
+        with _open_csv_for_writing(filepath, encoding) as f:
+            # Write metadata header if requested
+            if include_metadata and metadata:
                 _write_metadata_header(f, metadata)
 
-            # Append DataFrame
-            df.to_csv(
-                filepath,
-                mode="a",
-                encoding=encoding,
-                index=False,
-                **kwargs,
-            )
-        else:
-            # Write DataFrame directly
-            df.to_csv(
-                filepath,
-                encoding=encoding,
-                index=False,
-                **kwargs,
-            )
+            # Write DataFrame into the same handle
+            df.to_csv(f, index=False, **kwargs)
+
+            bytes_written = f.tell()
 
         logger.info(f"Exported {len(df)} rows to {filepath}")
 
+        return bytes_written
+
     except Exception as e:
         logger.error(f"Failed to export CSV: {str(e)}")
         raise DataProcessingError(f"Failed to export CSV: {str(e)}") from e
 
 
+def export_rows_to_csv(
+    rows: Iterable[Sequence[Any]],
+    filepath: Path,
+    include_metadata: bool = True,
+    metadata: Optional[dict[str, Any]] = None,
+    encoding: str = "utf-8-sig",
+    chunk_size: int = 1000,
+    total_rows: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    **kwargs: Any,
+) -> int:
+    """Stream rows to a CSV file without building a DataFrame.
+
+    Rows are written in chunks of ``chunk_size`` through ``csv.writer``, so
+    memory use stays flat regardless of the number of rows.
+
+    Args:
+        rows: Iterable of rows; the first row is written as the header
+        filepath: Output file path
+        include_metadata: Include metadata as comment header
+        metadata: Optional metadata dictionary
+        encoding: File encoding (utf-8-sig for Excel compatibility)
+        chunk_size: Number of rows written per batch
+        total_rows: Expected number of data rows, reported to progress_callback
+        progress_callback: Optional callback function(rows_written, total_rows)
+        **kwargs: Additional arguments passed to csv.writer()
+
+    Returns:
+        Number of bytes written to the file
+
+    Raises:
+        DataProcessingError: If export fails
+
+    Example:
+        >>> rows = [["Period", "value"], ["2022", 1.0], ["2023", 2.0]]
+        >>> export_rows_to_csv(rows, Path("output.csv"), include_metadata=False)
+        37
+    """
+    try:
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        written = 0
+        total = total_rows or 0
+        row_iter = iter(rows)
+
+        with _open_csv_for_writing(filepath, encoding, buffering=1 << 20) as f:
+            if include_metadata and metadata:
+                _write_metadata_header(f, metadata)
+
+            writer = csv.writer(f, **kwargs)
+
+            header = next(row_iter, None)
+            if header is not None:
+                writer.writerow(header)
+
+            while chunk := list(islice(row_iter, chunk_size)):
+                writer.writerows(chunk)
+                written += len(chunk)
+                if progress_callback is not None:
+                    progress_callback(written, total)
+
+            bytes_written = f.tell()
+
+        logger.info(f"Exported {written} rows to {filepath}")
+
+        return bytes_written
+
+    except Exception as e:
+        logger.error(f"Failed to export CSV: {str(e)}")
+        raise DataProcessingError(f"Failed to export CSV: {str(e)}") from e
+
+
+@contextmanager
+def _open_csv_for_writing(filepath: Path, encoding: str, buffering: int = -1) -> Iterator[TextIO]:
+    """Open a file for writing CSV text in the given encoding.
+
+    The utf-8-sig codec has a pure-Python incremental encoder, which the text
+    layer calls for every row written. For that encoding the byte order mark is
+    written explicitly and the rest is encoded with the built-in UTF-8 codec,
+    giving the same bytes.
+
+    Args:
+        filepath: Output file path
+        encoding: File encoding
+        buffering: Buffer size passed to open()
+
+    Yields:
+        Text file handle positioned after the byte order mark, if any
+    """
+    with_bom = codecs.lookup(encoding).name == "utf-8-sig"
+    with open(
+        filepath,
+        "w",
+        encoding="utf-8" if with_bom else encoding,
+        newline="",
+        buffering=buffering,
+    ) as f:
+        if with_bom:
+            f.write("\ufeff")
+        yield f
+
+
 def _write_metadata_header(file_handle: TextIO, metadata: dict[str, Any]) -> None:
     """Write metadata as CSV comments.
 
@@ -80,17 +181,16 @@ def _write_metadata_header(file_handle: TextIO, metadata: dict[str, Any]) -> Non
         file_handle: Open file handle
         metadata: Metadata dictionary
     """
-    # Write header
-    file_handle.write("# INE Portugal Data Export\n")
-    file_handle.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    file_handle.write("#\n")
-
-    # Write metadata fields
-    for key, value in metadata.items():
-        if value is not None:
-            file_handle.write(f"# {key}: {value}\n")
+    # Build the whole header, then write it at once
+    lines = [
+        "# INE Portugal Data Export",
+        f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "#",
+    ]
+    lines.extend(f"# {key}: {value}" for key, value in metadata.items() if value is not None)
+    lines.append("#\n")
 
-    file_handle.write("#\n")
+    file_handle.write("\n".join(lines))
 
 
 def read_csv_with_metadata(
@@ -115,22 +215,25 @@ def read_csv_with_metadata(
     try:
         filepath = Path(filepath)
 
-        # Read metadata from comments
         metadata = {}
-        with open(filepath, encoding=encoding) as f:
-            for line in f:
-                if not line.startswith("#"):
-                    break
-
+        with open(filepath, encoding=encoding, newline="") as f:
+            # Read metadata from the leading comment lines
+            position = f.tell()
+            line = f.readline()
+            while line.startswith("#"):
                 # Parse metadata lines (format: "# key: value")
                 if ":" in line and not line.startswith("# Generated:"):
                     line = line.lstrip("#").strip()
                     if ":" in line:
                         key, value = line.split(":", 1)
                         metadata[key.strip()] = value.strip()
+                position = f.tell()
+                line = f.readline()
 
-        # Read DataFrame
-        df = pd.read_csv(filepath, encoding=encoding, comment="#", **kwargs)
+            # Parse the data from the same handle, starting at the column header;
+            # comment="#" is not used, as it would cut data values at any "#"
+            f.seek(position)
+            df = pd.read_csv(f, **kwargs)
 
         logger.debug(f"Read {len(df)} rows from {filepath}")
 
@@ -1,8 +1,11 @@
 """DataFrame processing utilities for pyptine."""
 
 import logging
+import warnings
+from itertools import chain
 from typing import Any, Optional, Union, cast
 
+import numpy as np
 import pandas as pd
 
 from pyptine.utils.exceptions import DataProcessingError
@@ -48,7 +51,7 @@ def json_to_dataframe(
             return pd.DataFrame()
 
         # Convert to DataFrame
-        df = pd.DataFrame(data)
+        df = records_to_dataframe(data)
 
         if df.empty:
             return df
@@ -119,12 +122,15 @@ def pivot_by_dimension(
             # If no other columns, use dimension as index
             return df.set_index(dimension)
 
-        # Create pivot table
+        # Create pivot table; observed=True keeps categorical columns (as in
+        # DataResponse frames) to the label combinations that occur, instead of
+        # their full cross product (the default before pandas 3)
         pivoted = df.pivot_table(
             values=value_cols_list,
             index=index_cols,
             columns=dimension,
             aggfunc=aggfunc,
+            observed=True,
         )
 
         return pivoted
@@ -155,21 +161,26 @@ def clean_dataframe(
         >>> "_internal" in cleaned.columns
         False
     """
-    df = df.copy()
+    # drop() and rename() already return new frames, so the input is only
+    # copied explicitly when neither applies
+    cleaned = df
 
     # Drop internal columns
     if drop_internal_columns:
-        internal_cols = [col for col in df.columns if col.startswith("_")]
+        internal_cols = [col for col in df.columns if isinstance(col, str) and col.startswith("_")]
         if internal_cols:
-            df = df.drop(columns=internal_cols)
+            cleaned = cleaned.drop(columns=internal_cols)
             logger.debug(f"Dropped internal columns: {internal_cols}")
 
     # Rename columns
     if rename_columns:
-        df = df.rename(columns=rename_columns)
+        cleaned = cleaned.rename(columns=rename_columns)
         logger.debug(f"Renamed columns: {rename_columns}")
 
-    return df
+    if cleaned is df:
+        cleaned = df.copy()
+
+    return cleaned
 
 
 def merge_metadata(
@@ -194,13 +205,22 @@ def merge_metadata(
         >>> "meta_indicator" in df_with_meta.columns
         True
     """
-    df = df.copy()
+    columns = {f"{prefix}{key}": value for key, value in metadata.items()}
+    new_columns = {name: value for name, value in columns.items() if name not in df.columns}
+
+    # New columns are built as one frame and joined in a single concat, rather
+    # than inserted one at a time (which fragments the frame's blocks)
+    if new_columns:
+        result = pd.concat([df, pd.DataFrame(new_columns, index=df.index)], axis=1)
+    else:
+        result = df.copy()
 
-    for key, value in metadata.items():
-        col_name = f"{prefix}{key}"
-        df[col_name] = value
+    # Metadata named like an existing column replaces it in place
+    for name, value in columns.items():
+        if name not in new_columns:
+            result[name] = value
 
-    return df
+    return result
 
 
 def _parse_date_column(series: pd.Series) -> pd.Series:
@@ -215,8 +235,10 @@ def _parse_date_column(series: pd.Series) -> pd.Series:
     try:
         # Try different date formats
 
-        # Check if it's just a year
-        if series.astype(str).str.match(r"^\d{4}$").all():
+        # Check if it's just a year; periods repeat for every region and
+        # dimension, so only the distinct labels are matched
+        labels = pd.Series(pd.unique(series))
+        if labels.astype(str).str.match(r"^\d{4}$").all():
             # Keep as string for years
             return series
 
@@ -264,8 +286,10 @@ def aggregate_by_period(
             if col not in df.columns:
                 raise ValueError(f"Value column '{col}' not found in DataFrame")
 
-        # Group by period and aggregate
-        result = df.groupby(period_column)[value_cols_list].agg(agg_func).reset_index()
+        # Group by period and aggregate, skipping unused categorical periods
+        result = (
+            df.groupby(period_column, observed=True)[value_cols_list].agg(agg_func).reset_index()
+        )
 
         return cast(pd.DataFrame, result)
 
@@ -283,7 +307,8 @@ def filter_by_geography(
 
     Args:
         df: Input DataFrame
-        geography: Geographic region to filter (e.g., "Portugal", "Lisboa")
+        geography: Geographic region to filter (e.g., "Portugal", "Lisboa"),
+            matched case-insensitively as a plain substring of the label
         geography_column: Column name for geography (auto-detected if None)
 
     Returns:
@@ -308,10 +333,19 @@ def filter_by_geography(
         if geography_column is None:
             raise ValueError("Could not auto-detect geography column")
 
-    # Filter by geography
-    mask: pd.Series[bool] = (
-        df[geography_column].astype(str).str.contains(geography, case=False, na=False)
+    # Geography labels repeat across periods and indicators, so match the
+    # distinct labels once and select the rows holding a matching label.
+    # Missing labels never match.
+    column = df[geography_column]
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        labels = column.cat.categories
+    else:
+        labels = pd.unique(column)
+    needle = geography.casefold()
+    matched = np.array(
+        [pd.notna(label) and needle in str(label).casefold() for label in labels], dtype=bool
     )
+    mask: pd.Series[bool] = column.isin(labels[matched])
     filtered: pd.DataFrame = cast(pd.DataFrame, df[mask].copy())
 
     logger.debug(f"Filtered to {len(filtered)} rows for geography: {geography}")
@@ -346,14 +380,81 @@ def get_latest_period(
     if period_column not in df.columns:
         raise ValueError(f"Period column '{period_column}' not found")
 
-    # Sort by period descending
-    df_sorted = df.sort_values(period_column, ascending=False)
+    # Pick the top N among the distinct periods, then sort only the rows
+    # that belong to them (newest first) rather than the whole frame
+    periods = df[period_column]
+    latest_periods = pd.Series(pd.unique(periods)).sort_values(ascending=False)[:n]
 
-    # Get unique periods and take top N
-    unique_periods = df_sorted[period_column].unique()[:n]
-
-    # Filter to those periods
-    mask: pd.Series[bool] = df_sorted[period_column].isin(unique_periods)
-    result: pd.DataFrame = cast(pd.DataFrame, df_sorted[mask].copy())
+    mask: pd.Series[bool] = periods.isin(latest_periods)
+    result: pd.DataFrame = df[mask].sort_values(period_column, ascending=False, kind="stable")
 
     return result
+
+
+def dataframe_to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert a DataFrame to a list of row dictionaries.
+
+    Equivalent to ``df.to_dict(orient="records")`` (including its warning and
+    last-column-wins rows for duplicate labels), but converts each column to
+    Python objects in one vectorized call (``tolist()``) and zips the rows
+    together, instead of boxing every cell individually.
+
+    Args:
+        df: Input DataFrame
+
+    Returns:
+        List of dictionaries, one per row
+
+    Example:
+        >>> df = pd.DataFrame({"periodo": ["2022", "2023"], "valor": [1.5, 2.0]})
+        >>> dataframe_to_records(df)
+        [{'periodo': '2022', 'valor': 1.5}, {'periodo': '2023', 'valor': 2.0}]
+    """
+    names = tuple(df.columns)
+    if not names:
+        return []
+    if not df.columns.is_unique:
+        warnings.warn(
+            "DataFrame columns are not unique, some columns will be omitted.",
+            UserWarning,
+            stacklevel=2,
+        )
+    # By position, since df[name] is a DataFrame when the label is duplicated
+    columns = [_series_to_list(df.iloc[:, i]) for i in range(len(names))]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def _series_to_list(series: pd.Series) -> list[Any]:
+    """Convert a column to Python objects, as in ``to_dict(orient="records")``."""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+        return series.to_numpy().tolist()
+    return series.astype(object).tolist()
+
+
+def records_to_dataframe(records: list[dict[str, Any]]) -> pd.DataFrame:
+    """Convert a list of row dictionaries to a DataFrame.
+
+    Equivalent to ``pd.DataFrame(records)``, but the column list is worked out
+    here and passed to ``pd.DataFrame.from_records``, which skips pandas'
+    per-row key union. When no row has a key missing from the first row (the
+    usual case for API data), the columns are the first row's keys; otherwise
+    they are every key in order of first appearance.
+
+    Args:
+        records: List of dictionaries, one per row
+
+    Returns:
+        DataFrame with one column per key
+
+    Example:
+        >>> records_to_dataframe([{"periodo": "2023", "valor": 1.5}])
+          periodo  valor
+        0    2023    1.5
+    """
+    if not records:
+        return pd.DataFrame()
+
+    columns = list(records[0])
+    if len(set().union(*records)) != len(columns):
+        columns = list(dict.fromkeys(chain.from_iterable(records)))
+    return pd.DataFrame.from_records(records, columns=columns)
@@ -2,14 +2,53 @@
 
 import json
 import logging
+import math
+from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from pyptine.utils.exceptions import DataProcessingError
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _loads(document: bytes) -> Any:
+    """Parse a JSON document, with orjson when installed.
+
+    orjson rejects the NaN and Infinity literals that the json module writes
+    for non-finite floats, so such documents are handed to json.loads().
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(document)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(document)
+
+
+def _finite_or_none(obj: Any) -> Any:
+    """Return obj with NaN and infinite floats (at any depth) replaced by None.
+
+    orjson writes non-finite floats as null; this gives the json module
+    fallback the same output instead of the invalid NaN/Infinity literals.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(value) for value in obj]
+    return obj
+
+
 def format_json(
     data: Any,
     pretty: bool = True,
@@ -33,6 +72,13 @@ def format_json(
         >>> print(json_str)
     """
     try:
+        # Same conditions as export_to_json(): orjson only indents by 2
+        if ORJSON_AVAILABLE and not ensure_ascii and (not pretty or indent == 2):
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option).decode("utf-8")
+
         if pretty:
             return json.dumps(
                 data,
@@ -54,7 +100,8 @@ def export_to_json(
     pretty: bool = True,
     indent: int = 2,
     ensure_ascii: bool = False,
-) -> None:
+    default: Optional[Callable[[Any], Any]] = None,
+) -> int:
     """Export data to JSON file.
 
     Args:
@@ -63,6 +110,11 @@ def export_to_json(
         pretty: Use pretty printing
         indent: Number of spaces for indentation
         ensure_ascii: Escape non-ASCII characters
+        default: Optional function called for objects that are not natively
+            serializable; it should return a serializable value or raise TypeError
+
+    Returns:
+        Number of bytes written to the file
 
     Raises:
         DataProcessingError: If export fails
@@ -75,20 +127,37 @@ def export_to_json(
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, "w", encoding="utf-8") as f:
+        # orjson only supports 2-space indentation and always emits UTF-8
+        if ORJSON_AVAILABLE and not ensure_ascii and (not pretty or indent == 2):
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
             if pretty:
-                json.dump(
-                    data,
-                    f,
-                    indent=indent,
-                    ensure_ascii=ensure_ascii,
-                    sort_keys=False,
-                )
-            else:
-                json.dump(data, f, ensure_ascii=ensure_ascii)
+                option |= orjson.OPT_INDENT_2
+            payload = orjson.dumps(data, default=default, option=option)
+
+            with open(filepath, "wb") as f:
+                f.write(payload)
+
+            bytes_written = len(payload)
+        else:
+            # json.dumps() can use the C encoder for compact output, whereas
+            # json.dump() always runs the pure-Python iterencode() chunk by chunk
+            options: dict[str, Any] = {"ensure_ascii": ensure_ascii, "default": default}
+            if pretty:
+                options["indent"] = indent
+            try:
+                text = json.dumps(data, allow_nan=False, **options)
+            except ValueError:
+                # Non-finite floats: write them as null, as orjson does
+                text = json.dumps(_finite_or_none(data), **options)
+
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(text)
+                bytes_written = f.tell()
 
         logger.info(f"Exported data to {filepath}")
 
+        return bytes_written
+
     except Exception as e:
         logger.error(f"Failed to export JSON: {str(e)}")
         raise DataProcessingError(f"Failed to export JSON: {str(e)}") from e
@@ -122,10 +191,18 @@ def export_to_jsonl(
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            for item in data:
-                json_line = json.dumps(item, ensure_ascii=ensure_ascii)
-                f.write(json_line + "\n")
+        if ORJSON_AVAILABLE and not ensure_ascii:
+            option = (
+                orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+            )
+            with open(filepath, "wb") as fb:
+                fb.writelines(orjson.dumps(item, option=option) for item in data)
+        else:
+            # One encoder for all lines; json.dumps() builds a new one per call
+            # whenever an option differs from its defaults
+            encode = json.JSONEncoder(ensure_ascii=ensure_ascii).encode
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.writelines(f"{encode(item)}\n" for item in data)
 
         logger.info(f"Exported {len(data)} lines to {filepath}")
 
@@ -142,7 +219,8 @@ def read_jsonl(
 
     Args:
         filepath: JSON Lines file path
-        max_lines: Maximum number of lines to read (None for all)
+        max_lines: Maximum number of lines to read, blank lines included
+            (None for all)
 
     Returns:
         List of dictionaries
@@ -156,13 +234,12 @@ def read_jsonl(
         filepath = Path(filepath)
         data = []
 
-        with open(filepath, encoding="utf-8") as f:
-            for i, line in enumerate(f):
-                if max_lines and i >= max_lines:
-                    break
-
+        # Lines are parsed as bytes, skipping the decode to str, and the file
+        # is read no further than the last line requested
+        with open(filepath, "rb") as f:
+            for line in islice(f, max_lines):
                 if line.strip():
-                    data.append(json.loads(line))
+                    data.append(_loads(line))
 
         logger.debug(f"Read {len(data)} lines from {filepath}")
 
@@ -197,22 +274,35 @@ def flatten_json(
         >>> flattened
         {'indicator': '0004167', 'metadata.source': 'INE', 'metadata.year': 2023}
     """
-    flattened = {}
-
-    for key, value in data.items():
-        new_key = f"{prefix}{separator}{key}" if prefix else key
-
-        if isinstance(value, dict):
-            flattened.update(flatten_json(value, separator, new_key))
-        elif isinstance(value, list):
-            # Convert list to indexed keys
-            for i, item in enumerate(value):
-                if isinstance(item, dict):
-                    flattened.update(flatten_json(item, separator, f"{new_key}[{i}]"))
-                else:
-                    flattened[f"{new_key}[{i}]"] = item
-        else:
+    flattened: dict[str, Any] = {}
+
+    # Depth-first walk with an explicit stack of (key prefix, child iterator,
+    # iterating a list) entries: leaves go straight into the result, in the
+    # same order as a recursive walk, without copying partial results upwards.
+    # Each container's key prefix is built once and extended by one f-string per
+    # child; carrying path tuples and joining them at every leaf is slower for
+    # the wide, shallow documents the API returns.
+    stack: list[tuple[str, Iterator[tuple[Any, Any]], bool]] = [(prefix, iter(data.items()), False)]
+    while stack:
+        base, children, in_list = stack[-1]
+        for key, value in children:
+            if in_list:
+                # Convert list to indexed keys
+                new_key = f"{base}[{key}]"
+            elif base:
+                new_key = f"{base}{separator}{key}"
+            else:
+                new_key = key
+
+            if isinstance(value, dict):
+                stack.append((new_key, iter(value.items()), False))
+                break
+            if isinstance(value, list) and not in_list:
+                stack.append((new_key, enumerate(value), True))
+                break
             flattened[new_key] = value
+        else:
+            stack.pop()
 
     return flattened
 
@@ -291,13 +381,13 @@ def merge_json_files(
         merged_data = []
 
         for filepath in filepaths:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(filepath, "rb") as f:
+                data = _loads(f.read())
 
-                if isinstance(data, list):
-                    merged_data.extend(data)
-                else:
-                    merged_data.append(data)
+            if isinstance(data, list):
+                merged_data.extend(data)
+            else:
+                merged_data.append(data)
 
         # Export merged data
         export_to_json(merged_data, output_path)
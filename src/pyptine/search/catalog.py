@@ -1,6 +1,7 @@
 """Catalogue browsing and search functionality for pyine."""
 
 import logging
+from collections.abc import Iterator
 from typing import Any, Optional
 
 from pyptine.client.catalogue import CatalogueClient
@@ -115,54 +116,154 @@ class CatalogueBrowser:
         if not query and not theme and not subtheme:
             return self.get_all_indicators(progress_callback=progress_callback)
 
-        indicators = self.get_all_indicators(progress_callback=progress_callback)
-        filtered_indicators = []
-
-        for indicator in indicators:
-            # Apply theme filter first
-            if theme is not None:
-                indicator_theme = indicator.theme or ""
-                theme_compare = theme if case_sensitive else theme.lower()
-                indicator_theme_compare = (
-                    indicator_theme if case_sensitive else indicator_theme.lower()
-                )
-                if theme_compare not in indicator_theme_compare:
-                    continue
-
-            # Apply subtheme filter
-            if subtheme is not None:
-                indicator_subtheme = indicator.subtheme or ""
-                subtheme_compare = subtheme if case_sensitive else subtheme.lower()
-                indicator_subtheme_compare = (
-                    indicator_subtheme if case_sensitive else indicator_subtheme.lower()
-                )
-                if subtheme_compare not in indicator_subtheme_compare:
-                    continue
-
-            # Apply query search if query is provided
-            if query:
-                # Default to searching all text fields
-                if search_fields is None:
-                    search_fields = ["title", "description", "keywords", "theme", "subtheme"]
-
-                # Prepare query
-                search_query = query if case_sensitive else query.lower()
-
-                if not self._matches_query(
-                    indicator, search_query, search_fields, case_sensitive, exact_match
-                ):
-                    continue
-            elif query == "" and (theme or subtheme):
-                # If query is empty but theme/subtheme are provided, include all matching theme/subtheme indicators
-                pass
-
-            filtered_indicators.append(indicator)
+        filtered_indicators = list(
+            self.isearch(
+                query,
+                search_fields=search_fields,
+                case_sensitive=case_sensitive,
+                exact_match=exact_match,
+                theme=theme,
+                subtheme=subtheme,
+                progress_callback=progress_callback,
+            )
+        )
 
         logger.debug(
             f"Search for '{query}' with theme '{theme}' found {len(filtered_indicators)} results"
         )
         return filtered_indicators
 
+    def isearch(
+        self,
+        query: str,
+        search_fields: Optional[list[str]] = None,
+        case_sensitive: bool = False,
+        exact_match: bool = False,
+        theme: Optional[str] = None,
+        subtheme: Optional[str] = None,
+        progress_callback: Optional[Any] = None,
+    ) -> Iterator[Indicator]:
+        """Lazily search indicators, yielding matches in catalogue order.
+
+        Takes the same arguments as search(), but stops doing work as soon as
+        the caller stops consuming results.
+
+        Args:
+            query: Search query string
+            search_fields: Fields to search in (default: all text fields)
+            case_sensitive: Perform case-sensitive search
+            exact_match: Require exact match (not substring)
+            theme: Optional theme name to filter by
+            subtheme: Optional subtheme name to filter by
+            progress_callback: Optional callback function(downloaded_bytes, total_bytes)
+
+        Yields:
+            Matching indicators
+
+        Example:
+            >>> from itertools import islice
+            >>> browser = CatalogueBrowser(client)
+            >>> top_five = list(islice(browser.isearch("population"), 5))
+        """
+        if not query:
+            # No text query: only theme/subtheme filters apply
+            yield from self.iter_indicators(
+                theme=theme,
+                subtheme=subtheme,
+                case_sensitive=case_sensitive,
+                progress_callback=progress_callback,
+            )
+            return
+
+        # Default to searching all text fields
+        if search_fields is None:
+            search_fields = ["title", "description", "keywords", "theme", "subtheme"]
+
+        # Prepare query
+        search_query = query if case_sensitive else query.lower()
+
+        for indicator in self.get_all_indicators(progress_callback=progress_callback):
+            # Apply theme/subtheme filters first
+            if not self._matches_theme(indicator, theme, subtheme, case_sensitive):
+                continue
+
+            if self._matches_query(
+                indicator, search_query, search_fields, case_sensitive, exact_match
+            ):
+                yield indicator
+
+    def iter_indicators(
+        self,
+        theme: Optional[str] = None,
+        subtheme: Optional[str] = None,
+        case_sensitive: bool = False,
+        progress_callback: Optional[Any] = None,
+    ) -> Iterator[Indicator]:
+        """Iterate over catalogue indicators, optionally filtered by theme/subtheme.
+
+        Unlike search(), no text matching is performed, and indicators are
+        yielded lazily so callers can stop after the first few.
+
+        Args:
+            theme: Optional theme name to filter by
+            subtheme: Optional subtheme name to filter by
+            case_sensitive: Perform case-sensitive theme/subtheme matching
+            progress_callback: Optional callback function(downloaded_bytes, total_bytes)
+
+        Yields:
+            Indicators in catalogue order
+
+        Example:
+            >>> browser = CatalogueBrowser(client)
+            >>> from itertools import islice
+            >>> first_ten = list(islice(browser.iter_indicators(theme="Population"), 10))
+        """
+        indicators = self.get_all_indicators(progress_callback=progress_callback)
+
+        if theme is None and subtheme is None:
+            yield from indicators
+            return
+
+        for indicator in indicators:
+            if self._matches_theme(indicator, theme, subtheme, case_sensitive):
+                yield indicator
+
+    def _matches_theme(
+        self,
+        indicator: Indicator,
+        theme: Optional[str],
+        subtheme: Optional[str],
+        case_sensitive: bool,
+    ) -> bool:
+        """Check if indicator belongs to the given theme and subtheme.
+
+        Args:
+            indicator: Indicator to check
+            theme: Theme substring to match (None to skip)
+            subtheme: Subtheme substring to match (None to skip)
+            case_sensitive: Case-sensitive matching
+
+        Returns:
+            True if indicator matches both filters
+        """
+        if theme is not None:
+            indicator_theme = indicator.theme or ""
+            if case_sensitive:
+                if theme not in indicator_theme:
+                    return False
+            elif theme.lower() not in indicator_theme.lower():
+                return False
+
+        if subtheme is not None:
+            indicator_subtheme = indicator.subtheme or ""
+            if case_sensitive:
+                if subtheme not in indicator_subtheme:
+                    return False
+            elif subtheme.lower() not in indicator_subtheme.lower():
+                return False
+
+        return True
+
     def _matches_query(
         self,
         indicator: Indicator,
@@ -3,13 +3,7 @@
 Provides methods for creating interactive and static visualizations of indicators.
 """
 
-from pyptine.visualization.charts import (
-    plot_area_chart,
-    plot_bar_chart,
-    plot_indicator,
-    plot_line_chart,
-    plot_scatter_chart,
-)
+from typing import Any
 
 __all__ = [
     "plot_indicator",
@@ -18,3 +12,12 @@ __all__ = [
     "plot_area_chart",
     "plot_scatter_chart",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the chart functions on first access, so plotly loads only when used."""
+    if name in __all__:
+        from pyptine.visualization import charts
+
+        return getattr(charts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,18 +1,23 @@
 """Chart creation functions for indicator data visualization."""
 
+import importlib.util
 import logging
-from typing import Any, Optional, Union
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Optional, Union
 
-try:
-    import plotly.express as px
-
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+# plotly takes a noticeable time to import, so only check that it is installed
+# here and import plotly.express on the first chart (see _lazy_px)
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+px: Optional[ModuleType] = None
 
 try:
+    import numpy as np
     import pandas as pd
 
+    from pyptine.processors.dataframe import records_to_dataframe
+
     PANDAS_AVAILABLE = True
 except ImportError:
     PANDAS_AVAILABLE = False
@@ -20,6 +25,34 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _lazy_px() -> ModuleType:
+    """Import plotly.express on first use and return it."""
+    global px
+    if px is None:
+        import plotly.express
+
+        px = plotly.express
+    return px
+
+
+# Line and scatter charts with more rows than this are drawn with WebGL
+# (Scattergl) traces instead of one SVG node per point
+_WEBGL_MIN_ROWS = 1000
+
+# Layout shared by every chart, as plotly property paths with scalar values.
+# These are constants known to be valid (see test_chart_has_styling), so they
+# are applied with plotly_relayout(), which skips the per-call validation that
+# update_layout() runs; scalar values also keep figures from sharing a font dict.
+_BASE_LAYOUT: Mapping[str, Any] = MappingProxyType(
+    {
+        "plot_bgcolor": "rgba(240, 240, 240, 0.5)",
+        "paper_bgcolor": "white",
+        "font.family": "Arial, sans-serif",
+        "font.size": 12,
+    }
+)
+
+
 def plot_indicator(
     data: Union[list[dict[str, Any]], "pd.DataFrame"],
     title: str = "Indicator Data",
@@ -28,7 +61,7 @@ def plot_indicator(
     chart_type: str = "line",
     color_column: Optional[str] = None,
     **kwargs: Any,
-) -> Optional[Any]:
+) -> Any:
     """Create a visualization of indicator data.
 
     Creates an interactive plotly chart for the given data. Supports multiple
@@ -41,10 +74,12 @@ def plot_indicator(
         y_column: Column name for y-axis values (default: "value")
         chart_type: Type of chart - "line", "bar", "area", "scatter" (default: "line")
         color_column: Optional column to use for coloring by dimension
-        **kwargs: Additional arguments passed to plotly express functions
+        **kwargs: Additional arguments passed to plotly express functions;
+            uirevision sets the layout's uirevision instead (default: title)
 
     Returns:
-        Plotly figure object or None if plotly not available
+        Plotly figure object; for empty data, a new figure without traces that
+        has the title and styling, so it can be customized and shown as usual
 
     Raises:
         ImportError: If plotly or pandas is not installed
@@ -62,58 +97,309 @@ def plot_indicator(
         raise ImportError("pandas is required for visualization. Install with: pip install pandas")
 
     # Convert to DataFrame if needed
-    df = pd.DataFrame(data) if isinstance(data, list) else data.copy()
+    df = records_to_dataframe(data) if isinstance(data, list) else data
 
     if df.empty:
-        logger.warning("Data is empty, cannot create visualization")
-        return None
+        logger.warning("Data is empty, creating an empty chart")
+        return _empty_figure(title, kwargs.get("uirevision", title))
 
     # Validate chart type
-    valid_types = {"line", "bar", "area", "scatter"}
-    if chart_type.lower() not in valid_types:
-        raise ValueError(f"chart_type must be one of {valid_types}, got '{chart_type}'")
-
-    chart_type = chart_type.lower()
-
-    # Create appropriate chart
-    if chart_type == "line":
-        return plot_line_chart(
-            df,
-            title=title,
-            x_column=x_column,
-            y_column=y_column,
-            color_column=color_column,
-            **kwargs,
-        )
-    elif chart_type == "bar":
-        return plot_bar_chart(
-            df,
-            title=title,
-            x_column=x_column,
-            y_column=y_column,
-            color_column=color_column,
-            **kwargs,
-        )
-    elif chart_type == "area":
-        return plot_area_chart(
-            df,
-            title=title,
-            x_column=x_column,
-            y_column=y_column,
-            color_column=color_column,
-            **kwargs,
-        )
-    elif chart_type == "scatter":
-        return plot_scatter_chart(
-            df,
-            title=title,
-            x_column=x_column,
-            y_column=y_column,
-            color_column=color_column,
-            **kwargs,
-        )
-
-    return None
+    chart_function = _CHART_FUNCTIONS.get(chart_type.lower())
+    if chart_function is None:
+        raise ValueError(f"chart_type must be one of {set(_CHART_FUNCTIONS)}, got '{chart_type}'")
+
+    # The frame is built once here; the chart functions use DataFrames as-is
+    return chart_function(
+        df,
+        title=title,
+        x_column=x_column,
+        y_column=y_column,
+        color_column=color_column,
+        **kwargs,
+    )
+
+
+def _empty_figure(title: str, uirevision: Any) -> Any:
+    """Return a new figure without traces, with the chart title and shared styling.
+
+    A new figure is built on every call (about a millisecond) rather than
+    shared, since callers customize the figures they get back.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(layout={"title": {"text": title}})
+    fig.plotly_relayout({**_BASE_LAYOUT, "uirevision": uirevision})
+    return fig
+
+
+def _build_chart(
+    px_function: Callable[..., Any],
+    df: "pd.DataFrame",
+    title: str,
+    x_column: str,
+    y_column: str,
+    hovermode: str,
+    **kwargs: Any,
+) -> Any:
+    """Create a plotly express chart with the shared labels and layout.
+
+    plotly express builds every trace (one per colour group) and adds them to
+    the figure in a single call; the shared layout is then applied in one
+    plotly_relayout() call. The layout's uirevision defaults to the title, so
+    a figure redrawn with the same title (e.g. by a Dash callback) keeps the
+    user's zoom and pan. A text colour column is passed as categorical (see
+    _categorical_colors), so plotly express groups it by integer codes.
+
+    Args:
+        px_function: plotly express function (px.line, px.bar, ...)
+        df: Data to plot
+        title: Chart title
+        x_column: Column for x-axis
+        y_column: Column for y-axis values
+        hovermode: Plotly hover mode for the layout
+        **kwargs: Additional plotly express arguments, plus an optional
+            uirevision for the layout (default: title)
+
+    Returns:
+        Plotly figure object
+    """
+    uirevision = kwargs.pop("uirevision", title)
+    color_column = kwargs.get("color")
+    if isinstance(color_column, str):
+        df = _categorical_colors(df, color_column)
+
+    fig = px_function(
+        df,
+        x=x_column,
+        y=y_column,
+        title=title,
+        labels=_axis_labels(x_column, y_column),
+        **kwargs,
+    )
+
+    fig.plotly_relayout({**_BASE_LAYOUT, "hovermode": hovermode, "uirevision": uirevision})
+
+    return fig
+
+
+def _categorical_colors(df: "pd.DataFrame", color_column: str) -> "pd.DataFrame":
+    """Return df with a text colour column converted to categorical.
+
+    Categories keep the order of first appearance, which is the order plotly
+    express gives the traces of a text column, so the legend is unchanged.
+    Numeric colour columns (drawn with a continuous scale), categorical ones
+    and missing ones are left alone. The caller's DataFrame is not modified.
+
+    Args:
+        df: Data to plot
+        color_column: Column used for trace colours
+
+    Returns:
+        df itself, or a copy with the colour column as categorical
+    """
+    column = df.get(color_column)
+    if not isinstance(column, pd.Series) or isinstance(column.dtype, pd.CategoricalDtype):
+        return df
+    if not (pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column)):
+        return df
+    categories = pd.unique(column.dropna())
+    return df.assign(**{color_column: pd.Categorical(column, categories=categories)})
+
+
+def _m4_downsample(
+    df: "pd.DataFrame", x_column: str, y_column: str, pixel_width: int
+) -> "pd.DataFrame":
+    """Reduce one line to the rows that determine how it is drawn (M4 aggregation).
+
+    The x range is split into pixel_width equal buckets, and only the first,
+    last, minimum and maximum rows of each bucket are kept. Drawn at that
+    width, the reduced line covers the same pixels as the full one, while
+    having at most 4 * pixel_width points. Numeric and datetime x values are
+    bucketed by value; other x values (such as period labels) by row position.
+
+    Args:
+        df: Rows of a single line
+        x_column: Column for x-axis
+        y_column: Column for y-axis values
+        pixel_width: Chart width in pixels
+
+    Returns:
+        The selected rows, in x order, or df itself if it is already small enough
+    """
+    if len(df) <= 4 * pixel_width:
+        return df
+    return df.iloc[_m4_rows(None, df[x_column], df[y_column], pixel_width)]
+
+
+def _m4_rows(
+    codes: Optional["np.ndarray"], x: "pd.Series", y: "pd.Series", pixel_width: int
+) -> "np.ndarray":
+    """Return the positions of the rows kept by M4 aggregation of every line at once.
+
+    Lines are identified by codes (0 to the number of lines - 1). Instead of
+    reducing the lines one by one, the rows are sorted by line and x value
+    once, and each (line, bucket) pair is treated as one run of the sorted
+    rows, so the extremes of all buckets of all lines come from a single
+    reduceat call. Lines with at most 4 * pixel_width rows are kept whole.
+
+    Args:
+        codes: Line of each row, as non-negative integers, or None for a single line
+        x: x values of the rows
+        y: y values of the rows
+        pixel_width: Chart width in pixels
+
+    Returns:
+        Row positions grouped by line in code order, each line in x order
+        (or in its original order when it is kept whole)
+    """
+    xs = _bucket_positions(x)
+    values = pd.to_numeric(y, errors="coerce").to_numpy(dtype=np.float64)
+    small = np.empty(0, dtype=np.intp)
+    if codes is None:
+        order = np.arange(len(values)) if xs is None else _line_order(None, xs)
+        line = None
+        line_starts = np.zeros(1, dtype=np.intp)
+    else:
+        large = np.bincount(codes)[codes] > 4 * pixel_width
+        rows = np.arange(len(codes))
+        if not large.all():
+            rows, small = rows[large], rows[~large]
+        if xs is None:
+            order = rows[np.argsort(codes[rows], kind="stable")]
+        else:
+            order = rows[_line_order(codes[rows], xs[rows])]
+        line = codes[order]
+        line_starts = _run_starts(line)
+
+    line_ends = np.append(line_starts[1:], len(order)) - 1
+    line_sizes = line_ends - line_starts + 1
+    if xs is None:
+        # Position within the line
+        xs = np.arange(len(order), dtype=np.float64)
+        if line is not None:
+            xs -= np.repeat(line_starts, line_sizes)
+    else:
+        xs = xs[order]
+    if line is None:
+        x0, span = xs[0], xs[-1] - xs[0]
+    else:
+        x0 = np.repeat(xs[line_starts], line_sizes)
+        span = np.repeat(xs[line_ends] - xs[line_starts], line_sizes)
+    # Lines without an x range only keep their first and last rows
+    spread = np.isfinite(span) & (span > 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scaled = np.minimum((xs - x0) / span * pixel_width, pixel_width - 1)
+    scaled[~np.broadcast_to(spread, scaled.shape)] = 0
+    buckets = scaled.astype(np.int64)
+    runs = buckets if line is None else line * pixel_width + buckets
+
+    # Runs are non-decreasing along the sorted rows
+    starts = _run_starts(runs)
+    ends = np.append(starts[1:], len(runs)) - 1
+
+    values = values[order]
+    counts = ends - starts + 1
+    selected = np.zeros(len(order), dtype=bool)
+    selected[starts] = selected[ends] = True
+    with np.errstate(invalid="ignore"):
+        for reduce in (np.fmin, np.fmax):
+            # First row of each run holding the run's extreme (none if all NaN);
+            # hits are in row order, so their runs are sorted
+            extreme = np.repeat(reduce.reduceat(values, starts), counts)
+            hits = np.flatnonzero((values == extreme) & spread)
+            selected[hits[_run_starts(runs[hits])]] = True
+
+    kept = order[selected]
+    if line is None or len(small) == 0:
+        return kept
+    kept = np.concatenate([kept, small])
+    return kept[np.argsort(codes[kept], kind="stable")]
+
+
+def _run_starts(values: "np.ndarray") -> "np.ndarray":
+    """Return the positions where a run of equal values starts."""
+    if len(values) == 0:
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+
+
+def _line_order(codes: Optional["np.ndarray"], xs: "np.ndarray") -> "np.ndarray":
+    """Return the permutation sorting rows by line code, then by x value (stable).
+
+    Rows of several lines that are already in that order (each line's rows
+    together, in x order) are detected with one pass and not sorted. Otherwise
+    x is sorted first and the codes, narrowed to 16 bits when possible so
+    NumPy can radix sort them, second, which is faster than np.lexsort on the
+    two keys.
+
+    Args:
+        codes: Line of each row, or None for a single line
+        xs: x values of the rows
+    """
+    if codes is None:
+        return np.argsort(xs, kind="stable")
+    step = np.diff(codes)
+    if (step >= 0).all() and ((np.diff(xs) >= 0) | (step > 0)).all():
+        return np.arange(len(codes))
+    order = np.argsort(xs, kind="stable")
+    if len(codes) and codes.max() < np.iinfo(np.int16).max:
+        codes = codes.astype(np.int16)
+    return order[np.argsort(codes[order], kind="stable")]
+
+
+def _bucket_positions(x: "pd.Series") -> Optional["np.ndarray"]:
+    """Return numeric or datetime x values as float64, or None to bucket by row."""
+    if pd.api.types.is_datetime64_any_dtype(x):
+        values = x.to_numpy(dtype="datetime64[ns]").view(np.int64).astype(np.float64)
+        values[x.isna().to_numpy()] = np.nan
+    elif pd.api.types.is_numeric_dtype(x) and not pd.api.types.is_bool_dtype(x):
+        values = x.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        return None
+    return None if np.isnan(values).any() else values
+
+
+def _downsample_lines(
+    df: "pd.DataFrame",
+    x_column: str,
+    y_column: str,
+    color_column: Optional[str],
+    pixel_width: int,
+) -> "pd.DataFrame":
+    """Apply M4 aggregation to every line of a chart (one per colour group)."""
+    if pixel_width < 1:
+        raise ValueError(f"pixel_width must be a positive integer, got {pixel_width}")
+    if color_column is None:
+        return _m4_downsample(df, x_column, y_column, pixel_width)
+    # Lines in order of first appearance, as plotly express draws them
+    codes, _ = pd.factorize(df[color_column], sort=False, use_na_sentinel=False)
+    if np.bincount(codes).max(initial=0) <= 4 * pixel_width:
+        return df
+    return df.iloc[_m4_rows(codes, df[x_column], df[y_column], pixel_width)]
+
+
+def _render_mode(df: "pd.DataFrame") -> str:
+    """Return the plotly express render mode for a line or scatter chart of df."""
+    return "webgl" if len(df) > _WEBGL_MIN_ROWS else "svg"
+
+
+@lru_cache(maxsize=256)
+def _axis_labels(x_column: str, y_column: str) -> Mapping[str, str]:
+    """Readable axis titles for a column pair ("geo_name" -> "Geo Name"), computed once.
+
+    Args:
+        x_column: Column for x-axis
+        y_column: Column for y-axis values
+
+    Returns:
+        Read-only mapping of column name to axis title
+    """
+    return MappingProxyType(
+        {
+            x_column: x_column.replace("_", " ").title(),
+            y_column: y_column.replace("_", " ").title(),
+        }
+    )
 
 
 def plot_line_chart(
@@ -123,6 +409,7 @@ def plot_line_chart(
     y_column: str = "value",
     color_column: Optional[str] = None,
     markers: bool = True,
+    pixel_width: Optional[int] = None,
     **kwargs: Any,
 ) -> Any:
     """Create an interactive line chart.
@@ -134,7 +421,10 @@ def plot_line_chart(
         y_column: Column for y-axis values
         color_column: Optional column for coloring lines
         markers: Show markers on line points (default: True)
-        **kwargs: Additional plotly express arguments
+        pixel_width: Optional chart width in pixels; when given, each line is
+            reduced to at most 4 points per pixel column (see _m4_downsample)
+        **kwargs: Additional plotly express arguments; pass render_mode="svg"
+            to keep SVG traces for data over 1000 rows, which use WebGL by default
 
     Returns:
         Plotly figure object
@@ -145,29 +435,23 @@ def plot_line_chart(
     if not PLOTLY_AVAILABLE or not PANDAS_AVAILABLE:
         raise ImportError("plotly and pandas are required")
 
-    df = pd.DataFrame(data) if isinstance(data, list) else data.copy()
+    df = records_to_dataframe(data) if isinstance(data, list) else data
+    if pixel_width is not None:
+        df = _downsample_lines(df, x_column, y_column, color_column, pixel_width)
+    kwargs.setdefault("render_mode", _render_mode(df))
 
-    fig = px.line(
+    fig = _build_chart(
+        _lazy_px().line,
         df,
-        x=x_column,
-        y=y_column,
+        title,
+        x_column,
+        y_column,
+        "x unified",
         color=color_column,
-        title=title,
         markers=markers,
-        labels={
-            x_column: x_column.replace("_", " ").title(),
-            y_column: y_column.replace("_", " ").title(),
-        },
         **kwargs,
     )
 
-    fig.update_layout(
-        hovermode="x unified",
-        plot_bgcolor="rgba(240, 240, 240, 0.5)",
-        paper_bgcolor="white",
-        font={"family": "Arial, sans-serif", "size": 12},
-    )
-
     logger.debug(f"Created line chart: {title}")
     return fig
 
@@ -199,28 +483,19 @@ def plot_bar_chart(
     if not PLOTLY_AVAILABLE or not PANDAS_AVAILABLE:
         raise ImportError("plotly and pandas are required")
 
-    df = pd.DataFrame(data) if isinstance(data, list) else data.copy()
+    df = records_to_dataframe(data) if isinstance(data, list) else data
 
-    fig = px.bar(
+    fig = _build_chart(
+        _lazy_px().bar,
         df,
-        x=x_column,
-        y=y_column,
+        title,
+        x_column,
+        y_column,
+        "x",
         color=color_column,
-        title=title,
-        labels={
-            x_column: x_column.replace("_", " ").title(),
-            y_column: y_column.replace("_", " ").title(),
-        },
         **kwargs,
     )
 
-    fig.update_layout(
-        hovermode="x",
-        plot_bgcolor="rgba(240, 240, 240, 0.5)",
-        paper_bgcolor="white",
-        font={"family": "Arial, sans-serif", "size": 12},
-    )
-
     logger.debug(f"Created bar chart: {title}")
     return fig
 
@@ -231,6 +506,7 @@ def plot_area_chart(
     x_column: str = "Period",
     y_column: str = "value",
     color_column: Optional[str] = None,
+    pixel_width: Optional[int] = None,
     **kwargs: Any,
 ) -> Any:
     """Create an interactive area chart.
@@ -241,6 +517,8 @@ def plot_area_chart(
         x_column: Column for x-axis
         y_column: Column for y-axis values
         color_column: Optional column for coloring areas
+        pixel_width: Optional chart width in pixels; when given, each area is
+            reduced to at most 4 points per pixel column (see _m4_downsample)
         **kwargs: Additional plotly express arguments
 
     Returns:
@@ -252,28 +530,21 @@ def plot_area_chart(
     if not PLOTLY_AVAILABLE or not PANDAS_AVAILABLE:
         raise ImportError("plotly and pandas are required")
 
-    df = pd.DataFrame(data) if isinstance(data, list) else data.copy()
+    df = records_to_dataframe(data) if isinstance(data, list) else data
+    if pixel_width is not None:
+        df = _downsample_lines(df, x_column, y_column, color_column, pixel_width)
 
-    fig = px.area(
+    fig = _build_chart(
+        _lazy_px().area,
         df,
-        x=x_column,
-        y=y_column,
+        title,
+        x_column,
+        y_column,
+        "x unified",
         color=color_column,
-        title=title,
-        labels={
-            x_column: x_column.replace("_", " ").title(),
-            y_column: y_column.replace("_", " ").title(),
-        },
         **kwargs,
     )
 
-    fig.update_layout(
-        hovermode="x unified",
-        plot_bgcolor="rgba(240, 240, 240, 0.5)",
-        paper_bgcolor="white",
-        font={"family": "Arial, sans-serif", "size": 12},
-    )
-
     logger.debug(f"Created area chart: {title}")
     return fig
 
@@ -296,7 +567,8 @@ def plot_scatter_chart(
         y_column: Column for y-axis values
         color_column: Optional column for coloring points
         size_column: Optional column for point size
-        **kwargs: Additional plotly express arguments
+        **kwargs: Additional plotly express arguments; pass render_mode="svg"
+            to keep SVG traces for data over 1000 rows, which use WebGL by default
 
     Returns:
         Plotly figure object
@@ -307,28 +579,28 @@ def plot_scatter_chart(
     if not PLOTLY_AVAILABLE or not PANDAS_AVAILABLE:
         raise ImportError("plotly and pandas are required")
 
-    df = pd.DataFrame(data) if isinstance(data, list) else data.copy()
+    df = records_to_dataframe(data) if isinstance(data, list) else data
+    kwargs.setdefault("render_mode", _render_mode(df))
 
-    fig = px.scatter(
+    fig = _build_chart(
+        _lazy_px().scatter,
         df,
-        x=x_column,
-        y=y_column,
+        title,
+        x_column,
+        y_column,
+        "closest",
         color=color_column,
         size=size_column,
-        title=title,
-        labels={
-            x_column: x_column.replace("_", " ").title(),
-            y_column: y_column.replace("_", " ").title(),
-        },
         **kwargs,
     )
 
-    fig.update_layout(
-        hovermode="closest",
-        plot_bgcolor="rgba(240, 240, 240, 0.5)",
-        paper_bgcolor="white",
-        font={"family": "Arial, sans-serif", "size": 12},
-    )
-
     logger.debug(f"Created scatter chart: {title}")
     return fig
+
+
+_CHART_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "line": plot_line_chart,
+    "bar": plot_bar_chart,
+    "area": plot_area_chart,
+    "scatter": plot_scatter_chart,
+}
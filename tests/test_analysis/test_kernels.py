@@ -0,0 +1,261 @@
+"""Tests for the rolling-statistics kernels."""
+
+from fractions import Fraction
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyptine.analysis import _kernels
+
+# True when numba is installed (the speedups extra): the public kernels are
+# then the compiled functions, and the dispatch tests run against them
+COMPILED = _kernels.NUMBA_AVAILABLE
+
+
+@pytest.fixture
+def values():
+    """Series with gaps, including a leading NaN."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(100, 15, 200)
+    data[[0, 17, 18, 90, 150]] = np.nan
+    return data
+
+
+class TestKernels:
+    """Kernels must reproduce pandas rolling/ewm results."""
+
+    @pytest.mark.parametrize("window", [1, 3, 12])
+    def test_moving_average_matches_pandas(self, values, window):
+        """Test moving average against Series.rolling().mean()."""
+        expected = pd.Series(values).rolling(window=window).mean().to_numpy()
+
+        result = _kernels._moving_average(values, window)
+
+        np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+    @pytest.mark.parametrize("window", [3, 12])
+    def test_moving_average_precision_on_large_values(self, window):
+        """Test window means of large values stay exact to float64 rounding."""
+        rng = np.random.default_rng(0)
+        values = 1e12 + rng.integers(0, 1000, 500) + rng.random(500)
+        exact = [
+            float(sum(map(Fraction, values[i - window + 1 : i + 1])) / window)
+            for i in range(window - 1, len(values))
+        ]
+
+        kernels = [lambda array: _kernels._moving_average(array, window)]
+        if window <= _kernels.SMALL_WINDOW_MAX:
+            kernels.append(lambda array: _kernels._small_window_moving_average(array, window))
+        for kernel in kernels:
+            np.testing.assert_allclose(kernel(values)[window - 1 :], exact, rtol=1e-14)
+
+    @pytest.mark.parametrize("window", range(1, _kernels.SMALL_WINDOW_MAX + 1))
+    def test_small_window_moving_average_matches_pandas(self, values, window):
+        """Test the direct-sum kernel against Series.rolling().mean()."""
+        expected = pd.Series(values).rolling(window=window).mean().to_numpy()
+
+        result = _kernels._small_window_moving_average(values, window)
+
+        np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+    @pytest.mark.parametrize("maximum", [False, True])
+    @pytest.mark.parametrize("window", [1, 3, 12])
+    def test_rolling_extremum_matches_pandas(self, values, window, maximum):
+        """Test the monotonic-deque kernel against Series.rolling().min()/.max()."""
+        rolling = pd.Series(values).rolling(window=window)
+        expected = (rolling.max() if maximum else rolling.min()).to_numpy()
+
+        result = _kernels._rolling_extremum(values, window, maximum)
+
+        np.testing.assert_array_equal(result, expected)
+
+    # span=3 (alpha=0.5) is left out: across NaN gaps pandas 3.0 departs from its
+    # documented adjust=False weights for that one alpha, while the kernel follows them
+    @pytest.mark.parametrize("span", [1, 2, 5, 10])
+    def test_exponential_moving_average_matches_pandas(self, values, span):
+        """Test EMA against Series.ewm(adjust=False).mean()."""
+        expected = pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+
+        result = _kernels._exponential_moving_average(values, 2.0 / (span + 1))
+
+        np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+    def test_exponential_moving_average_batch_matches_rows(self, values):
+        """Test the batch kernel against the single-series kernel on each row."""
+        matrix = np.vstack([values, values[::-1], np.full(len(values), np.nan)])
+
+        result = _kernels._exponential_moving_average_batch(matrix, 0.2)
+
+        for row, expected_input in zip(result, matrix):
+            np.testing.assert_array_equal(
+                row, _kernels._exponential_moving_average(expected_input, 0.2)
+            )
+
+    def test_empty_input(self):
+        """Test kernels on empty arrays."""
+        empty = np.array([], dtype=np.float64)
+
+        assert len(_kernels._moving_average(empty, 3)) == 0
+        assert len(_kernels._rolling_extremum(empty, 3, True)) == 0
+        assert len(_kernels._small_window_moving_average(empty, 3)) == 0
+        assert len(_kernels._exponential_moving_average(empty, 0.5)) == 0
+
+
+class TestKernelDispatch:
+    """The DataFrame metrics must give the same results on the kernel path."""
+
+    @pytest.fixture
+    def kernel_path(self, monkeypatch):
+        """Route the metrics through the kernels: compiled with numba, else interpreted."""
+        if COMPILED:
+            return
+        monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", True)
+        monkeypatch.setattr(_kernels, "moving_average", _kernels._moving_average)
+        monkeypatch.setattr(
+            _kernels, "exponential_moving_average", _kernels._exponential_moving_average
+        )
+        monkeypatch.setattr(_kernels, "rolling_extremum", _kernels._rolling_extremum)
+        monkeypatch.setattr(
+            _kernels,
+            "exponential_moving_average_batch",
+            _kernels._exponential_moving_average_batch,
+        )
+
+    def test_metrics_match_pandas_path(self, values, monkeypatch, kernel_path):
+        """Test change, moving average and EMA columns against the pandas implementations."""
+        from pyptine.analysis import metrics
+
+        df = pd.DataFrame({"Period": [f"{i:04d}" for i in range(len(values))], "value": values})
+        calls = (
+            ("yoy_growth", lambda d: metrics.calculate_yoy_growth_df(d)),
+            ("mom_change", lambda d: metrics.calculate_mom_change_df(d)),
+            ("moving_avg", lambda d: metrics.calculate_moving_average_df(d, window=4)),
+            ("ema", lambda d: metrics.calculate_exponential_moving_average_df(d, span=6)),
+        )
+
+        kernel_results = {column: call(df)[column].to_numpy() for column, call in calls}
+        monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+
+        for column, call in calls:
+            np.testing.assert_allclose(
+                kernel_results[column],
+                call(df)[column].to_numpy(dtype=np.float64),
+                rtol=1e-12,
+                equal_nan=True,
+            )
+
+    @pytest.mark.parametrize("window", [2, _kernels.SMALL_WINDOW_MAX + 4])
+    def test_moving_average_windows_match_pandas_path(
+        self, values, monkeypatch, kernel_path, window
+    ):
+        """Test direct-sum and running-sum moving averages against the pandas implementation."""
+        from pyptine.analysis import metrics
+
+        df = pd.DataFrame({"Period": [f"{i:04d}" for i in range(len(values))], "value": values})
+
+        kernel_result = metrics.calculate_moving_average_df(df, window=window)["moving_avg"]
+        monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+        pandas_result = metrics.calculate_moving_average_df(df, window=window)["moving_avg"]
+
+        np.testing.assert_allclose(
+            kernel_result.to_numpy(), pandas_result.to_numpy(), rtol=1e-12, equal_nan=True
+        )
+
+    def test_calculate_metrics_matches_pandas_path(self, values, monkeypatch, kernel_path):
+        """Test the one-pass metrics against the pandas implementations."""
+        from pyptine.analysis import metrics
+
+        df = pd.DataFrame({"Period": [f"P{i:04d}" for i in range(len(values))], "value": values})
+        specs = ["yoy", "mom", "ma:4", "ema:6", "min:5", "max:3"]
+
+        kernel_result = metrics.calculate_metrics_df(df, specs)
+        monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+        pandas_result = metrics.calculate_metrics_df(df, specs)
+
+        for column in metrics.metric_columns(specs):
+            np.testing.assert_allclose(
+                kernel_result[column].to_numpy(dtype=np.float64),
+                pandas_result[column].to_numpy(dtype=np.float64),
+                rtol=1e-12,
+                equal_nan=True,
+            )
+
+    def test_ema_batch_matches_pandas_path(self, values, monkeypatch, kernel_path):
+        """Test batched EMA on both paths, for series of different lengths."""
+        from pyptine.analysis import metrics
+
+        series = [values, values[:50].tolist(), []]
+
+        kernel_result = metrics.calculate_exponential_moving_average_batch(series, span=5)
+        monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+        pandas_result = metrics.calculate_exponential_moving_average_batch(series, span=5)
+
+        assert [len(row) for row in kernel_result] == [len(values), 50, 0]
+        for kernel_row, pandas_row in zip(kernel_result, pandas_result):
+            np.testing.assert_allclose(kernel_row, pandas_row, rtol=1e-12, equal_nan=True)
+
+    def test_infinite_values_match_pandas_path(self, values, monkeypatch, kernel_path):
+        """Test ±inf is treated as missing on the kernel path, as pandas windows do."""
+        from pyptine.analysis import metrics
+
+        values = values.copy()
+        values[[5, 40]] = np.inf
+        values[[6, 120]] = -np.inf
+        df = pd.DataFrame({"Period": [f"P{i:04d}" for i in range(len(values))], "value": values})
+        specs = ["ma:3", "ema:6", "min:4", "max:4"]
+        window = _kernels.SMALL_WINDOW_MAX + 4
+
+        kernel_result = metrics.calculate_metrics_df(df, specs)
+        kernel_long = metrics.calculate_moving_average_df(df, window=window)["moving_avg"]
+        kernel_batch = metrics.calculate_exponential_moving_average_batch([values], span=5)
+        monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+        pandas_result = metrics.calculate_metrics_df(df, specs)
+        pandas_long = metrics.calculate_moving_average_df(df, window=window)["moving_avg"]
+        pandas_batch = metrics.calculate_exponential_moving_average_batch([values], span=5)
+
+        for column in metrics.metric_columns(specs):
+            np.testing.assert_allclose(
+                kernel_result[column], pandas_result[column], rtol=1e-12, equal_nan=True
+            )
+        np.testing.assert_allclose(kernel_long, pandas_long, rtol=1e-12, equal_nan=True)
+        np.testing.assert_allclose(kernel_batch[0], pandas_batch[0], rtol=1e-12, equal_nan=True)
+
+
+@pytest.mark.skipif(not COMPILED, reason="numba not installed")
+class TestCompiledKernels:
+    """The njit-compiled kernels must match their interpreted sources."""
+
+    @pytest.mark.parametrize("window", [1, 3, _kernels.SMALL_WINDOW_MAX, 12])
+    def test_window_kernels(self, values, window):
+        """Test the compiled moving-average and extremum kernels."""
+        np.testing.assert_array_equal(
+            _kernels.moving_average(values, window), _kernels._moving_average(values, window)
+        )
+        if window <= _kernels.SMALL_WINDOW_MAX:
+            np.testing.assert_array_equal(
+                _kernels.small_window_moving_average(values, window),
+                _kernels._small_window_moving_average(values, window),
+            )
+        for maximum in (False, True):
+            np.testing.assert_array_equal(
+                _kernels.rolling_extremum(values, window, maximum),
+                _kernels._rolling_extremum(values, window, maximum),
+            )
+
+    def test_exponential_kernels(self, values):
+        """Test the compiled EMA kernel and the parallel (prange) batch kernel."""
+        matrix = np.vstack([values, values[::-1], np.full(len(values), np.nan)])
+
+        np.testing.assert_allclose(
+            _kernels.exponential_moving_average(values, 0.2),
+            _kernels._exponential_moving_average(values, 0.2),
+            rtol=1e-12,
+            equal_nan=True,
+        )
+        np.testing.assert_allclose(
+            _kernels.exponential_moving_average_batch(matrix, 0.2),
+            _kernels._exponential_moving_average_batch(matrix, 0.2),
+            rtol=1e-12,
+            equal_nan=True,
+        )
@@ -2,17 +2,35 @@
 
 import math
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from pyptine.analysis.metrics import (
+    _percent_change,
+    _period_keys,
     calculate_exponential_moving_average,
+    calculate_exponential_moving_average_batch,
+    calculate_exponential_moving_average_df,
+    calculate_metrics,
+    calculate_metrics_df,
     calculate_mom_change,
+    calculate_mom_change_df,
     calculate_moving_average,
+    calculate_moving_average_df,
+    calculate_moving_max,
+    calculate_moving_max_df,
+    calculate_moving_min,
+    calculate_moving_min_df,
     calculate_yoy_growth,
+    calculate_yoy_growth_df,
+    metric_columns,
 )
 
 
-@pytest.fixture
+# The sample fixtures are module-scoped and shared between tests: the metric
+# functions never modify their input (see TestDataIntegrity), so neither may tests
+@pytest.fixture(scope="module")
 def sample_annual_data():
     """Sample annual data for YoY growth testing."""
     return [
@@ -23,7 +41,7 @@ def sample_annual_data():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_monthly_data():
     """Sample monthly data for MoM change testing."""
     return [
@@ -35,7 +53,7 @@ def sample_monthly_data():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_timeseries_data():
     """Sample time series data for moving average testing."""
     return [
@@ -77,6 +95,59 @@ class TestYoYGrowth:
         assert "yoy_growth" in result[0]
         assert abs(result[2]["yoy_growth"] - 20.0) < 0.01
 
+    def test_yoy_growth_matches_previous_year_period(self, sample_monthly_data):
+        """Test monthly data is compared with the same month of the previous year."""
+        data = sample_monthly_data + [
+            {"Period": "2024-01", "value": 110},
+            {"Period": "2024-03", "value": 121},
+        ]
+
+        result = calculate_yoy_growth(data)
+
+        growth = {row["Period"]: row["yoy_growth"] for row in result}
+        assert all(math.isnan(growth[f"2023-0{month}"]) for month in range(1, 6))
+        assert abs(growth["2024-01"] - 10.0) < 0.01
+        assert abs(growth["2024-03"] - 10.0) < 0.01
+
+    def test_yoy_growth_missing_year_and_fallback(self):
+        """Test a gap in years gives NaN and repeated periods use the preceding row."""
+        gap = calculate_yoy_growth(
+            [
+                {"Period": "2018", "value": 100},
+                {"Period": "2020", "value": 110},
+                {"Period": "2021", "value": 121},
+            ]
+        )
+        assert math.isnan(gap[1]["yoy_growth"])
+        assert abs(gap[2]["yoy_growth"] - 10.0) < 0.01
+
+        repeated = calculate_yoy_growth(
+            [
+                {"Period": "2020", "value": 100},
+                {"Period": "2020", "value": 200},
+                {"Period": "2021", "value": 220},
+            ]
+        )
+        assert abs(repeated[1]["yoy_growth"] - 100.0) < 0.01
+        assert abs(repeated[2]["yoy_growth"] - 10.0) < 0.01
+
+    @pytest.mark.parametrize("dtype", [object, "category"])
+    def test_period_keys(self, dtype):
+        """Test period keys, and that repeated or clashing periods give no keys."""
+
+        def keys(periods):
+            return _period_keys(pd.Series(periods, dtype=dtype))
+
+        assert keys(["2022-12", "2023-01", "2024Q1", "2025"]).tolist() == [
+            202212,
+            202301,
+            202401,
+            202500,
+        ]
+        assert keys(["2023", "2023"]) is None
+        assert keys(["2023-1", "2023-01"]) is None
+        assert keys(["2023", "unknown"]) is None
+
     def test_yoy_growth_empty_data(self):
         """Test YoY growth with empty data."""
         result = calculate_yoy_growth([])
@@ -130,6 +201,20 @@ class TestMoMChange:
             calculate_mom_change(data)
 
 
+class TestPercentChange:
+    """Tests for the vectorized percentage change."""
+
+    def test_matches_pandas(self):
+        """Test against Series.pct_change() * 100, including gaps, zeros and negatives."""
+        values = pd.Series([100.0, 110.0, np.nan, 120.0, 0.0, 0.0, -5.0, 0.0, 3.0, -6.0])
+
+        result = _percent_change(values)
+
+        expected = (values.pct_change() * 100).to_numpy()
+        np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+        assert len(_percent_change(pd.Series([], dtype=float))) == 0
+
+
 class TestMovingAverage:
     """Tests for moving average calculation."""
 
@@ -242,6 +327,140 @@ class TestExponentialMovingAverage:
         with pytest.raises(ValueError):
             calculate_exponential_moving_average(data)
 
+    def test_ema_batch_accepts_missing_values(self):
+        """Test batched EMA treats None in value lists as missing values."""
+        values = [100.0, None, 110, 105.0]
+
+        (result,) = calculate_exponential_moving_average_batch([values], span=2)
+
+        expected = pd.Series([100.0, np.nan, 110.0, 105.0]).ewm(span=2, adjust=False).mean()
+        np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-12)
+
+
+class TestMovingMinMax:
+    """Tests for trailing-window minimum and maximum."""
+
+    def test_moving_min_max_basic(self, sample_timeseries_data):
+        """Test window extrema on the list API."""
+        lows = calculate_moving_min(sample_timeseries_data, window=3)
+        highs = calculate_moving_max(sample_timeseries_data, window=3)
+
+        assert all(math.isnan(row["moving_min"]) for row in lows[:2])
+        assert [row["moving_min"] for row in lows[2:]] == [100, 105, 105, 115]
+        assert [row["moving_max"] for row in highs[2:]] == [110, 120, 120, 125]
+        assert "moving_max" not in lows[0]
+
+    def test_moving_min_max_df_matches_calculate_metrics(self, sample_timeseries_data):
+        """Test the DataFrame functions against the one-pass metrics."""
+        df = pd.DataFrame(sample_timeseries_data)
+        combined = calculate_metrics_df(df, ["min:2", "max:4"])
+
+        pd.testing.assert_series_equal(
+            calculate_moving_min_df(df, window=2)["moving_min"], combined["moving_min"]
+        )
+        pd.testing.assert_series_equal(
+            calculate_moving_max_df(df, window=4)["moving_max"], combined["moving_max"]
+        )
+
+    def test_moving_min_max_invalid_window(self, sample_timeseries_data):
+        """Test window sizes below one are rejected."""
+        with pytest.raises(ValueError):
+            calculate_moving_min(sample_timeseries_data, window=0)
+        with pytest.raises(ValueError):
+            calculate_moving_max_df(pd.DataFrame(sample_timeseries_data), window=0)
+
+    def test_moving_min_max_empty_data(self):
+        """Test window extrema with empty data."""
+        assert calculate_moving_min([]) == []
+        assert calculate_moving_max([]) == []
+
+
+class TestCalculateMetrics:
+    """Tests for multi-metric calculation."""
+
+    def test_matches_chained_calculations(self, sample_timeseries_data):
+        """Test one pass gives the same frame as chaining the single metrics."""
+        df = pd.DataFrame(sample_timeseries_data[::-1])
+
+        chained = calculate_exponential_moving_average_df(
+            calculate_moving_average_df(
+                calculate_mom_change_df(calculate_yoy_growth_df(df)), window=2
+            ),
+            span=4,
+        )
+        result = calculate_metrics_df(df, ["yoy", "mom", "ma:2", "ema:4"])
+
+        pd.testing.assert_frame_equal(result, chained)
+        assert list(df.columns) == ["Period", "value"]
+
+    def test_default_parameters(self, sample_timeseries_data):
+        """Test 'ma' and 'ema' default to a window/span of 3."""
+        df = pd.DataFrame(sample_timeseries_data)
+
+        result = calculate_metrics_df(df, ["ema", "ma"])
+
+        assert list(result.columns) == ["Period", "value", "ema", "moving_avg"]
+        pd.testing.assert_series_equal(
+            result["moving_avg"], calculate_moving_average_df(df)["moving_avg"]
+        )
+
+    def test_rolling_min_max(self):
+        """Test rolling minimum and maximum, including a gap in the values."""
+        df = pd.DataFrame(
+            {"Period": [f"2023-0{m}" for m in range(1, 8)], "value": [5, 3, 4, 8, None, 2, 6]}
+        )
+
+        result = calculate_metrics_df(df, ["min:2", "max"])
+
+        np.testing.assert_array_equal(
+            result["moving_min"].to_numpy(), [np.nan, 3, 3, 4, np.nan, np.nan, 2]
+        )
+        np.testing.assert_array_equal(
+            result["moving_max"].to_numpy(), [np.nan, np.nan, 5, 8, np.nan, np.nan, np.nan]
+        )
+
+    @pytest.mark.parametrize(
+        "specs", [["median"], ["yoy:2"], ["ma:x"], ["ma:0"], ["max:0"], ["ma", "ma:4"]]
+    )
+    def test_invalid_specs(self, sample_timeseries_data, specs):
+        """Test unknown, malformed and repeated metric specs are rejected."""
+        with pytest.raises(ValueError):
+            calculate_metrics_df(pd.DataFrame(sample_timeseries_data), specs)
+
+    def test_non_numeric_values_give_nan(self):
+        """Test metric columns stay float64 NaN when the values are not numeric."""
+        data = [{"Period": f"202{i}", "value": label} for i, label in enumerate("abc")]
+        specs = ["yoy", "mom", "ma:2", "ema:2", "min:2", "max:2"]
+
+        df_result = calculate_metrics_df(pd.DataFrame(data), specs)
+        list_result = calculate_metrics(data, specs)
+
+        for column in metric_columns(specs):
+            assert df_result[column].dtype == np.float64
+            assert df_result[column].isna().all()
+            assert all(math.isnan(row[column]) for row in list_result)
+
+    @pytest.mark.parametrize("dtype", ["float32", "int32", "Int64", "Float64"])
+    def test_other_numeric_dtypes(self, sample_timeseries_data, dtype):
+        """Test narrower and nullable numeric value columns give the float64 results."""
+        specs = ["yoy", "mom", "ma:3", "ema:3", "min:3", "max:3"]
+        df = pd.DataFrame(sample_timeseries_data)
+        expected = calculate_metrics_df(df.astype({"value": "float64"}), specs)
+
+        result = calculate_metrics_df(df.astype({"value": dtype}), specs)
+
+        for column in metric_columns(specs):
+            np.testing.assert_allclose(result[column], expected[column], rtol=1e-6)
+
+    def test_boolean_values_give_nan(self):
+        """Test boolean value columns are not treated as numeric."""
+        df = pd.DataFrame({"Period": ["2021", "2022", "2023"], "value": [True, False, True]})
+
+        result = calculate_metrics_df(df, ["mom", "ma:2"])
+
+        assert result["mom_change"].isna().all()
+        assert result["moving_avg"].isna().all()
+
 
 class TestDataIntegrity:
     """Tests to ensure data integrity during calculations."""
@@ -261,6 +480,23 @@ class TestDataIntegrity:
 
         assert sample_annual_data == original_copy
 
+    def test_rows_keep_caller_values(self):
+        """Test output rows hold the caller's values plus the new column, in period order."""
+        data = [
+            {"Period": "2022", "value": None, "note": "provisional"},
+            {"Period": "2020", "value": 100},
+            {"Period": "2021", "value": 110.0},
+        ]
+
+        result = calculate_mom_change(data)
+
+        assert [row["Period"] for row in result] == ["2020", "2021", "2022"]
+        assert result[0] == {"Period": "2020", "value": 100, "mom_change": result[0]["mom_change"]}
+        assert type(result[0]["value"]) is int
+        assert result[2]["value"] is None and result[2]["note"] == "provisional"
+        assert abs(result[1]["mom_change"] - 10.0) < 0.01
+        assert all("mom_change" not in row for row in data)
+
     def test_chained_calculations(self, sample_annual_data):
         """Test that calculations can be chained."""
         result1 = calculate_yoy_growth(sample_annual_data)
@@ -269,3 +505,27 @@ class TestDataIntegrity:
         assert len(result2) == len(sample_annual_data)
         assert "yoy_growth" in result2[0]
         assert "moving_avg" in result2[0]
+
+    def test_combined_calculations_match_chain(self, sample_annual_data):
+        """Test one multi-metric call returns the same rows as chained calls."""
+        chained = calculate_moving_average(calculate_yoy_growth(sample_annual_data), window=2)
+
+        result = calculate_metrics(sample_annual_data, ["yoy", "ma:2"])
+
+        assert result[1:] == chained[1:]
+        assert list(result[0]) == list(chained[0])
+        assert calculate_metrics([], ["yoy"]) == []
+        with pytest.raises(ValueError):
+            calculate_metrics([], ["median"])
+
+    def test_df_sorting_and_input_untouched(self):
+        """Test unsorted frames are ordered by period and sorted ones are left as-is."""
+        unsorted = pd.DataFrame({"Period": ["2022", "2020", "2021"], "value": [3.0, 1.0, 2.0]})
+        ordered = unsorted.sort_values("Period").reset_index(drop=True)
+
+        for df in (unsorted, ordered):
+            result = calculate_moving_average_df(df, window=2)
+
+            assert result["Period"].tolist() == ["2020", "2021", "2022"]
+            assert result["moving_avg"].tolist()[1:] == [1.5, 2.5]
+            assert "moving_avg" not in df.columns
@@ -1,10 +1,26 @@
 """Tests for async client functionality."""
 
+import asyncio
+import json
+import threading
+
+import httpx
 import pytest
 
 from pyptine.async_ine import AsyncINE
-from pyptine.client.async_data import AsyncDataClient
+from pyptine.client.async_base import AsyncResponseReader
+from pyptine.client.async_data import IJSON_AVAILABLE, AsyncDataClient
+from pyptine.models.indicator import Dimension, DimensionValue, IndicatorMetadata
 from pyptine.models.response import DataResponse
+from pyptine.utils.exceptions import APIError, RateLimitError
+
+# Built once; the tests only read it
+_PERIOD_METADATA = IndicatorMetadata(
+    varcd="0004167",
+    title="Test",
+    language="EN",
+    dimensions=[Dimension(id=1, name="Period", values=[DimensionValue(code="2023", label="2023")])],
+)
 
 
 @pytest.mark.asyncio
@@ -37,6 +53,69 @@ class TestAsyncINEClient:
             assert client.language == "EN"
             assert client.client is not None
 
+    async def test_concurrent_clients_share_http_client(self):
+        """Test clients open at the same time share one HTTP client until the last exits."""
+        async with AsyncINE(language="EN") as first, AsyncINE(language="PT") as second:
+            shared = first.data_client.client
+            assert second.data_client.client is shared
+
+        assert shared.is_closed
+
+        async with AsyncDataClient(language="EN") as client:
+            assert client.client is not shared
+            assert not client.client.is_closed
+
+    @pytest.mark.parametrize("available", [False, True])
+    async def test_http2_enabled_when_h2_installed(self, mocker, available):
+        """Test the shared HTTP client negotiates HTTP/2 only when h2 is importable."""
+        from pyptine.client import async_base
+
+        mocker.patch.object(async_base, "HTTP2_AVAILABLE", available)
+        client_class = mocker.patch.object(async_base.httpx, "AsyncClient")
+        mocker.patch.dict(async_base._CLIENT_POOL, clear=True)
+
+        async_base._acquire_client(12)
+
+        assert client_class.call_args.kwargs["http2"] is available
+
+    async def test_user_agent_override_gets_own_http_client(self):
+        """Test a subclass overriding USER_AGENT sends it instead of sharing the default client."""
+
+        class CustomClient(AsyncDataClient):
+            USER_AGENT = "custom-agent/1.0"
+
+        async with AsyncDataClient(language="EN") as default, CustomClient() as custom:
+            assert custom.client is not default.client
+            assert custom.client.headers["User-Agent"] == "custom-agent/1.0"
+            assert default.client.headers["User-Agent"] == AsyncDataClient.USER_AGENT
+
+    async def test_nested_entry_releases_http_client(self):
+        """Test re-entering an open client keeps it open until the outer block exits."""
+        from pyptine.client import async_base
+
+        client = AsyncDataClient(language="EN")
+        async with client:
+            shared = client.client
+            async with client:
+                assert client.client is shared
+            assert not shared.is_closed
+
+        assert shared.is_closed
+        assert all(pooled is not shared for pooled, _ in async_base._CLIENT_POOL.values())
+
+    async def test_replaced_http_client_does_not_close_shared(self):
+        """Test a client set on one instance is closed without closing the shared one."""
+        async with AsyncDataClient(language="EN") as first:
+            shared = first.client
+            async with AsyncDataClient(language="EN") as second:
+                second.client = httpx.AsyncClient()
+                replacement = second.client
+
+            assert replacement.is_closed
+            assert not shared.is_closed
+
+        assert shared.is_closed
+
 
 @pytest.mark.asyncio
 class TestAsyncDataFetching:
@@ -45,8 +124,9 @@ class TestAsyncDataFetching:
     async def test_async_get_data_mock(self, mocker, sample_data):
         """Test async get_data with mocked HTTP response."""
         # Mock httpx.AsyncClient.get to return awaitable response
-        mock_response = mocker.AsyncMock()
-        mock_response.json = mocker.AsyncMock(return_value=sample_data)
+        mock_response = mocker.Mock()
+        mock_response.content = json.dumps(sample_data).encode()
+        mock_response.json.return_value = sample_data
         mock_response.status_code = 200
 
         mock_client = mocker.AsyncMock()
@@ -61,6 +141,24 @@ class TestAsyncDataFetching:
 
             assert isinstance(response, DataResponse)
             assert response.varcd == "0004167"
+            assert len(response.data) > 0
+
+    async def test_async_large_response_parsed_in_thread(self, mocker, sample_data):
+        """Test responses above the offload threshold are parsed off the event loop."""
+        mocker.patch.object(AsyncDataClient, "PARSE_OFFLOAD_THRESHOLD", 0)
+        mock_response = mocker.Mock()
+        mock_response.content = json.dumps(sample_data).encode()
+        mock_response.status_code = 200
+
+        async with AsyncDataClient(language="EN") as client:
+            client.client = mocker.AsyncMock()
+            client.client.get = mocker.AsyncMock(return_value=mock_response)
+            to_thread = mocker.spy(asyncio, "to_thread")
+
+            response, _, _ = await client._request_data("0004167", {"varcd": "0004167"})
+
+        assert to_thread.call_count == 1
+        assert response.data == client._parse_data_response("0004167", sample_data).data
 
     async def test_async_get_all_data_pagination(self, mocker):
         """Test async get_all_data pagination stops when chunk is incomplete."""
@@ -86,15 +184,15 @@ class TestAsyncDataFetching:
         """Test that async allows multiple concurrent requests."""
         import asyncio
 
-        mock_response = mocker.AsyncMock()
-        mock_response.json = mocker.AsyncMock(
-            return_value={
-                "indicador": "0004167",
-                "nome": "Test",
-                "lang": "EN",
-                "dados": [{"periodo": "2020", "valor": "100"}],
-            }
-        )
+        payload = {
+            "indicador": "0004167",
+            "nome": "Test",
+            "lang": "EN",
+            "dados": [{"periodo": "2020", "valor": "100"}],
+        }
+        mock_response = mocker.Mock()
+        mock_response.content = json.dumps(payload).encode()
+        mock_response.json.return_value = payload
         mock_response.status_code = 200
 
         mock_client = mocker.AsyncMock()
@@ -116,11 +214,271 @@ class TestAsyncDataFetching:
         assert len(results) == 3
         assert all(isinstance(r, DataResponse) for r in results)
 
+    async def test_async_get_all_data_uses_cursor(self, mocker):
+        """Test that get_all_data switches to cursor pagination when offered."""
+        pages = [
+            {
+                "indicador": "0004167",
+                "dados": [{"periodo": "2020", "valor": "1"}, {"periodo": "2021", "valor": "2"}],
+                "next_cursor": "c1",
+            },
+            {"indicador": "0004167", "dados": [{"periodo": "2022", "valor": "3"}]},
+        ]
+
+        async with AsyncDataClient(language="EN") as client:
+            request = mocker.patch.object(
+                client, "_make_request", mocker.AsyncMock(side_effect=pages)
+            )
+            chunks = [chunk async for chunk in client.get_all_data("0004167", chunk_size=2)]
+
+        assert [len(chunk.data) for chunk in chunks] == [2, 1]
+        second_params = request.call_args_list[1].kwargs["params"]
+        assert second_params["cursor"] == "c1"
+        assert "start" not in second_params
+
+    async def test_async_get_all_data_cursor_fallback(self, mocker):
+        """Test that a rejected cursor falls back to offset pagination."""
+        first = {
+            "indicador": "0004167",
+            "dados": [{"periodo": "2020", "valor": "1"}, {"periodo": "2021", "valor": "2"}],
+            "next_cursor": "c1",
+        }
+        last = {"indicador": "0004167", "dados": [{"periodo": "2022", "valor": "3"}]}
+
+        async with AsyncDataClient(language="EN") as client:
+            request = mocker.patch.object(
+                client,
+                "_make_request",
+                mocker.AsyncMock(side_effect=[first, APIError(400, "bad cursor"), last]),
+            )
+            chunks = [chunk async for chunk in client.get_all_data("0004167", chunk_size=2)]
+
+        assert [len(chunk.data) for chunk in chunks] == [2, 1]
+        assert request.call_args_list[2].kwargs["params"]["start"] == "2"
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            RateLimitError(),
+            APIError(500, "server error"),
+            APIError(0, "timeout"),
+            ValueError("bad"),
+        ],
+    )
+    async def test_async_get_all_data_cursor_errors_propagate(self, mocker, error):
+        """Test that only a 4xx rejection of the cursor triggers the offset fallback."""
+        first = {
+            "indicador": "0004167",
+            "dados": [{"periodo": "2020", "valor": "1"}, {"periodo": "2021", "valor": "2"}],
+            "next_cursor": "c1",
+        }
+
+        async with AsyncDataClient(language="EN") as client:
+            request = mocker.patch.object(
+                client, "_make_request", mocker.AsyncMock(side_effect=[first, error])
+            )
+            with pytest.raises(type(error)):
+                _ = [chunk async for chunk in client.get_all_data("0004167", chunk_size=2)]
+
+        assert request.call_count == 2
+
+    async def test_async_get_all_data_prefetch_window(self, mocker):
+        """Test that offset chunks are fetched concurrently but yielded in order."""
+        import asyncio
+
+        inflight = 0
+        max_seen = 0
+
+        async def fake_request(endpoint, params, response_format):
+            nonlocal inflight, max_seen
+            inflight += 1
+            max_seen = max(max_seen, inflight)
+            start = int(params["start"])
+            # Later offsets finish first to exercise ordering
+            await asyncio.sleep(0.01 * (10 - start % 10))
+            inflight -= 1
+            rows = 2 if start < 6 else (1 if start == 6 else 0)
+            return {
+                "indicador": "0004167",
+                "dados": [{"periodo": str(start + i), "valor": "1"} for i in range(rows)],
+            }
+
+        async with AsyncDataClient(language="EN", max_inflight=3) as client:
+            mocker.patch.object(client, "_make_request", side_effect=fake_request)
+            chunks = [chunk async for chunk in client.get_all_data("0004167", chunk_size=2)]
+
+        periods = [point["periodo"] for chunk in chunks for point in chunk.data]
+        assert periods == ["0", "1", "2", "3", "4", "5", "6"]
+        assert max_seen > 1
+
+    async def test_async_get_all_data_uses_total(self, mocker):
+        """Test that a reported total bounds the offsets requested."""
+        requested = []
+
+        async def fake_request(endpoint, params, response_format):
+            start = int(params["start"])
+            requested.append(start)
+            return {
+                "indicador": "0004167",
+                "TotalRegistos": "6",
+                "dados": [{"periodo": str(start + i), "valor": "1"} for i in range(2)],
+            }
+
+        async with AsyncDataClient(language="EN", max_inflight=4) as client:
+            mocker.patch.object(client, "_make_request", side_effect=fake_request)
+            chunks = [chunk async for chunk in client.get_all_data("0004167", chunk_size=2)]
+
+        assert [len(chunk.data) for chunk in chunks] == [2, 2, 2]
+        assert sorted(requested) == [0, 2, 4]
+
+    async def test_async_get_all_dataframe(self, mocker):
+        """Test that chunks are concatenated and their raw rows released."""
+        pages = [
+            {
+                "indicador": "0004167",
+                "dados": [
+                    {"periodo": "2020", "geodsg": "PT", "valor": "1"},
+                    {"periodo": "2020", "geodsg": "PT", "valor": "2"},
+                ],
+            },
+            {"indicador": "0004167", "dados": [{"periodo": "2021", "geodsg": "PT", "valor": "3"}]},
+        ]
+        seen_chunks = []
+
+        async with AsyncDataClient(language="EN") as client:
+            mocker.patch.object(client, "_make_request", mocker.AsyncMock(side_effect=pages))
+            original = client.get_all_data
+
+            async def tracking_get_all_data(*args, **kwargs):
+                async for chunk in original(*args, **kwargs):
+                    seen_chunks.append(chunk)
+                    yield chunk
+
+            mocker.patch.object(client, "get_all_data", tracking_get_all_data)
+            df = await client.get_all_dataframe("0004167", chunk_size=2)
+
+        assert df["value"].tolist() == [1.0, 2.0, 3.0]
+        assert df["periodo"].tolist() == ["2020", "2020", "2021"]
+        assert df["geodsg"].dtype == "category"
+        assert all(not chunk.data for chunk in seen_chunks)
+
+    async def test_parse_envelope_with_legacy_keys(self):
+        """Test an envelope mixing IndicadorCod with older keys parses like _parse_legacy."""
+        client = AsyncDataClient(language="EN")
+        envelope = {
+            "IndicadorCod": "0004167",
+            "IndicadorNome": "Pop",
+            "lang": "PT",
+            "unidade": "N.º",
+            "dados": {"2020": [{"geocod": "PT", "valor": "10298252"}]},
+        }
+
+        parsed = client._parse_data_response("0004167", envelope)
+
+        assert (parsed.title, parsed.language, parsed.unit) == ("Pop", "PT", "N.º")
+        assert parsed.data == client._parse_legacy("0004167", envelope).data
+        assert parsed.data == [{"geocod": "PT", "value": 10298252.0}]
+
+    async def test_parses_like_sync_client(self, sample_data, tmp_path):
+        """Test both clients parse every envelope shape the same way."""
+        from pyptine.client.data import DataClient
+
+        sync_client = DataClient(language="EN", cache_dir=tmp_path)
+        client = AsyncDataClient(language="EN")
+        envelopes = [
+            sample_data,
+            [sample_data],
+            {"IndicadorCod": "0004167", "nome": "Pop", "dados": [{"geocod": "PT", "valor": "1"}]},
+            {"indicador": "0004167", "lang": "PT", "Dados": {"2020": [{"valor": None}]}},
+        ]
+
+        for envelope in envelopes:
+            parsed = client._parse_data_response("0004167", envelope)
+            expected = sync_client._parse_data_response("0004167", envelope)
+            assert parsed.model_dump(exclude={"extraction_date"}) == expected.model_dump(
+                exclude={"extraction_date"}
+            )
+
 
 @pytest.mark.asyncio
 class TestAsyncMetadata:
     """Tests for async metadata operations."""
 
+    async def test_async_max_concurrent_requests(self):
+        """Test that outbound requests are capped by max_concurrent."""
+        inflight = 0
+        max_seen = 0
+
+        async def handler(request):
+            nonlocal inflight, max_seen
+            inflight += 1
+            max_seen = max(max_seen, inflight)
+            await asyncio.sleep(0.01)
+            inflight -= 1
+            return httpx.Response(200, json={"ok": True})
+
+        async with AsyncDataClient(language="EN", max_concurrent=2) as client:
+            await client.client.aclose()
+            client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            await asyncio.gather(*(client._make_request("/test") for _ in range(6)))
+
+        assert max_seen == 2
+
+    async def test_unsupported_response_format(self):
+        """Test an unsupported response format is rejected before any request is sent."""
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        async with AsyncDataClient(language="EN") as client:
+            await client.client.aclose()
+            client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            with pytest.raises(ValueError, match="Unsupported response format"):
+                await client._make_request("/test", response_format="csv")
+
+        assert sent == []
+
+    async def test_async_prefetch_metadata(self, mocker):
+        """Test metadata is fetched alongside the data request and reused for the unit."""
+        metadata_client = mocker.Mock()
+        metadata_client.get_metadata.return_value = IndicatorMetadata(
+            varcd="0004167", title="Resident population", language="EN", unit="No."
+        )
+        payload = {"indicador": "0004167", "dados": [{"periodo": "2020", "valor": "1"}]}
+
+        async with AsyncDataClient(
+            language="EN", metadata_client=metadata_client, prefetch_metadata=True
+        ) as client:
+            mocker.patch.object(client, "_make_request", mocker.AsyncMock(return_value=payload))
+            to_thread = mocker.spy(asyncio, "to_thread")
+
+            first = await client.get_data("0004167")
+            second = await client.get_data("0004167")
+
+        assert first.unit == second.unit == "No."
+        assert metadata_client.get_metadata.call_count == 1
+        assert to_thread.call_count == 1
+
+    async def test_dimension_metadata_loaded_off_event_loop(self, mocker):
+        """Test dimension validation metadata is fetched in a thread, once per indicator."""
+        metadata_client = mocker.Mock()
+        metadata_client.get_metadata.return_value = _PERIOD_METADATA
+        payload = {"indicador": "0004167", "dados": [{"periodo": "2023", "valor": "1"}]}
+
+        async with AsyncDataClient(language="EN", metadata_client=metadata_client) as client:
+            mocker.patch.object(client, "_make_request", mocker.AsyncMock(return_value=payload))
+            to_thread = mocker.spy(asyncio, "to_thread")
+
+            await client.get_data("0004167", dimensions={"Dim1": "2023"})
+            await client.get_data("0004167", dimensions={"Dim1": "2023"})
+
+        assert metadata_client.get_metadata.call_count == 1
+        assert to_thread.call_count == 1
+
     async def test_async_get_metadata(self, mocker, sample_metadata):
         """Test async metadata retrieval."""
         mock_client_obj = mocker.MagicMock()
@@ -177,17 +535,178 @@ class TestAsyncBuildParams:
         """Test dimension parameters with mock metadata."""
         from unittest.mock import MagicMock
 
-        mock_metadata = MagicMock()
         mock_metadata_client = MagicMock()
-        mock_metadata_client.get_metadata.return_value = mock_metadata
-
-        # Add mock dimensions to avoid validation errors
-        mock_dim = MagicMock()
-        mock_dim.id = 1
-        mock_dim.values = [MagicMock(code="2023")]
-        mock_metadata.dimensions = [mock_dim]
+        mock_metadata_client.get_metadata.return_value = _PERIOD_METADATA
 
         async with AsyncDataClient(language="EN", metadata_client=mock_metadata_client) as client:
             params = client._build_params("0004167", dimensions={"Dim1": "2023"})
 
             assert params["Dim1"] == "2023"
+
+    async def test_fetch_chunk_leaves_base_params_unchanged(self):
+        """Test each chunk gets its own page marker without touching the shared params."""
+        async with AsyncDataClient(language="EN") as client:
+            base_params = client._build_params("0004167", limit=50)
+            snapshot = dict(base_params)
+            sent = []
+
+            async def fake_request_data(varcd, params):
+                sent.append(params)
+                return None, None, None
+
+            client._request_data = fake_request_data
+            await client._fetch_chunk("0004167", base_params, offset=100)
+            await client._fetch_chunk("0004167", base_params, cursor="abc")
+
+            assert base_params == snapshot
+            assert sent[0] == {**snapshot, "start": "100"}
+            assert sent[1] == {**snapshot, "cursor": "abc"}
+
+
+@pytest.mark.asyncio
+class TestAsyncConditionalCache:
+    """Tests for ETag/Last-Modified revalidation of cached responses."""
+
+    async def test_revalidation_flow(self, tmp_path, sample_data):
+        """Test fresh hits skip the network and 304 reuses the cached body."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=sample_data, headers={"ETag": '"v1"'})
+
+        async with AsyncDataClient(language="EN", cache_enabled=True, cache_dir=tmp_path) as client:
+            await client.client.aclose()
+            client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            first = await client._make_request(client.DATA_ENDPOINT, {"varcd": "0004167"})
+            fresh = await client._make_request(client.DATA_ENDPOINT, {"varcd": "0004167"})
+            assert seen == [None]
+
+            key = client._cache_key(client.DATA_ENDPOINT, {"varcd": "0004167", "lang": "EN"})
+            client.cache.set(key, client.cache.get(key), ttl=0)
+            revalidated = await client._make_request(client.DATA_ENDPOINT, {"varcd": "0004167"})
+
+        assert seen == [None, '"v1"']
+        assert first == fresh == revalidated == sample_data
+        assert client.cache is None
+
+    async def test_cache_reopened_on_reentry(self, tmp_path):
+        """Test a second ``async with`` on the same client still uses the cache."""
+        client = AsyncDataClient(language="EN", cache_enabled=True, cache_dir=tmp_path)
+        key = client._cache_key(client.DATA_ENDPOINT, {"varcd": "0004167", "lang": "EN"})
+
+        async with client:
+            client.cache.set(key, {"body": b"{}"})
+        assert client.cache is None
+
+        async with client:
+            assert client.cache is not None
+            assert client.cache.get(key)["body"] == b"{}"
+
+    async def test_cache_access_off_event_loop(self, tmp_path, sample_data, mocker):
+        """Test cache lookups and stores run in a worker thread, not the event loop."""
+        threads = []
+
+        async with AsyncDataClient(language="EN", cache_enabled=True, cache_dir=tmp_path) as client:
+            await client.client.aclose()
+            client.client = httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, json=sample_data))
+            )
+            for name in ("get", "set"):
+                original = getattr(client.cache, name)
+
+                def tracking(*args, _original=original, **kwargs):
+                    threads.append(threading.get_ident())
+                    return _original(*args, **kwargs)
+
+                mocker.patch.object(client.cache, name, tracking)
+            await client._make_request(client.DATA_ENDPOINT, {"varcd": "0004167"})
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    async def test_cache_disabled_by_default(self):
+        """Test the client does not create a cache unless asked to."""
+        assert AsyncDataClient(language="EN").cache is None
+
+
+@pytest.mark.asyncio
+class TestAsyncStreamParsing:
+    """Tests for streamed (ijson) response parsing."""
+
+    @staticmethod
+    def _reader(payload: bytes, chunk: int = 7) -> AsyncResponseReader:
+        async def chunks():
+            for i in range(0, len(payload), chunk):
+                yield payload[i : i + chunk]
+
+        return AsyncResponseReader(chunks())
+
+    async def test_response_reader_read(self):
+        """Test the async file-like adapter over body chunks."""
+        reader = self._reader(b'{"a": 1}', chunk=3)
+
+        assert await reader.read(2) == b'{"'
+        assert await reader.read() == b'a": 1}'
+        assert await reader.read(10) == b""
+
+    async def test_response_reader_readinto(self):
+        """Test filling a reused buffer from the reader."""
+        payload = b'{"dados": [1, 2, 3]}'
+        reader = self._reader(payload, chunk=5)
+        buffer = bytearray(4)
+        received = bytearray()
+
+        while size := await reader.readinto(buffer):
+            received += buffer[:size]
+
+        assert bytes(received) == payload
+        assert await reader.read() == b""
+
+    async def test_response_reader_mixed_reads(self):
+        """Test that partial reads and readinto continue from the same offset."""
+        reader = self._reader(b"abcdefghij", chunk=4)
+        buffer = bytearray(3)
+
+        assert await reader.read(1) == b"a"
+        assert await reader.readinto(buffer) == 3
+        assert bytes(buffer) == b"bcd"
+        assert await reader.read(10) == b"efgh"
+        assert await reader.read() == b"ij"
+
+    @pytest.mark.skipif(IJSON_AVAILABLE, reason="ijson installed")
+    async def test_stream_json_requires_ijson(self):
+        """Test that stream_json without ijson raises ImportError."""
+        with pytest.raises(ImportError):
+            AsyncDataClient(language="EN", stream_json=True)
+
+    @pytest.mark.skipif(not IJSON_AVAILABLE, reason="ijson not installed")
+    async def test_stream_parse_matches_buffered(self, sample_data):
+        """Test that streamed parsing yields the same response as json parsing."""
+        envelope = [
+            {
+                "IndicadorCod": "0004167",
+                "IndicadorDsg": "Resident population",
+                "UnidadeMedida": "No.",
+                "Dados": {
+                    "2020": [{"geocod": "PT", "valor": "10298252"}],
+                    "2021": [{"geocod": "PT", "valor": "10421117"}],
+                },
+                "next_cursor": "abc",
+            }
+        ]
+
+        client = AsyncDataClient(language="EN")
+        for payload, expected_cursor in ((envelope, "abc"), (sample_data, None)):
+            expected = client._parse_data_response("0004167", payload)
+            body = self._reader(json.dumps(payload).encode())
+
+            parsed, next_cursor, _ = await client._parse_data_response_stream("0004167", body)
+
+            assert parsed.data == expected.data
+            assert parsed.title == expected.title
+            assert parsed.unit == expected.unit
+            assert next_cursor == expected_cursor
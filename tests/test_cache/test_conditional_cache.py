@@ -0,0 +1,54 @@
+"""Tests for ConditionalCache."""
+
+import time
+
+import pytest
+
+from pyptine.cache.conditional import ConditionalCache
+
+
+@pytest.fixture
+def conditional_cache(temp_cache_dir):
+    """Create ConditionalCache instance."""
+    cache = ConditionalCache(cache_dir=temp_cache_dir)
+    yield cache
+    cache.close()
+
+
+class TestConditionalCache:
+    """Tests for ConditionalCache."""
+
+    def test_set_and_get(self, conditional_cache):
+        """Test storing a body together with its validators."""
+        conditional_cache.set(
+            "key", {"body": b'{"a": 1}', "etag": '"v1"', "last_modified": None}, ttl=60
+        )
+
+        entry = conditional_cache.get("key")
+
+        assert entry["body"] == b'{"a": 1}'
+        assert entry["etag"] == '"v1"'
+        assert entry["last_modified"] is None
+        assert entry["fresh_until"] > time.time()
+        assert conditional_cache.get("missing") is None
+
+    def test_stale_entry_is_kept(self, conditional_cache):
+        """Test stale entries remain available for revalidation."""
+        conditional_cache.set("key", {"body": b"{}", "etag": '"v1"'}, ttl=0)
+
+        entry = conditional_cache.get("key")
+
+        assert entry["fresh_until"] <= time.time()
+        assert entry["etag"] == '"v1"'
+
+    def test_delete_clear_and_size(self, conditional_cache):
+        """Test deleting and clearing entries."""
+        conditional_cache.set("a", {"body": b"1"})
+        conditional_cache.set("b", {"body": b"2"})
+        assert conditional_cache.size() == 2
+
+        assert conditional_cache.delete("a") is True
+        assert conditional_cache.delete("a") is False
+
+        conditional_cache.clear()
+        assert conditional_cache.size() == 0
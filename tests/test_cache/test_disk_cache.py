@@ -127,6 +127,17 @@ class TestDiskCache:
         assert stats["metadata_ttl_seconds"] == disk_cache.metadata_ttl
         assert stats["data_ttl_seconds"] == disk_cache.data_ttl
 
+    def test_directory_size(self, disk_cache, tmp_path):
+        """Test directory size sums regular files in subdirectories and skips symlinks."""
+        root = tmp_path / "sized"
+        (root / "nested" / "deeper").mkdir(parents=True)
+        (root / "a.bin").write_bytes(b"x" * 10)
+        (root / "nested" / "b.bin").write_bytes(b"x" * 20)
+        (root / "nested" / "deeper" / "c.bin").write_bytes(b"x" * 30)
+        (root / "loop").symlink_to(root, target_is_directory=True)
+
+        assert disk_cache._get_directory_size(root) == 60
+
     @responses.activate
     def test_separate_caches_for_metadata_and_data(self, disk_cache):
         """Test that metadata and data use separate caches."""
@@ -157,6 +168,12 @@ class TestDiskCache:
         assert stats["metadata_entries"] > 0
         assert stats["data_entries"] > 0
 
+    def test_write_ahead_log(self, disk_cache):
+        """Test both cache databases use SQLite's write-ahead log."""
+        for session in (disk_cache.get_metadata_session(), disk_cache.get_data_session()):
+            with session.cache.responses.connection() as con:
+                assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
     def test_close(self, temp_cache_dir):
         """Test closing cache sessions."""
         cache = DiskCache(cache_dir=temp_cache_dir)
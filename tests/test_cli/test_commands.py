@@ -6,7 +6,8 @@ from pathlib import Path
 import responses
 from click.testing import CliRunner
 
-from pyptine.cli.main import cli
+from pyptine.cli.main import cli, take_results
+from pyptine.processors.csv import read_csv_with_metadata
 
 
 class TestSearchCommand:
@@ -79,6 +80,24 @@ class TestSearchCommand:
         assert result.exit_code == 1
         assert "No indicators found" in result.output
 
+    def test_take_results_stops_after_limit(self):
+        """Test only one match past the limit is read unless a count is requested."""
+        consumed = []
+
+        def matches():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        assert take_results(matches(), 5, count=False) == ([0, 1, 2, 3, 4], 1)
+        assert len(consumed) == 6
+
+        consumed.clear()
+        assert take_results(matches(), 5, count=True) == ([0, 1, 2, 3, 4], 95)
+        assert len(consumed) == 100
+
+        assert take_results(iter(range(3)), 5, count=False) == ([0, 1, 2], 0)
+
 
 class TestInfoCommand:
     """Tests for info command."""
@@ -163,6 +182,12 @@ class TestDownloadCommand:
         assert output_file.exists()
         assert "Data saved" in result.output
 
+        # Streamed CSV keeps the metadata header and is readable back
+        df, metadata = read_csv_with_metadata(output_file)
+        assert metadata["indicator"] == "0004167"
+        assert "value" in df.columns
+        assert len(df) > 0
+
     @responses.activate
     def test_download_json(self, sample_data, tmp_path):
         """Test download to JSON."""
@@ -243,6 +268,20 @@ class TestDownloadCommand:
         assert result.exit_code == 0
         assert output_file.exists()
 
+    def test_download_invalid_dimension_format(self, tmp_path):
+        """Test that a malformed --dimension exits with code 1."""
+        runner = CliRunner()
+        output_file = tmp_path / "data.csv"
+
+        result = runner.invoke(
+            cli, ["download", "0004167", "--output", str(output_file), "--dimension", "Dim1"]
+        )
+
+        assert result.exit_code == 1
+        assert "Invalid Format" in result.output
+        assert "Unexpected Error" not in result.output
+        assert not output_file.exists()
+
 
 class TestDimensionsCommand:
     """Tests for dimensions command."""
@@ -262,6 +301,8 @@ class TestDimensionsCommand:
 
         assert result.exit_code == 0
         assert "Dim1" in result.output or "Dimensions" in result.output
+        assert "2011 → 2011" in result.output
+        assert "9 → Região Autónoma da Madeira" in result.output
 
 
 class TestListCommands:
@@ -336,6 +377,11 @@ class TestListCommands:
         assert result.exit_code == 0
         assert "Indicators" in result.output
         assert "0004167" in result.output
+        assert "of 1+" in result.output
+
+        result = runner.invoke(cli, ["list-commands", "indicators", "--limit", "1", "--count"])
+
+        assert result.exit_code == 0
         assert "of 2" in result.output  # Assuming sample_catalogue has 2 indicators
 
 
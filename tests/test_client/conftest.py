@@ -0,0 +1,38 @@
+"""Shared fixtures for the HTTP client tests."""
+
+from typing import Callable
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import responses
+from responses import Call
+
+
+@pytest.fixture(scope="module")
+def _module_requests_mock():
+    """Intercept requests for a whole module with one started RequestsMock."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        yield mock
+
+
+@pytest.fixture
+def responses_mock(_module_requests_mock):
+    """Module-wide RequestsMock, emptied of registered responses and calls after each test."""
+    yield _module_requests_mock
+    _module_requests_mock.reset()
+
+
+def _query_params(call: Call) -> dict[str, str]:
+    """Parse the query string of a recorded request into a dictionary."""
+    return dict(parse_qsl(urlsplit(call.request.url).query))
+
+
+@pytest.fixture
+def query_params() -> Callable[[Call], dict[str, str]]:
+    """Return a function parsing a recorded call's query parameters.
+
+    Compare the result as a whole, or a subset of it with
+    ``params.items() >= {...}.items()``, rather than searching the URL for
+    substrings, where ``count=5`` would also match ``count=50``.
+    """
+    return _query_params
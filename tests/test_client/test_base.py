@@ -2,22 +2,29 @@
 
 import pytest
 import responses
+from urllib3.util.retry import Retry
 
 from pyptine.client.base import INEClient
 from pyptine.utils.exceptions import APIError, RateLimitError
 
 
+@pytest.fixture(scope="module")
+def default_client():
+    """One default INEClient, and its session, for the tests that only read it."""
+    client = INEClient()
+    yield client
+    client.close()
+
+
 class TestINEClient:
     """Tests for INEClient base class."""
 
-    def test_initialization_default(self):
+    def test_initialization_default(self, default_client):
         """Test client initialization with defaults."""
-        client = INEClient()
-
-        assert client.language == "EN"
-        assert client.timeout == INEClient.DEFAULT_TIMEOUT
-        assert client.cache_enabled is True
-        assert client.max_retries == INEClient.MAX_RETRIES
+        assert default_client.language == "EN"
+        assert default_client.timeout == INEClient.DEFAULT_TIMEOUT
+        assert default_client.cache_enabled is True
+        assert default_client.max_retries == INEClient.MAX_RETRIES
 
     def test_initialization_custom(self):
         """Test client initialization with custom parameters."""
@@ -33,11 +40,19 @@ class TestINEClient:
         with pytest.raises(ValueError, match="Language must be"):
             INEClient(language="FR")
 
+    def test_shared_disk_cache(self, tmp_path):
+        """Test INE opens one disk cache and shares it between its clients."""
+        from pyptine import INE
+
+        ine = INE(cache_dir=tmp_path)
+
+        assert ine.base_client.cache is not None
+        for client in (ine.catalogue_client, ine.metadata_client, ine.data_client):
+            assert client.cache is ine.base_client.cache
+
     @responses.activate
-    def test_make_request_json_success(self):
+    def test_make_request_json_success(self, default_client):
         """Test successful JSON request."""
-        client = INEClient()
-
         responses.add(
             responses.GET,
             "https://www.ine.pt/test/endpoint",
@@ -45,7 +60,7 @@ class TestINEClient:
             status=200,
         )
 
-        response = client._make_request(
+        response = default_client._make_request(
             "/test/endpoint", params={"param1": "value1"}, response_format="json"
         )
 
@@ -53,10 +68,8 @@ class TestINEClient:
         assert len(responses.calls) == 1
 
     @responses.activate
-    def test_make_request_xml_success(self):
+    def test_make_request_xml_success(self, default_client):
         """Test successful XML request."""
-        client = INEClient()
-
         xml_data = "<?xml version='1.0'?><root><data>test</data></root>"
         responses.add(
             responses.GET,
@@ -65,13 +78,13 @@ class TestINEClient:
             status=200,
         )
 
-        response = client._make_request("/test/endpoint", response_format="xml")
+        response = default_client._make_request("/test/endpoint", response_format="xml")
 
         assert isinstance(response, str)
         assert "test" in response
 
     @responses.activate
-    def test_make_request_adds_language(self):
+    def test_make_request_adds_language(self, query_params):
         """Test that language is added to parameters."""
         client = INEClient(language="PT")
 
@@ -85,56 +98,31 @@ class TestINEClient:
         client._make_request("/test", params={"param1": "value1"})
 
         # Check that lang parameter was added
-        request_url = responses.calls[0].request.url
-        assert "lang=PT" in request_url
-
-    @responses.activate
-    def test_make_request_rate_limit_error(self):
-        """Test handling of rate limit (429) response."""
-        client = INEClient()
-
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/test",
-            status=429,
-        )
-
-        with pytest.raises(RateLimitError, match="Too many requests"):
-            client._make_request("/test")
-
-    @responses.activate
-    def test_make_request_404_error(self):
-        """Test handling of 404 error."""
-        client = INEClient()
-
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/test",
-            status=404,
-        )
-
-        with pytest.raises(APIError, match="Resource not found"):
-            client._make_request("/test")
-
+        assert query_params(responses.calls[0]) == {"param1": "value1", "lang": "PT"}
+
+    @pytest.mark.parametrize(
+        "status, error, match",
+        [
+            (429, RateLimitError, "Too many requests"),
+            (404, APIError, "Resource not found"),
+            (500, APIError, None),
+        ],
+    )
     @responses.activate
-    def test_make_request_500_error(self):
-        """Test handling of server error."""
-        client = INEClient()
-
+    def test_make_request_http_errors(self, status, error, match, default_client):
+        """Test rate limit, not found and server error responses raise the right errors."""
         responses.add(
             responses.GET,
             "https://www.ine.pt/test",
-            status=500,
+            status=status,
         )
 
-        with pytest.raises(APIError):
-            client._make_request("/test")
+        with pytest.raises(error, match=match):
+            default_client._make_request("/test")
 
     @responses.activate
-    def test_make_request_invalid_json(self):
+    def test_make_request_invalid_json(self, default_client):
         """Test handling of invalid JSON response."""
-        client = INEClient()
-
         responses.add(
             responses.GET,
             "https://www.ine.pt/test",
@@ -143,26 +131,15 @@ class TestINEClient:
         )
 
         with pytest.raises(APIError, match="Invalid JSON"):
-            client._make_request("/test", response_format="json")
-
-    def test_unsupported_response_format(self):
-        """Test error on unsupported response format."""
-        client = INEClient()
+            default_client._make_request("/test", response_format="json")
 
-        # Mock a response that won't be called
+    @responses.activate
+    def test_unsupported_response_format(self, default_client):
+        """Test an unsupported response format is rejected before any request is sent."""
         with pytest.raises(ValueError, match="Unsupported response format"):
-            # We need to mock the request itself since _make_request validates format
-            responses.add(
-                responses.GET,
-                "https://www.ine.pt/test",
-                json={"ok": True},
-                status=200,
-            )
-            responses.start()
-            try:
-                client._make_request("/test", response_format="csv")
-            finally:
-                responses.stop()
+            default_client._make_request("/test", response_format="csv")
+
+        assert len(responses.calls) == 0
 
     def test_context_manager(self):
         """Test client works as context manager."""
@@ -180,18 +157,19 @@ class TestINEClient:
         # Session should be closed (though this doesn't raise an error)
         assert session is not None
 
-    def test_session_headers(self):
+    def test_session_headers(self, default_client):
         """Test that session has correct headers."""
-        client = INEClient()
-
-        headers = client.session.headers
+        headers = default_client.session.headers
         assert "User-Agent" in headers
         assert "pyptine" in headers["User-Agent"]
         assert "Accept" in headers
 
     @responses.activate
-    def test_retry_on_500(self):
+    def test_retry_on_500(self, monkeypatch):
         """Test that client retries on 500 errors."""
+        # responses replays retries without backing off; keep it that way should
+        # that change, since the real backoff would sleep for seconds
+        monkeypatch.setattr(Retry, "sleep", lambda self, response=None: None)
         client = INEClient(max_retries=2)
 
         # First two requests fail, third succeeds
@@ -207,6 +185,7 @@ class TestINEClient:
         # Should eventually succeed after retries
         response = client._make_request("/test")
         assert response == {"ok": True}
+        assert len(responses.calls) == 3
 
     def test_language_case_insensitive(self):
         """Test that language parameter is case-insensitive."""
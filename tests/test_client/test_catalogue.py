@@ -1,5 +1,7 @@
 """Tests for CatalogueClient."""
 
+from datetime import datetime
+
 import pytest
 import responses
 
@@ -8,27 +10,54 @@ from pyptine.models.indicator import Indicator
 from pyptine.models.response import CatalogueResponse
 from pyptine.utils.exceptions import APIError, DataProcessingError
 
+CATALOGUE_URL = "https://www.ine.pt/ine/xml_indic.jsp"
 
-@pytest.fixture
+_XML_WITH_DATE = """<?xml version="1.0" encoding="UTF-8"?>
+<catalog>
+    <indicator id="0004167">
+        <varcd>0004167</varcd>
+        <title>Test Indicator</title>
+        <dates>
+            <last_update>14-06-2024</last_update>
+        </dates>
+    </indicator>
+</catalog>
+"""
+
+
+@pytest.fixture(scope="module")
 def catalogue_client():
-    """Create CatalogueClient instance."""
-    return CatalogueClient(language="EN", cache_enabled=False)
+    """Create one CatalogueClient, and its HTTP session, for the whole module."""
+    client = CatalogueClient(language="EN", cache_enabled=False)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="module")
+def sample_catalogue_response(catalogue_client, sample_catalogue):
+    """CatalogueResponse for the sample catalogue, parsed once for the module.
+
+    For tests of the response object itself; tests of the client keep going
+    through HTTP and the XML parser.
+    """
+    indicators = catalogue_client._parse_catalogue_xml(sample_catalogue)
+    return CatalogueResponse(indicators=indicators, language="EN", total_count=len(indicators))
+
+
+@pytest.fixture
+def catalogue_endpoint(responses_mock, sample_catalogue):
+    """Serve the sample catalogue from the catalogue endpoint; yields the mock."""
+    responses_mock.add(
+        responses.GET, CATALOGUE_URL, body=sample_catalogue, status=200, content_type="text/xml"
+    )
+    return responses_mock
 
 
 class TestCatalogueClient:
     """Tests for CatalogueClient."""
 
-    @responses.activate
-    def test_get_indicator_success(self, catalogue_client, sample_catalogue):
+    def test_get_indicator_success(self, catalogue_endpoint, catalogue_client):
         """Test successful single indicator retrieval."""
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
-            body=sample_catalogue,
-            status=200,
-            content_type="text/xml",
-        )
-
         indicator = catalogue_client.get_indicator("0004167")
 
         assert isinstance(indicator, Indicator)
@@ -36,101 +65,50 @@ class TestCatalogueClient:
         assert indicator.title is not None
         assert indicator.theme is not None
 
-    @responses.activate
-    def test_get_indicator_verifies_params(self, catalogue_client, sample_catalogue):
+    def test_get_indicator_verifies_params(
+        self, catalogue_endpoint, catalogue_client, query_params
+    ):
         """Test that get_indicator sends correct parameters."""
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
-            body=sample_catalogue,
-            status=200,
-        )
-
         catalogue_client.get_indicator("0004167")
 
         # Verify request parameters
-        assert len(responses.calls) == 1
-        request_url = responses.calls[0].request.url
-        assert "opc=1" in request_url  # Single indicator
-        assert "varcd=0004167" in request_url
-        assert "lang=EN" in request_url
-
-    @responses.activate
-    def test_get_main_indicators(self, catalogue_client, sample_catalogue):
-        """Test retrieving main indicators group."""
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
-            body=sample_catalogue,
-            status=200,
-        )
+        assert len(catalogue_endpoint.calls) == 1
+        params = query_params(catalogue_endpoint.calls[0])
+        # opc=1 selects a single indicator
+        assert params.items() >= {"opc": "1", "varcd": "0004167", "lang": "EN"}.items()
 
+    def test_get_main_indicators(self, catalogue_endpoint, catalogue_client):
+        """Test retrieving main indicators group."""
         indicators = catalogue_client.get_main_indicators()
 
         assert isinstance(indicators, list)
         assert len(indicators) == 2  # Sample fixture has 2 indicators
         assert all(isinstance(ind, Indicator) for ind in indicators)
 
-    @responses.activate
-    def test_get_main_indicators_verifies_params(self, catalogue_client, sample_catalogue):
+    def test_get_main_indicators_verifies_params(
+        self, catalogue_endpoint, catalogue_client, query_params
+    ):
         """Test that get_main_indicators sends correct parameters."""
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
-            body=sample_catalogue,
-            status=200,
-        )
-
         catalogue_client.get_main_indicators()
 
         # Verify request parameters
-        request_url = responses.calls[0].request.url
-        assert "opc=3" in request_url  # Main indicators group
+        assert query_params(catalogue_endpoint.calls[0])["opc"] == "3"  # Main indicators group
 
-    @responses.activate
-    def test_get_catalogue_response_single(self, catalogue_client, sample_catalogue):
-        """Test get_catalogue_response for single indicator."""
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
-            body=sample_catalogue,
-            status=200,
-        )
-
-        response = catalogue_client.get_catalogue_response(varcd="0004167")
+    @pytest.mark.parametrize("varcd, expected_count", [("0004167", 1), (None, 2)])
+    def test_get_catalogue_response(
+        self, catalogue_endpoint, catalogue_client, varcd, expected_count
+    ):
+        """Test get_catalogue_response for a single indicator and for all indicators."""
+        response = catalogue_client.get_catalogue_response(varcd=varcd)
 
         assert isinstance(response, CatalogueResponse)
-        assert response.total_count == 1
-        assert len(response) == 1
+        assert response.total_count == expected_count
+        assert len(response) == expected_count
         assert response.language == "EN"
 
-    @responses.activate
-    def test_get_catalogue_response_all(self, catalogue_client, sample_catalogue):
-        """Test get_catalogue_response for all indicators."""
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
-            body=sample_catalogue,
-            status=200,
-        )
-
-        response = catalogue_client.get_catalogue_response()
-
-        assert isinstance(response, CatalogueResponse)
-        assert response.total_count == 2
-        assert len(response) == 2
-
-    @responses.activate
-    def test_catalogue_response_iteration(self, catalogue_client, sample_catalogue):
+    def test_catalogue_response_iteration(self, sample_catalogue_response):
         """Test iterating over CatalogueResponse."""
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
-            body=sample_catalogue,
-            status=200,
-        )
-
-        response = catalogue_client.get_catalogue_response()
+        response = sample_catalogue_response
 
         # Test iteration
         for indicator in response:
@@ -139,16 +117,17 @@ class TestCatalogueClient:
         # Test indexing
         assert isinstance(response[0], Indicator)
 
-    @responses.activate
-    def test_parse_indicator_fields(self, catalogue_client, sample_catalogue):
-        """Test parsing of all indicator fields from XML."""
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
-            body=sample_catalogue,
-            status=200,
-        )
+    def test_catalogue_response_to_dataframe(self, sample_catalogue_response):
+        """Test converting CatalogueResponse to a DataFrame."""
+        response = sample_catalogue_response
+        df = response.to_dataframe()
+
+        assert list(df.columns) == list(Indicator.model_fields)
+        assert df["varcd"].tolist() == [indicator.varcd for indicator in response]
+        assert df.iloc[0].to_dict() == response[0].model_dump()
 
+    def test_parse_indicator_fields(self, catalogue_endpoint, catalogue_client):
+        """Test parsing of all indicator fields from XML."""
         indicator = catalogue_client.get_indicator("0004167")
 
         # Check all expected fields
@@ -163,14 +142,13 @@ class TestCatalogueClient:
         assert indicator.metadata_url is not None
         assert indicator.data_url is not None
 
-    @responses.activate
-    def test_invalid_xml(self, catalogue_client):
+    def test_invalid_xml(self, responses_mock, catalogue_client):
         """Test handling of invalid XML response."""
         invalid_xml = "<broken><xml"
 
-        responses.add(
+        responses_mock.add(
             responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
+            CATALOGUE_URL,
             body=invalid_xml,
             status=200,
         )
@@ -178,8 +156,7 @@ class TestCatalogueClient:
         with pytest.raises(DataProcessingError, match="Invalid XML"):
             catalogue_client.get_indicator("0004167")
 
-    @responses.activate
-    def test_empty_xml_response(self, catalogue_client):
+    def test_empty_xml_response(self, responses_mock, catalogue_client):
         """Test handling of empty XML response."""
         empty_xml = """<?xml version="1.0" encoding="UTF-8"?>
         <diffgr:diffgram xmlns:msdata="urn:schemas-microsoft-com:xml-msdata"
@@ -189,9 +166,9 @@ class TestCatalogueClient:
         </diffgr:diffgram>
         """
 
-        responses.add(
+        responses_mock.add(
             responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
+            CATALOGUE_URL,
             body=empty_xml,
             status=200,
         )
@@ -199,43 +176,26 @@ class TestCatalogueClient:
         with pytest.raises(DataProcessingError, match="not found in catalogue"):
             catalogue_client.get_indicator("0004167")
 
-    @responses.activate
-    def test_api_error_handling(self, catalogue_client):
+    def test_api_error_handling(self, responses_mock, catalogue_client):
         """Test handling of API errors."""
-        responses.add(
+        responses_mock.add(
             responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
+            CATALOGUE_URL,
             status=500,
         )
 
         with pytest.raises(APIError):
             catalogue_client.get_indicator("0004167")
 
-    @responses.activate
-    def test_datetime_parsing(self, catalogue_client):
+    def test_datetime_parsing(self, responses_mock, catalogue_client):
         """Test parsing of last_update datetime field."""
-        xml_with_date = """<?xml version="1.0" encoding="UTF-8"?>
-        <catalog>
-            <indicator id="0004167">
-                <varcd>0004167</varcd>
-                <title>Test Indicator</title>
-                <dates>
-                    <last_update>14-06-2024</last_update>
-                </dates>
-            </indicator>
-        </catalog>
-        """
-
-        responses.add(
+        responses_mock.add(
             responses.GET,
-            "https://www.ine.pt/ine/xml_indic.jsp",
-            body=xml_with_date,
+            CATALOGUE_URL,
+            body=_XML_WITH_DATE,
             status=200,
         )
 
         indicator = catalogue_client.get_indicator("0004167")
 
-        assert indicator.last_update is not None
-        assert indicator.last_update.year == 2024
-        assert indicator.last_update.month == 6
-        assert indicator.last_update.day == 14
+        assert indicator.last_update == datetime(2024, 6, 14)
@@ -1,65 +1,98 @@
 """Tests for DataClient."""
 
-from unittest.mock import MagicMock
+import json
+from typing import Callable
 
 import pytest
 import responses
+from pydantic import ValidationError
 
+from pyptine.client._points import process_data_points
 from pyptine.client.data import DataClient
-from pyptine.client.metadata import MetadataClient
 from pyptine.models.indicator import Dimension, DimensionValue, IndicatorMetadata
-from pyptine.models.response import DataResponse
+from pyptine.models.response import DataPoint, DataResponse
 from pyptine.utils.exceptions import APIError, DimensionError
 
-
-@pytest.fixture
+_SAMPLE_METADATA = IndicatorMetadata(
+    varcd="0004167",
+    title="Resident population",
+    language="EN",
+    dimensions=[
+        Dimension(
+            id=1,
+            name="Period",
+            values=[
+                DimensionValue(code="2020", label="2020"),
+                DimensionValue(code="2021", label="2021"),
+                DimensionValue(code="2023", label="2023"),
+            ],
+        ),
+        Dimension(
+            id=2,
+            name="Geographic localization",
+            values=[
+                DimensionValue(code="1", label="Portugal"),
+                DimensionValue(code="2", label="North"),
+            ],
+        ),
+    ],
+)
+
+
+class _StubMetadataClient:
+    """Stands in for MetadataClient, which DataClient only asks for metadata."""
+
+    def __init__(self, metadata: IndicatorMetadata):
+        self.metadata = metadata
+        self.call_count = 0
+
+    def get_metadata(self, varcd: str) -> IndicatorMetadata:
+        self.call_count += 1
+        return self.metadata
+
+
+def _serve_pages(*pages: dict) -> Callable:
+    """Build a responses callback returning the given pages in order.
+
+    Each page is serialized once up front; the callback hands out the next
+    ready-made body per request.
+    """
+    bodies = iter([json.dumps(page) for page in pages])
+    return lambda request: (200, {"Content-Type": "application/json"}, next(bodies))
+
+
+@pytest.fixture(scope="module")
 def metadata_client_mock():
-    """Mock MetadataClient instance."""
-    mock = MagicMock(spec=MetadataClient)
-    # Configure the mock to return a sample IndicatorMetadata
-    mock.get_metadata.return_value = IndicatorMetadata(
-        varcd="0004167",
-        title="Resident population",
-        language="EN",
-        dimensions=[
-            Dimension(
-                id=1,
-                name="Period",
-                values=[
-                    DimensionValue(code="2020", label="2020"),
-                    DimensionValue(code="2021", label="2021"),
-                    DimensionValue(code="2023", label="2023"),
-                ],
-            ),
-            Dimension(
-                id=2,
-                name="Geographic localization",
-                values=[
-                    DimensionValue(code="1", label="Portugal"),
-                    DimensionValue(code="2", label="North"),
-                ],
-            ),
-        ],
-    )
-    return mock
+    """Stub MetadataClient returning the sample IndicatorMetadata."""
+    return _StubMetadataClient(_SAMPLE_METADATA)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def data_client(metadata_client_mock):
-    """Create DataClient instance."""
-    return DataClient(language="EN", cache_enabled=False, metadata_client=metadata_client_mock)
+    """Create one DataClient, and its HTTP session, for the whole module."""
+    client = DataClient(language="EN", cache_enabled=False, metadata_client=metadata_client_mock)
+    yield client
+    client.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_data_client(data_client, metadata_client_mock):
+    """Give every test an empty metadata cache and a fresh stub call count."""
+    yield
+    data_client.clear_metadata_cache()
+    metadata_client_mock.call_count = 0
 
 
 class TestDataClient:
     """Tests for DataClient."""
 
-    @responses.activate
-    def test_get_data_success(self, data_client, sample_data):
+    def test_get_data_success(self, responses_mock, data_client, sample_data_json):
         """Test successful data retrieval."""
-        responses.add(
+        responses_mock.add(
             responses.GET,
             "https://www.ine.pt/ine/json_indicador/pindica.jsp",
-            json=sample_data,
+            body=sample_data_json,
+            content_type="application/json",
             status=200,
         )
 
@@ -70,13 +103,15 @@ class TestDataClient:
         assert response.language == "EN"
         assert len(response.data) > 0
 
-    @responses.activate
-    def test_get_data_with_dimensions(self, data_client, sample_data):
+    def test_get_data_with_dimensions(
+        self, responses_mock, data_client, sample_data_json, query_params
+    ):
         """Test data retrieval with dimension filters."""
-        responses.add(
+        responses_mock.add(
             responses.GET,
             "https://www.ine.pt/ine/json_indicador/pindica.jsp",
-            json=sample_data,
+            body=sample_data_json,
+            content_type="application/json",
             status=200,
         )
 
@@ -87,24 +122,22 @@ class TestDataClient:
         assert response.varcd == "0004167"
 
         # Verify the request was made with correct parameters
-        assert len(responses.calls) == 1
-        request_params = responses.calls[0].request.url
-        assert "Dim1=2023" in request_params
-        assert "Dim2=1" in request_params
+        assert len(responses_mock.calls) == 1
+        params = query_params(responses_mock.calls[0])
+        assert params.items() >= dimensions.items()
 
-    @responses.activate
     def test_invalid_dimension_key(self, data_client, metadata_client_mock):
         """Test error handling for invalid dimension keys."""
         with pytest.raises(DimensionError, match="Invalid dimension key 'Dim3'"):
             data_client._build_params("0004167", {"Dim3": "value"})
 
-    @responses.activate
-    def test_data_to_dataframe(self, data_client, sample_data):
+    def test_data_to_dataframe(self, responses_mock, data_client, sample_data_json):
         """Test converting data response to DataFrame."""
-        responses.add(
+        responses_mock.add(
             responses.GET,
             "https://www.ine.pt/ine/json_indicador/pindica.jsp",
-            json=sample_data,
+            body=sample_data_json,
+            content_type="application/json",
             status=200,
         )
 
@@ -115,13 +148,108 @@ class TestDataClient:
         assert len(df) == len(response.data)
         assert not df.empty
 
-    @responses.activate
-    def test_get_data_paginated(self, data_client, sample_data):
+    def test_to_dataframe_dtypes(self):
+        """Test that to_dataframe assigns explicit dtypes."""
+        response = DataResponse(
+            varcd="0004167",
+            title="Test",
+            language="EN",
+            data=[
+                {"Period": "2020", "geodsg": "Portugal", "value": 1},
+                {"Period": "2020", "geodsg": "Norte", "value": None},
+                {"Period": "2021", "geodsg": "Portugal", "value": 2.5, "extra": "x"},
+                {"Period": "2021", "geodsg": "Norte", "value": "n/a"},
+            ],
+        )
+
+        df = response.to_dataframe()
+
+        assert list(df.columns) == ["Period", "geodsg", "value", "extra"]
+        assert df["value"].dtype == "float64"
+        assert df["Period"].dtype != "category"
+        assert df["geodsg"].dtype != "category"
+        assert df["value"].isna().tolist() == [False, True, False, True]
+        assert df["Period"].tolist() == ["2020", "2020", "2021", "2021"]
+        assert df["extra"].isna().tolist() == [True, True, False, True]
+
+        # Only the internal frame stores the repetitive labels as categoricals
+        assert response._get_df()["Period"].cat.categories.tolist() == ["2020", "2021"]
+
+        df.loc[0, "geodsg"] = "Algarve"
+        assert response.to_dataframe()["geodsg"].tolist()[0] == "Portugal"
+
+    def test_to_json_matches_model_dump(self, tmp_path):
+        """Test that to_json writes the same document as model_dump(mode='json')."""
+        response = DataResponse(
+            varcd="0004167",
+            title="População",
+            language="PT",
+            data=[{"Period": "2020", "value": 1.5}, {"Period": "2021", "value": None}],
+            unit="No.",
+        )
+        expected = response.model_dump(mode="json")
+
+        # Default options use orjson when installed; ensure_ascii forces stdlib json
+        for name, options in (("fast", {}), ("ascii", {"ensure_ascii": True})):
+            output = tmp_path / f"{name}.json"
+            bytes_written = response.to_json(output, **options)
+
+            assert bytes_written == output.stat().st_size
+            with open(output, encoding="utf-8") as f:
+                assert json.load(f) == expected
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_to_json_writes_nan_as_null(self, tmp_path, monkeypatch, orjson_available):
+        """Test NaN metric values are written as null, with and without orjson."""
+        from pyptine.processors import json as json_module
+
+        response = DataResponse(
+            varcd="0004167",
+            title="Test",
+            language="EN",
+            data=[{"Period": "2020", "value": 100.0}, {"Period": "2021", "value": 110.0}],
+        ).calculate_yoy_growth()
+        monkeypatch.setattr(
+            json_module, "ORJSON_AVAILABLE", json_module.ORJSON_AVAILABLE and orjson_available
+        )
+
+        for name, options in (("default", {}), ("ascii", {"ensure_ascii": True})):
+            output = tmp_path / f"{name}.json"
+            response.to_json(output, **options)
+            text = output.read_text(encoding="utf-8")
+
+            assert "NaN" not in text
+            assert json.loads(text) == response.model_dump(mode="json")
+
+    def test_to_csv_matches_dataframe_export(self, tmp_path):
+        """Test that the row-based CSV export writes the same data as the DataFrame one."""
+        response = DataResponse(
+            varcd="0004167",
+            title="Test",
+            language="EN",
+            data=[
+                {"Period": "2020", "geodsg": "Lisboa, PT", "value": 1.5},
+                {"Period": "2020", "geodsg": "Norte", "value": None},
+                {"Period": "2021", "geodsg": "Norte", "value": float("nan")},
+                {"Period": "2021", "value": 2.0},
+            ],
+        )
+
+        rows_file = tmp_path / "rows.csv"
+        response.to_csv(rows_file, include_metadata=False)
+        response.to_dataframe()
+        frame_file = tmp_path / "frame.csv"
+        response.to_csv(frame_file, include_metadata=False)
+
+        assert rows_file.read_bytes() == frame_file.read_bytes()
+
+    def test_get_data_paginated(self, responses_mock, data_client, sample_data_json):
         """Test paginated data retrieval."""
-        responses.add(
+        responses_mock.add(
             responses.GET,
             "https://www.ine.pt/ine/json_indicador/pindica.jsp",
-            json=sample_data,
+            body=sample_data_json,
+            content_type="application/json",
             status=200,
         )
 
@@ -130,12 +258,11 @@ class TestDataClient:
         assert len(chunks) >= 1
         assert all(isinstance(chunk, DataResponse) for chunk in chunks)
 
-    @responses.activate
-    def test_process_data_point_with_numeric_value(self, data_client):
+    def test_process_data_point_with_numeric_value(self):
         """Test processing data point with numeric value."""
         data_point = {"periodo": "2023", "geocod": "1", "geodsg": "Portugal", "valor": "10639726"}
 
-        processed = data_client._process_data_point(data_point)
+        [processed] = process_data_points([data_point])
 
         assert processed is not None
         assert "value" in processed
@@ -143,23 +270,49 @@ class TestDataClient:
         assert processed["value"] == 10639726.0
         assert processed["periodo"] == "2023"
 
-    @responses.activate
-    def test_process_data_point_with_null_value(self, data_client):
+    def test_process_data_point_with_null_value(self):
         """Test processing data point with null value."""
         data_point = {"periodo": "2023", "valor": None}
 
-        processed = data_client._process_data_point(data_point)
+        [processed] = process_data_points([data_point])
 
         assert processed is not None
         assert "value" in processed
         assert processed["value"] is None
 
-    @responses.activate
-    def test_empty_data_response(self, data_client):
+    def test_process_data_points_mixed_layouts(self):
+        """Test processing points with varying key layouts, bad values and non-dicts."""
+        data_array = [
+            {"periodo": "2023", "geocod": "1", "valor": "10639726", "_id": 7},
+            {"periodo": "2022", "valor": None},
+            {"periodo": "2021", "valor": "x"},
+            {"periodo": "2020", "value": 1.5},
+            {"_only": "internal"},
+            {},
+            {"geocod": "2", "periodo": "2019", "_id": 8, "valor": "3"},
+            {"periodo": "2018", "geocod": "3", "valor": 4.0, "_id": 9},
+            "not a point",
+        ]
+
+        expected = [
+            {"periodo": "2023", "geocod": "1", "value": 10639726.0},
+            {"periodo": "2022", "value": None},
+            {"periodo": "2021", "value": None},
+            {"periodo": "2020", "value": 1.5},
+            {"geocod": "2", "periodo": "2019", "value": 3.0},
+            {"periodo": "2018", "geocod": "3", "value": 4.0},
+        ]
+        bulk = process_data_points(data_array)
+
+        assert bulk == expected
+        assert [list(point) for point in bulk] == [list(point) for point in expected]
+        assert bulk[2]["value"] is None
+
+    def test_empty_data_response(self, responses_mock, data_client):
         """Test handling of empty data response."""
         empty_response = {"indicador": "0004167", "nome": "Test", "lang": "EN", "dados": []}
 
-        responses.add(
+        responses_mock.add(
             responses.GET,
             "https://www.ine.pt/ine/json_indicador/pindica.jsp",
             json=empty_response,
@@ -174,10 +327,9 @@ class TestDataClient:
         df = response.to_dataframe()
         assert df.empty
 
-    @responses.activate
-    def test_api_error_handling(self, data_client):
+    def test_api_error_handling(self, responses_mock, data_client):
         """Test handling of API errors."""
-        responses.add(
+        responses_mock.add(
             responses.GET,
             "https://www.ine.pt/ine/json_indicador/pindica.jsp",
             status=500,
@@ -195,7 +347,6 @@ class TestDataClient:
         assert "varcd" in params
         assert params["varcd"] == "0004167"
 
-    @responses.activate
     def test_invalid_dimension_value(self, data_client, metadata_client_mock):
         """Test error handling for invalid dimension values."""
         with pytest.raises(DimensionError, match="Invalid value '9999' for dimension 'Dim1'"):
@@ -233,13 +384,32 @@ class TestDataClient:
         assert params["count"] == "1000"
         assert "start" not in params
 
-    @responses.activate
-    def test_get_all_data_single_chunk(self, data_client, sample_data):
+    def test_metadata_cached_across_validations(
+        self, data_client, metadata_client_mock, monkeypatch
+    ):
+        """Test that metadata is fetched once and reused until the TTL expires."""
+        for _ in range(3):
+            data_client._build_params("0004167", {"Dim1": "2023", "Dim2": "1"})
+
+        assert metadata_client_mock.call_count == 1
+
+        # Expire the cached entry
+        monkeypatch.setattr(data_client, "METADATA_CACHE_TTL", 0)
+        data_client.validate_dimensions("0004167", {"Dim1": "2020"})
+        assert metadata_client_mock.call_count == 2
+
+        data_client.clear_metadata_cache()
+        assert data_client._metadata_cache == {}
+
+    def test_get_all_data_single_chunk(
+        self, responses_mock, data_client, sample_data_json, query_params
+    ):
         """Test pagination with a single chunk (less than chunk_size)."""
-        responses.add(
+        responses_mock.add(
             responses.GET,
             "https://www.ine.pt/ine/json_indicador/pindica.jsp",
-            json=sample_data,
+            body=sample_data_json,
+            content_type="application/json",
             status=200,
         )
 
@@ -247,42 +417,30 @@ class TestDataClient:
 
         assert len(chunks) == 1
         assert isinstance(chunks[0], DataResponse)
-        assert len(responses.calls) == 1
-        assert "start=0" in responses.calls[0].request.url
-        assert "count=40000" in responses.calls[0].request.url
+        assert len(responses_mock.calls) == 1
+        params = query_params(responses_mock.calls[0])
+        assert params.items() >= {"start": "0", "count": "40000"}.items()
 
-    @responses.activate
-    def test_get_all_data_multiple_chunks(self, data_client):
+    def test_get_all_data_multiple_chunks(self, responses_mock, data_client, query_params):
         """Test pagination with multiple chunks."""
-        # Create two chunks of data
-        chunk1_data = {
-            "indicador": "0004167",
-            "nome": "Population",
-            "lang": "EN",
-            "dados": [{"periodo": f"202{i}", "valor": f"1000{i}"} for i in range(5)],
-        }
-
-        chunk2_data = {
-            "indicador": "0004167",
-            "nome": "Population",
-            "lang": "EN",
-            "dados": [{"periodo": f"202{i}", "valor": f"2000{i}"} for i in range(3)],
-        }
-
-        # First request returns full chunk
-        responses.add(
+        # A full chunk followed by a partial chunk (indicating end)
+        responses_mock.add_callback(
             responses.GET,
             "https://www.ine.pt/ine/json_indicador/pindica.jsp",
-            json=chunk1_data,
-            status=200,
-        )
-
-        # Second request returns partial chunk (indicating end)
-        responses.add(
-            responses.GET,
-            "https://www.ine.pt/ine/json_indicador/pindica.jsp",
-            json=chunk2_data,
-            status=200,
+            callback=_serve_pages(
+                {
+                    "indicador": "0004167",
+                    "nome": "Population",
+                    "lang": "EN",
+                    "dados": [{"periodo": f"202{i}", "valor": f"1000{i}"} for i in range(5)],
+                },
+                {
+                    "indicador": "0004167",
+                    "nome": "Population",
+                    "lang": "EN",
+                    "dados": [{"periodo": f"202{i}", "valor": f"2000{i}"} for i in range(3)],
+                },
+            ),
         )
 
         chunks = list(data_client.get_all_data("0004167", chunk_size=5))
@@ -293,18 +451,18 @@ class TestDataClient:
         assert len(chunks[1].data) == 3
 
         # Verify pagination parameters in requests
-        assert "start=0" in responses.calls[0].request.url
-        assert "count=5" in responses.calls[0].request.url
-        assert "start=5" in responses.calls[1].request.url
-        assert "count=5" in responses.calls[1].request.url
+        pages = [query_params(call) for call in responses_mock.calls]
+        assert [(page["start"], page["count"]) for page in pages] == [("0", "5"), ("5", "5")]
 
-    @responses.activate
-    def test_get_all_data_with_dimensions(self, data_client, sample_data):
+    def test_get_all_data_with_dimensions(
+        self, responses_mock, data_client, sample_data_json, query_params
+    ):
         """Test pagination with dimension filters."""
-        responses.add(
+        responses_mock.add(
             responses.GET,
             "https://www.ine.pt/ine/json_indicador/pindica.jsp",
-            json=sample_data,
+            body=sample_data_json,
+            content_type="application/json",
             status=200,
         )
 
@@ -313,8 +471,103 @@ class TestDataClient:
 
         assert len(chunks) >= 1
         # Verify dimensions are included in request
-        request_url = responses.calls[0].request.url
-        assert "Dim1=2023" in request_url
-        assert "Dim2=1" in request_url
-        assert "start=0" in request_url
-        assert "count=100" in request_url
+        params = query_params(responses_mock.calls[0])
+        assert params.items() >= {**dimensions, "start": "0", "count": "100"}.items()
+
+    def test_get_all_data_validates_dimensions_once(
+        self, responses_mock, data_client, mocker, query_params
+    ):
+        """Test that dimensions are validated once per pagination run, not per chunk."""
+        responses_mock.add_callback(
+            responses.GET,
+            "https://www.ine.pt/ine/json_indicador/pindica.jsp",
+            callback=_serve_pages(
+                *(
+                    {"indicador": "0004167", "dados": [{"periodo": "2020", "valor": "1"}] * count}
+                    for count in (2, 2, 1)
+                )
+            ),
+        )
+        validate_spy = mocker.spy(data_client, "validate_dimensions")
+
+        chunks = list(
+            data_client.get_all_data("0004167", dimensions={"Dim1": "2020"}, chunk_size=2)
+        )
+
+        assert [len(chunk.data) for chunk in chunks] == [2, 2, 1]
+        assert validate_spy.call_count == 1
+        pages = [query_params(call) for call in responses_mock.calls]
+        assert [(page["start"], page["Dim1"]) for page in pages] == [
+            ("0", "2020"),
+            ("2", "2020"),
+            ("4", "2020"),
+        ]
+
+    def test_parse_canonical_envelope(self, data_client):
+        """Test the fast path for the canonical response envelope."""
+        envelope = {
+            "IndicadorCod": "0004167",
+            "IndicadorDsg": "Resident population",
+            "Lingua": "EN",
+            "UnidadeMedida": "No.",
+            "Dados": {
+                "2020": [{"geocod": "PT", "valor": "10298252"}],
+                "2021": [{"geocod": "PT", "valor": "10421117"}, {"geocod": "1", "valor": None}],
+            },
+        }
+
+        for payload in (envelope, [envelope]):
+            parsed = data_client._parse_data_response("0004167", payload)
+
+            assert parsed.title == "Resident population"
+            assert parsed.unit == "No."
+            assert [point["value"] for point in parsed.data] == [10298252.0, 10421117.0, None]
+            assert parsed.data == data_client._parse_legacy("0004167", payload).data
+
+    def test_parse_envelope_with_legacy_keys(self, data_client):
+        """Test an envelope mixing IndicadorCod with older keys parses like _parse_legacy."""
+        envelope = {
+            "IndicadorCod": "0004167",
+            "IndicadorNome": "Pop",
+            "lang": "PT",
+            "unidade": "N.º",
+            "dados": {"2020": [{"geocod": "PT", "valor": "10298252"}]},
+        }
+
+        parsed = data_client._parse_data_response("0004167", envelope)
+        legacy = data_client._parse_legacy("0004167", envelope)
+
+        assert (parsed.title, parsed.language, parsed.unit) == ("Pop", "PT", "N.º")
+        assert parsed.data == legacy.data == [{"geocod": "PT", "value": 10298252.0}]
+
+    def test_build_data_response_keeps_rows(self, data_client):
+        """Test processed rows are attached as-is while scalar fields are validated."""
+        rows = [{"Period": "2020", "geocod": "PT", "value": 1.0}]
+
+        response = data_client._build_data_response("0004167", "0004167", "T", "EN", "No.", rows)
+
+        assert response.data is rows
+        with pytest.raises(ValidationError):
+            data_client._build_data_response("0004167", None, "T", "EN", "No.", rows)
+
+    def test_iter_points(self):
+        """Test lazy DataPoint iteration over response rows."""
+        response = DataResponse(
+            varcd="0004167",
+            title="Test",
+            language="EN",
+            data=[{"Period": "2020", "geodsg": "Portugal", "value": 1.5}, {"Period": "2021"}],
+            unit="No.",
+        )
+
+        points = list(response.iter_points())
+
+        assert [point.value for point in points] == [1.5, None]
+        assert points[0].dimensions == {"Period": "2020", "geodsg": "Portugal"}
+        assert points[1].unit == "No."
+        assert points[0] == DataPoint(
+            value=1.5, dimensions={"Period": "2020", "geodsg": "Portugal"}, unit="No."
+        )
+        assert response.data[0]["value"] == 1.5
+        with pytest.raises(ValidationError):
+            points[0].value = 2.0
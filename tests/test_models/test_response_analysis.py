@@ -205,3 +205,119 @@ class TestChainedAnalysis:
         assert len(df) == len(sample_response.data)
         assert "yoy_growth" in df.columns
         assert "Period" in df.columns
+
+    def test_chain_keeps_extraction_date(self, sample_monthly_response):
+        """Test derived responses reuse the source timestamp instead of taking a new one."""
+        result = (
+            sample_monthly_response.calculate_yoy_growth()
+            .calculate_mom_change()
+            .calculate_moving_average(window=2)
+            .calculate_exponential_moving_average(span=2)
+        )
+
+        assert result.extraction_date is sample_monthly_response.extraction_date
+
+    def test_calculate_metrics_matches_chain(self, sample_monthly_response):
+        """Test calculate_metrics() gives the same data as the chained methods."""
+        chained = sample_monthly_response.calculate_mom_change().calculate_moving_average(window=2)
+
+        result = sample_monthly_response.calculate_metrics(["mom", "ma:2"])
+
+        assert result.varcd == sample_monthly_response.varcd
+        assert result.to_dataframe().equals(chained.to_dataframe())
+
+    def test_analysis_shares_dataframe(self, sample_response, mocker):
+        """Test that chained analysis reuses the DataFrame instead of rebuilding it."""
+        build_spy = mocker.spy(DataResponse, "_build_dataframe")
+        result = sample_response.calculate_yoy_growth().calculate_moving_average(window=2)
+        df = result.to_dataframe()
+
+        # Only the original data is converted; later steps reuse the cached frame
+        assert build_spy.call_count == 1
+        assert list(df["moving_avg"].isna()) == [True, False, False, False]
+
+        # to_dataframe() hands out a copy, so the cache stays intact
+        df["value"] = 0
+        assert result.to_dataframe()["value"].tolist() == [100, 110, 120, 132]
+
+    def test_analysis_records_match_dataframe(self, sample_response):
+        """Test that derived responses expose the same rows as DataFrame.to_dict."""
+        result = sample_response.calculate_yoy_growth()
+        expected = result.to_dataframe().to_dict(orient="records")
+
+        assert result.data[1:] == expected[1:]
+        assert result.data[0]["Period"] == "2020"
+        assert all(type(row["value"]) is float for row in result.data)
+
+    def test_chained_records_match_dataframe(self, sample_monthly_response):
+        """Test rows extended column by column in a chain match the final frame."""
+        sample_monthly_response.data = sample_monthly_response.data[::-1]
+
+        result = (
+            sample_monthly_response.calculate_moving_average(window=2)
+            .calculate_mom_change()
+            .calculate_moving_average(window=3)
+        )
+        expected = result.to_dataframe().to_dict(orient="records")
+
+        assert [row["Period"] for row in result.data] == [row["Period"] for row in expected]
+        assert result.data[2:] == expected[2:]
+        assert list(result.data[0]) == ["Period", "value", "moving_avg", "mom_change"]
+
+    def test_dataframe_cache_invalidation(self, sample_response):
+        """Test the cached DataFrame follows changes to data."""
+        assert len(sample_response.to_dataframe()) == 4
+
+        sample_response.data.append({"Period": "2024", "value": 140, "region": "PT"})
+        assert len(sample_response.to_dataframe()) == 5
+
+        sample_response.data = sample_response.data[:2]
+        assert sample_response.to_dataframe()["Period"].tolist() == ["2020", "2021"]
+
+        sample_response.data[0]["value"] = 0
+        sample_response.clear_dataframe_cache()
+        assert sample_response.to_dataframe()["value"].tolist() == [0, 110]
+
+    def test_repeated_analysis_reuses_result(self, sample_response, mocker):
+        """Test repeating a calculation reuses its result until the data changes."""
+        from pyptine.analysis import metrics
+
+        ema_spy = mocker.spy(metrics, "calculate_exponential_moving_average_df")
+
+        first = sample_response.calculate_exponential_moving_average(span=2)
+        second = sample_response.calculate_exponential_moving_average(span=2)
+        sample_response.calculate_exponential_moving_average(span=3)
+
+        assert ema_spy.call_count == 2
+        assert second is not first
+        assert second.data == first.data
+
+        # Rows returned by one call are not shared with the next
+        second.data[0]["ema"] = 0
+        assert first.data[0]["ema"] != 0
+
+        sample_response.data = sample_response.data[:2]
+        result = sample_response.calculate_exponential_moving_average(span=2)
+
+        assert ema_spy.call_count == 3
+        assert len(result.data) == 2
+
+    def test_dataframe_with_ragged_rows(self):
+        """Test rows missing keys, or adding new ones, keep first-appearance column order."""
+        response = DataResponse(
+            varcd="0000001",
+            title="Ragged",
+            language="EN",
+            data=[
+                {"Period": "2020", "value": 1.0},
+                {"Period": "2021"},
+                {"Period": "2022", "value": 3.0, "region": "PT"},
+            ],
+        )
+
+        df = response.to_dataframe()
+
+        assert list(df.columns) == ["Period", "value", "region"]
+        assert df["value"].isna().tolist() == [False, True, False]
+        assert df["region"].tolist()[2] == "PT"
+        assert next(response.iter_csv_rows()) == ["Period", "value", "region"]
@@ -2,15 +2,10 @@
 
 import pytest
 
-try:
-    import plotly.graph_objects as go
-
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
-
 from pyptine.models.response import DataResponse
 
+go = pytest.importorskip("plotly.graph_objects")
+
 
 @pytest.fixture
 def sample_response():
@@ -48,7 +43,6 @@ def sample_response_multiregion():
     )
 
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestDataResponsePlot:
     """Tests for DataResponse.plot() method."""
 
@@ -99,7 +93,6 @@ class TestDataResponsePlot:
         assert isinstance(fig, go.Figure)
 
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestDataResponsePlotLine:
     """Tests for DataResponse.plot_line() method."""
 
@@ -130,7 +123,6 @@ class TestDataResponsePlotLine:
         assert isinstance(fig, go.Figure)
 
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestDataResponsePlotBar:
     """Tests for DataResponse.plot_bar() method."""
 
@@ -148,7 +140,6 @@ class TestDataResponsePlotBar:
         assert isinstance(fig, go.Figure)
 
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestDataResponsePlotArea:
     """Tests for DataResponse.plot_area() method."""
 
@@ -166,7 +157,6 @@ class TestDataResponsePlotArea:
         assert isinstance(fig, go.Figure)
 
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestDataResponsePlotScatter:
     """Tests for DataResponse.plot_scatter() method."""
 
@@ -199,7 +189,6 @@ class TestDataResponsePlotScatter:
         assert isinstance(fig, go.Figure)
 
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestPlotCustomization:
     """Tests for plot customization options."""
 
@@ -227,3 +216,58 @@ class TestPlotCustomization:
         fig = yoy_response.plot(y_column="yoy_growth", chart_type="bar")
 
         assert isinstance(fig, go.Figure)
+
+    def test_plots_share_one_dataframe(self, sample_response_multiregion, monkeypatch):
+        """Test every plot method reuses the memoized DataFrame instead of rebuilding it."""
+        builds = []
+        build_dataframe = DataResponse._build_dataframe
+
+        def counting_build(self):
+            builds.append(1)
+            return build_dataframe(self)
+
+        monkeypatch.setattr(DataResponse, "_build_dataframe", counting_build)
+        response = sample_response_multiregion
+
+        response.plot(color_column="region")
+        response.plot_line(color_column="region")
+        response.plot_bar(color_column="region")
+        response.plot_area(color_column="region")
+        fig = response.plot_scatter(color_column="region")
+
+        assert len(builds) == 1
+        assert [trace.name for trace in fig.data] == ["North", "South"]
+        assert list(fig.data[1].y) == [150, 160, 170]
+
+    def test_repeated_plot_draws_once(self, sample_response_multiregion, mocker):
+        """Test repeating a plot copies the stored figure instead of drawing it again."""
+        from pyptine.visualization import charts
+
+        draw = mocker.spy(charts, "plot_line_chart")
+        response = sample_response_multiregion
+
+        first = response.plot_line(color_column="region")
+        first.update_layout(title="Edited")
+        second = response.plot_line(color_column="region")
+
+        assert draw.call_count == 1
+        assert second is not first
+        assert second.layout.title.text == "Regional Population"
+        assert [trace.name for trace in second.data] == ["North", "South"]
+        assert list(second.data[1].y) == [150, 160, 170]
+
+        response.plot_line(color_column="region", markers=False)
+        response.data = response.data[:2]
+        response.plot_line(color_column="region")
+
+        assert draw.call_count == 3
+
+    def test_plot_with_unhashable_arguments(self, sample_response_multiregion):
+        """Test plots whose arguments cannot be used as a key are drawn each time."""
+        orders = {"region": ["South", "North"]}
+
+        first = sample_response_multiregion.plot_bar(color_column="region", category_orders=orders)
+        second = sample_response_multiregion.plot_bar(color_column="region", category_orders=orders)
+
+        assert [trace.name for trace in first.data] == ["South", "North"]
+        assert [trace.name for trace in second.data] == ["South", "North"]
@@ -3,13 +3,15 @@
 import json
 
 import pandas as pd
+import pytest
 
-from pyptine.processors.csv import export_to_csv, read_csv_with_metadata
+from pyptine.processors.csv import export_rows_to_csv, export_to_csv, read_csv_with_metadata
 from pyptine.processors.json import (
     export_to_json,
     export_to_jsonl,
     flatten_json,
     format_json,
+    merge_json_files,
     read_jsonl,
     unflatten_json,
 )
@@ -37,9 +39,10 @@ class TestCSVExport:
         output = tmp_path / "test_meta.csv"
         metadata = {"indicator": "0004167", "source": "INE"}
 
-        export_to_csv(df, output, metadata=metadata)
+        bytes_written = export_to_csv(df, output, metadata=metadata)
 
         assert output.exists()
+        assert bytes_written == output.stat().st_size
 
         # Check file content includes metadata
         with open(output) as f:
@@ -47,6 +50,45 @@ class TestCSVExport:
             assert "indicator" in content
             assert "0004167" in content
 
+    def test_metadata_header_layout(self, tmp_path):
+        """Test the comment header lists non-empty metadata between separator lines."""
+        output = tmp_path / "test_header.csv"
+
+        export_to_csv(pd.DataFrame({"value": [1]}), output, metadata={"a": 1, "b": None, "c": "x"})
+
+        lines = output.read_text(encoding="utf-8-sig").splitlines()
+        assert lines[0] == "# INE Portugal Data Export"
+        assert lines[1].startswith("# Generated: ")
+        assert lines[2:6] == ["#", "# a: 1", "# c: x", "#"]
+        assert lines[6:] == ["value", "1"]
+
+    @pytest.mark.parametrize(
+        "encoding, prefix",
+        [
+            ("utf-8-sig", b"\xef\xbb\xbfname"),
+            ("UTF-8-SIG", b"\xef\xbb\xbfname"),
+            ("utf-8", b"name"),
+        ],
+    )
+    def test_byte_order_mark(self, tmp_path, encoding, prefix):
+        """Test both CSV writers emit one byte order mark only for utf-8-sig."""
+        frame_output = tmp_path / "frame.csv"
+        rows_output = tmp_path / "rows.csv"
+
+        export_to_csv(
+            pd.DataFrame({"name": ["Região"]}),
+            frame_output,
+            include_metadata=False,
+            encoding=encoding,
+        )
+        export_rows_to_csv(
+            [["name"], ["Região"]], rows_output, include_metadata=False, encoding=encoding
+        )
+
+        expected = prefix + "\r\nRegião\r\n".encode()
+        assert rows_output.read_bytes() == expected
+        assert frame_output.read_bytes().replace(b"\r\n", b"\n") == expected.replace(b"\r\n", b"\n")
+
     def test_read_csv_with_metadata(self, tmp_path):
         """Test reading CSV with metadata."""
         df = pd.DataFrame({"value": [1, 2, 3]})
@@ -62,6 +104,18 @@ class TestCSVExport:
         assert "indicator" in meta_read
         assert meta_read["indicator"] == "0004167"
 
+    @pytest.mark.parametrize("include_metadata", [True, False])
+    def test_read_csv_keeps_hash_in_values(self, tmp_path, include_metadata):
+        """Test values containing "#" survive a round trip, with or without a header."""
+        df = pd.DataFrame({"geodsg": ["Lisboa #1", "Porto"], "value": [1.0, 2.0]})
+        output = tmp_path / "test_hash.csv"
+
+        export_to_csv(df, output, include_metadata=include_metadata, metadata={"a": "1"})
+        df_read, meta_read = read_csv_with_metadata(output)
+
+        pd.testing.assert_frame_equal(df_read, df)
+        assert meta_read == ({"a": "1"} if include_metadata else {})
+
     def test_utf8_encoding(self, tmp_path):
         """Test UTF-8 encoding for Portuguese characters."""
         df = pd.DataFrame({"região": ["Norte", "Sul"], "população": [1000, 2000]})
@@ -73,6 +127,29 @@ class TestCSVExport:
         df_read = pd.read_csv(output)
         assert "região" in df_read.columns
 
+    def test_export_rows_streaming(self, tmp_path):
+        """Test streaming row export with metadata and progress reporting."""
+        rows = [["Period", "value"]] + [[str(2000 + i), float(i)] for i in range(25)]
+        output = tmp_path / "test_rows.csv"
+        progress = []
+
+        written = export_rows_to_csv(
+            rows,
+            output,
+            metadata={"indicator": "0004167"},
+            chunk_size=10,
+            total_rows=25,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert written == output.stat().st_size
+        assert progress == [(10, 25), (20, 25), (25, 25)]
+
+        df_read, meta_read = read_csv_with_metadata(output)
+        assert list(df_read.columns) == ["Period", "value"]
+        assert len(df_read) == 25
+        assert meta_read["indicator"] == "0004167"
+
 
 class TestJSONExport:
     """Tests for JSON export functionality."""
@@ -95,14 +172,29 @@ class TestJSONExport:
 
         assert "\n" not in json_str  # Compact has no newlines
 
+    @pytest.mark.parametrize(
+        "options",
+        [{"pretty": True}, {"pretty": False}, {"indent": 4}, {"ensure_ascii": True}],
+    )
+    def test_format_json_round_trips(self, options):
+        """Test every formatting mode parses back to the same data."""
+        data = {"região": "Norte", "values": [1.5, None], "nested": {"ok": True}}
+
+        json_str = format_json(data, **options)
+
+        assert json.loads(json_str) == data
+        if options.get("indent") == 4:
+            assert '\n    "região"' in json_str
+
     def test_export_to_json(self, tmp_path):
         """Test JSON file export."""
         data = {"indicator": "0004167", "values": [1, 2, 3]}
         output = tmp_path / "test.json"
 
-        export_to_json(data, output)
+        bytes_written = export_to_json(data, output)
 
         assert output.exists()
+        assert bytes_written == output.stat().st_size
 
         # Read back
         with open(output) as f:
@@ -110,6 +202,25 @@ class TestJSONExport:
 
         assert data_read == data
 
+    def test_export_to_json_formats(self, tmp_path):
+        """Test compact, pretty and ASCII-escaped exports round-trip identically."""
+        data = {"região": "Norte", "values": [1.5, None], "nested": {"ok": True}}
+
+        for name, options in (
+            ("compact", {"pretty": False}),
+            ("pretty", {"pretty": True}),
+            ("ascii", {"pretty": True, "indent": 4, "ensure_ascii": True}),
+        ):
+            output = tmp_path / f"{name}.json"
+            bytes_written = export_to_json(data, output, **options)
+
+            assert bytes_written == output.stat().st_size
+            with open(output, encoding="utf-8") as f:
+                assert json.load(f) == data
+
+        assert "região" in (tmp_path / "pretty.json").read_text(encoding="utf-8")
+        assert "\\u00e3" in (tmp_path / "ascii.json").read_text(encoding="utf-8")
+
     def test_export_to_jsonl(self, tmp_path):
         """Test JSON Lines export."""
         data = [
@@ -128,6 +239,56 @@ class TestJSONExport:
         assert len(data_read) == 2
         assert data_read[0]["id"] == 1
 
+    def test_export_to_jsonl_formats(self, tmp_path):
+        """Test UTF-8 and ASCII-escaped JSON Lines exports round-trip identically."""
+        data = [{"região": "Norte", "value": 1.5}, {"região": "Sul", "value": None}]
+
+        for name, ensure_ascii in (("utf8", False), ("ascii", True)):
+            output = tmp_path / f"{name}.jsonl"
+            export_to_jsonl(data, output, ensure_ascii=ensure_ascii)
+
+            assert read_jsonl(output) == data
+            assert output.read_text(encoding="utf-8").count("\n") == 2
+
+        assert "\\u00e3" in (tmp_path / "ascii.jsonl").read_text(encoding="utf-8")
+
+    def test_export_to_jsonl_without_orjson(self, tmp_path, monkeypatch):
+        """Test the json module fallback writes the same UTF-8 lines as orjson."""
+        from pyptine.processors import json as json_module
+
+        data = [{"região": "Norte", "value": 1.5}, {"região": "Sul", "value": None}]
+        monkeypatch.setattr(json_module, "ORJSON_AVAILABLE", False)
+        output = tmp_path / "fallback.jsonl"
+
+        export_to_jsonl(data, output)
+
+        assert output.read_text(encoding="utf-8").splitlines() == [
+            '{"região": "Norte", "value": 1.5}',
+            '{"região": "Sul", "value": null}',
+        ]
+
+    def test_read_jsonl_non_finite_values(self, tmp_path):
+        """Test lines with the NaN and Infinity literals written by the json module."""
+        output = tmp_path / "non_finite.jsonl"
+        output.write_text('{"value": NaN}\n\n{"value": Infinity}\n', encoding="utf-8")
+
+        data_read = read_jsonl(output)
+
+        assert len(data_read) == 2
+        assert data_read[0]["value"] != data_read[0]["value"]
+        assert data_read[1]["value"] == float("inf")
+
+    def test_merge_json_files(self, tmp_path):
+        """Test list and object files are merged into one list."""
+        first, second = tmp_path / "first.json", tmp_path / "second.json"
+        export_to_json([{"id": 1}, {"id": 2}], first)
+        export_to_json({"id": 3}, second)
+
+        merge_json_files([first, second], tmp_path / "merged.json")
+
+        with open(tmp_path / "merged.json", encoding="utf-8") as f:
+            assert json.load(f) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
     def test_read_jsonl_with_limit(self, tmp_path):
         """Test reading JSON Lines with max lines limit."""
         data = [{"id": i} for i in range(10)]
@@ -139,6 +300,7 @@ class TestJSONExport:
         data_read = read_jsonl(output, max_lines=3)
 
         assert len(data_read) == 3
+        assert read_jsonl(output, max_lines=0) == []
 
 
 class TestJSONFlattening:
@@ -164,6 +326,33 @@ class TestJSONFlattening:
         assert "items[0].name" in flattened
         assert flattened["items[0].name"] == "A"
 
+    def test_flatten_order_and_nested_lists(self):
+        """Test keys come out depth-first in input order; lists in lists stay values."""
+        nested = {"a": {"b": 1, "c": [{"d": 2}, [3, 4]]}, "e": 5, "f": {}}
+
+        flattened = flatten_json(nested, prefix="root")
+
+        assert list(flattened.items()) == [
+            ("root.a.b", 1),
+            ("root.a.c[0].d", 2),
+            ("root.a.c[1]", [3, 4]),
+            ("root.e", 5),
+        ]
+
+    def test_flatten_deep_nesting(self):
+        """Test nesting deeper than the recursion limit is flattened."""
+        nested: dict = {}
+        level = nested
+        for _ in range(5000):
+            level["x"] = {}
+            level = level["x"]
+        level["value"] = 1
+
+        flattened = flatten_json(nested)
+
+        assert list(flattened.values()) == [1]
+        assert next(iter(flattened)).count(".") == 5000
+
     def test_unflatten_json(self):
         """Test unflattening JSON."""
         flattened = {"indicator": "0004167", "metadata.source": "INE", "metadata.year": 2023}
@@ -191,3 +380,11 @@ class TestJSONFlattening:
         flattened = flatten_json(nested, separator="_")
 
         assert "a_b_c" in flattened
+
+    def test_flatten_key_building(self):
+        """Test separators, list indices and non-string keys combine into leaf keys."""
+        nested = {"a": [{"b": 1}, 2], 3: {4: "x"}}
+
+        flattened = flatten_json(nested, separator="_", prefix="p")
+
+        assert flattened == {"p_a[0]_b": 1, "p_a[1]": 2, "p_3_4": "x"}
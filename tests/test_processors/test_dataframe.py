@@ -1,16 +1,20 @@
 """Tests for DataFrame processing utilities."""
 
+import warnings
+
 import pandas as pd
 import pytest
 
 from pyptine.processors.dataframe import (
     aggregate_by_period,
     clean_dataframe,
+    dataframe_to_records,
     filter_by_geography,
     get_latest_period,
     json_to_dataframe,
     merge_metadata,
     pivot_by_dimension,
+    records_to_dataframe,
 )
 from pyptine.utils.exceptions import DataProcessingError
 
@@ -66,6 +70,17 @@ class TestJsonToDataFrame:
         if value_col:
             assert pd.api.types.is_numeric_dtype(df[value_col])
 
+    def test_period_parsing(self):
+        """Test year periods stay text while other period labels become dates."""
+        years = json_to_dataframe([{"periodo": p, "valor": "1"} for p in ["2023", "2022"] * 3])
+        months = json_to_dataframe(
+            [{"periodo": p, "valor": "1"} for p in ["2023-01", "2023-02", "2023-01"]]
+        )
+
+        assert years["periodo"].tolist() == ["2023", "2022"] * 3
+        assert pd.api.types.is_datetime64_any_dtype(months["periodo"])
+        assert months["periodo"].dt.month.tolist() == [1, 2, 1]
+
 
 class TestPivotByDimension:
     """Tests for pivot_by_dimension function."""
@@ -106,6 +121,22 @@ class TestPivotByDimension:
         assert ("valor2", "South") in pivoted.columns
         assert len(pivoted) > 0
 
+    def test_pivot_categorical_columns(self):
+        """Test categorical columns only produce the label combinations that occur."""
+        df = pd.DataFrame(
+            {
+                "periodo": pd.Categorical(["2023", "2023", "2022"], ["2021", "2022", "2023"]),
+                "geo": pd.Categorical(["PT", "PT", "ES"]),
+                "region": ["North", "South", "North"],
+                "valor": [100.0, 200.0, 150.0],
+            }
+        )
+
+        pivoted = pivot_by_dimension(df, "region")
+
+        assert list(pivoted.index) == [("2022", "ES"), ("2023", "PT")]
+        assert pivoted.loc[("2023", "PT"), ("valor", "South")] == 200
+
 
 class TestCleanDataFrame:
     """Tests for clean_dataframe function."""
@@ -131,6 +162,21 @@ class TestCleanDataFrame:
         assert "new_name" in renamed.columns
         assert "old_name" not in renamed.columns
 
+    @pytest.mark.parametrize(
+        "drop_internal_columns, rename_columns",
+        [(True, None), (False, {"data": "renamed"}), (False, None), (True, {"data": "renamed"})],
+    )
+    def test_result_is_independent(self, drop_internal_columns, rename_columns):
+        """Test writes to the cleaned frame never reach the input, whatever was cleaned."""
+        df = pd.DataFrame({"_internal": [1, 2], "data": [4, 5], 0: [7, 8]})
+
+        cleaned = clean_dataframe(df, drop_internal_columns, rename_columns)
+        cleaned.iloc[0, -1] = -1
+
+        assert cleaned is not df
+        assert df[0].tolist() == [7, 8]
+        assert ("_internal" in cleaned.columns) is not drop_internal_columns
+
 
 class TestMergeMetadata:
     """Tests for merge_metadata function."""
@@ -155,6 +201,28 @@ class TestMergeMetadata:
 
         assert "info_source" in result.columns
 
+    def test_existing_column_replaced_in_place(self):
+        """Test metadata named like an existing column replaces it, keeping its position."""
+        df = pd.DataFrame({"meta_unit": ["x", "y"], "value": [1, 2]})
+
+        result = merge_metadata(df, {"unit": "No.", "source": "INE"})
+
+        assert list(result.columns) == ["meta_unit", "value", "meta_source"]
+        assert result["meta_unit"].tolist() == ["No.", "No."]
+        assert df["meta_unit"].tolist() == ["x", "y"]
+
+    def test_many_metadata_columns(self):
+        """Test many metadata entries are added without fragmenting the frame."""
+        df = pd.DataFrame({"value": [1, 2, 3]})
+        metadata = {f"key{i}": i for i in range(150)}
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", pd.errors.PerformanceWarning)
+            result = merge_metadata(df, metadata)
+
+        assert list(result.columns[1:]) == [f"meta_key{i}" for i in range(150)]
+        assert result["meta_key149"].tolist() == [149, 149, 149]
+
 
 class TestAggregateByPeriod:
     """Tests for aggregate_by_period function."""
@@ -200,6 +268,20 @@ class TestAggregateByPeriod:
         assert agg["valor1"].iloc[1] == 300  # 100 + 200
         assert agg["valor2"].iloc[1] == 30  # 10 + 20
 
+    def test_aggregate_skips_unused_categories(self):
+        """Test unused categorical periods do not appear as empty groups."""
+        df = pd.DataFrame(
+            {
+                "periodo": pd.Categorical(["2023", "2023", "2022"], ["2021", "2022", "2023"]),
+                "valor": [100.0, 200.0, 150.0],
+            }
+        )
+
+        agg = aggregate_by_period(df)
+
+        assert agg["periodo"].tolist() == ["2022", "2023"]
+        assert agg["valor"].tolist() == [150.0, 300.0]
+
 
 class TestFilterByGeography:
     """Tests for filter_by_geography function."""
@@ -229,6 +311,46 @@ class TestFilterByGeography:
 
         assert len(filtered) == 1
 
+    @pytest.mark.parametrize("dtype", [object, "category"])
+    def test_filter_repeated_labels(self, dtype):
+        """Test every row of a matching label is kept, for plain and categorical columns."""
+        df = pd.DataFrame(
+            {
+                "geodsg": pd.Series(["Lisboa", "Porto", "Grande Lisboa", "Porto", "Lisboa"]).astype(
+                    dtype
+                ),
+                "valor": [1, 2, 3, 4, 5],
+            }
+        )
+
+        filtered = filter_by_geography(df, "lisboa")
+
+        assert filtered["valor"].tolist() == [1, 3, 5]
+
+    def test_filter_matches_literal_text(self):
+        """Test the geography is matched as text, not as a regular expression."""
+        df = pd.DataFrame({"geodsg": ["Lisboa (AM)", "Lisboa", "Porto"], "valor": [1, 2, 3]})
+
+        filtered = filter_by_geography(df, "Lisboa (AM)")
+
+        assert filtered["valor"].tolist() == [1]
+
+    def test_filter_skips_missing_labels(self):
+        """Test rows without a geography label are never matched."""
+        df = pd.DataFrame({"geodsg": ["Viana", None, float("nan")], "valor": [1, 2, 3]})
+
+        filtered = filter_by_geography(df, "na")
+
+        assert filtered["valor"].tolist() == [1]
+
+    def test_filter_casefolds_labels(self):
+        """Test case-insensitive matching uses full case folding."""
+        df = pd.DataFrame({"geodsg": ["Großraum", "Grossraum", "Porto"], "valor": [1, 2, 3]})
+
+        filtered = filter_by_geography(df, "GROSS")
+
+        assert filtered["valor"].tolist() == [1, 2]
+
 
 class TestGetLatestPeriod:
     """Tests for get_latest_period function."""
@@ -253,9 +375,100 @@ class TestGetLatestPeriod:
         assert len(unique_periods) <= 2
         assert "2023" in unique_periods
 
+    @pytest.mark.parametrize("dtype", [object, "category"])
+    def test_latest_periods_newest_first(self, dtype):
+        """Test every row of the latest periods is returned, newest period first."""
+        df = pd.DataFrame(
+            {
+                "periodo": pd.Series(["2022", "2023", "2021", "2023", "2022"], dtype=dtype),
+                "valor": [1, 2, 3, 4, 5],
+            }
+        )
+
+        latest = get_latest_period(df, n=2)
+
+        assert latest["periodo"].tolist() == ["2023", "2023", "2022", "2022"]
+        assert latest["valor"].tolist() == [2, 4, 1, 5]
+
     def test_missing_period_column(self):
         """Test error when period column missing."""
         df = pd.DataFrame({"data": [1, 2, 3]})
 
         with pytest.raises(ValueError, match="Period column"):
             get_latest_period(df)
+
+
+class TestDataFrameToRecords:
+    """Tests for dataframe_to_records function."""
+
+    def test_matches_to_dict(self):
+        """Test conversion matches DataFrame.to_dict(orient="records") across dtypes."""
+        df = pd.DataFrame(
+            {
+                "periodo": pd.Categorical(["2022", "2023", "2023"]),
+                "geo": ["PT", None, "Norte"],
+                "valor": [1.5, 2.0, 3.25],
+                "count": [1, 2, 3],
+                "flag": [True, False, True],
+                "date": pd.to_datetime(["2022-01-01", "2023-01-01", "2023-06-01"]),
+            }
+        )
+
+        records = dataframe_to_records(df)
+
+        expected = df.to_dict(orient="records")
+        assert pd.isna(records[1]["geo"]) and pd.isna(expected[1]["geo"])
+        for row, expected_row in zip(records, expected):
+            assert list(row) == list(expected_row)
+            for key in ("periodo", "valor", "count", "flag", "date"):
+                assert row[key] == expected_row[key]
+                assert type(row[key]) is type(expected_row[key])
+
+    def test_empty_dataframe(self):
+        """Test empty DataFrame gives no records."""
+        assert dataframe_to_records(pd.DataFrame({"valor": []})) == []
+
+    def test_arbitrary_column_names(self):
+        """Test column names are used as keys verbatim, whatever their content."""
+        df = pd.DataFrame({"a'}, b": [1.5], 'x"): (': ["y"], 7: [None]})
+
+        assert dataframe_to_records(df) == [{"a'}, b": 1.5, 'x"): (': "y", 7: None}]
+
+    def test_duplicate_column_labels(self):
+        """Test duplicate labels warn and keep the last column, as to_dict does."""
+        df = pd.DataFrame([[1, "x", 3], [4, "y", 6]], columns=["valor", "geo", "valor"])
+
+        with pytest.warns(UserWarning, match="not unique"):
+            records = dataframe_to_records(df)
+        with pytest.warns(UserWarning, match="not unique"):
+            expected = df.to_dict(orient="records")
+
+        assert records == expected == [{"valor": 3, "geo": "x"}, {"valor": 6, "geo": "y"}]
+
+
+class TestRecordsToDataFrame:
+    """Tests for records_to_dataframe function."""
+
+    def test_matches_dataframe_constructor(self):
+        """Test conversion matches pd.DataFrame(records), including ragged rows."""
+        uniform = [{"periodo": "2022", "valor": 1.5}, {"periodo": "2023", "valor": None}]
+        missing = [{"periodo": "2022", "valor": 1.5}, {"periodo": "2023"}]
+        extra = [{"periodo": "2022"}, {"periodo": "2023", "valor": 2.0}]
+
+        for records in (uniform, missing, extra):
+            pd.testing.assert_frame_equal(records_to_dataframe(records), pd.DataFrame(records))
+
+    def test_ragged_rows_keep_first_appearance_order(self, mocker):
+        """Test keys missing from the first row are added in the order they appear."""
+        records = [{"periodo": "2022"}, {"valor": 2.0, "periodo": "2023"}, {"geocod": "PT"}]
+        from_records = mocker.spy(pd.DataFrame, "from_records")
+
+        df = records_to_dataframe(records)
+
+        assert list(df.columns) == ["periodo", "valor", "geocod"]
+        assert from_records.call_count == 1
+        pd.testing.assert_frame_equal(df, pd.DataFrame(records))
+
+    def test_empty_records(self):
+        """Test empty input gives an empty DataFrame."""
+        assert records_to_dataframe([]).empty
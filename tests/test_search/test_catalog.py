@@ -1,5 +1,7 @@
 """Tests for CatalogueBrowser functionality."""
 
+from itertools import islice
+
 import pytest
 import responses
 
@@ -106,6 +108,45 @@ class TestCatalogueBrowser:
         assert len(results) > 0
         assert all(isinstance(ind, Indicator) for ind in results)
 
+    @responses.activate
+    def test_iter_indicators(self, browser, sample_catalogue):
+        """Test lazy listing of indicators with theme filter."""
+        responses.add(
+            responses.GET,
+            "https://www.ine.pt/ine/xml_indic.jsp",
+            body=sample_catalogue,
+            status=200,
+            content_type="application/xml",
+        )
+
+        all_indicators = list(browser.iter_indicators())
+        assert [ind.varcd for ind in all_indicators] == [
+            ind.varcd for ind in browser.get_all_indicators()
+        ]
+
+        population = list(browser.iter_indicators(theme="population"))
+        assert len(population) == len(all_indicators)
+        assert list(browser.iter_indicators(theme="Population", case_sensitive=True))
+        assert not list(browser.iter_indicators(theme="population", case_sensitive=True))
+        assert not list(browser.iter_indicators(theme="Nonexistent"))
+
+    @responses.activate
+    def test_isearch_matches_search(self, browser, sample_catalogue):
+        """Test that the lazy search yields the same results as search()."""
+        responses.add(
+            responses.GET,
+            "https://www.ine.pt/ine/xml_indic.jsp",
+            body=sample_catalogue,
+            status=200,
+            content_type="application/xml",
+        )
+
+        expected = [ind.varcd for ind in browser.search("population")]
+        assert [ind.varcd for ind in browser.isearch("population")] == expected
+
+        first = list(islice(browser.isearch("population"), 1))
+        assert [ind.varcd for ind in first] == expected[:1]
+
     @responses.activate
     def test_list_themes(self, browser, sample_catalogue):
         """Test listing all themes."""
@@ -1,17 +1,15 @@
 """Tests for chart visualization functions."""
 
-import pytest
-
-try:
-    import plotly.graph_objects as go
-
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+import subprocess
+import sys
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from pyptine.visualization.charts import (
+    _downsample_lines,
+    _m4_downsample,
     plot_area_chart,
     plot_bar_chart,
     plot_indicator,
@@ -19,8 +17,13 @@ from pyptine.visualization.charts import (
     plot_scatter_chart,
 )
 
+go = pytest.importorskip("plotly.graph_objects")
+
+# The sample fixtures are built once per module; the chart functions never
+# modify their input (see test_plot_indicator_leaves_dataframe_untouched)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_data():
     """Sample data for visualization tests."""
     return [
@@ -31,13 +34,52 @@ def sample_data():
     ]
 
 
-@pytest.fixture
-def sample_dataframe(sample_data):
-    """Sample DataFrame for visualization tests."""
-    return pd.DataFrame(sample_data)
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
+def sample_dataframe():
+    """Sample DataFrame for visualization tests, with datetime periods."""
+    return pd.DataFrame(
+        {
+            "Period": pd.to_datetime(["2020", "2021", "2022", "2023"], format="%Y"),
+            "value": np.array([100, 110, 120, 132], dtype=np.int32),
+            "region": pd.Categorical(["PT"] * 4),
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def large_timeseries():
+    """50,000-row series, built with NumPy rather than row by row."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"Period": np.arange(50_000), "value": rng.standard_normal(50_000)})
+
+
+@pytest.fixture(scope="module")
+def huge_series():
+    """500,000-row random walk with increasing numeric periods."""
+    rng = np.random.default_rng(1)
+    return pd.DataFrame(
+        {"Period": np.arange(500_000), "value": rng.standard_normal(500_000).cumsum()}
+    )
+
+
+@pytest.fixture(scope="module")
+def scatter_large():
+    """100,000 random points with a size and a three-region colour column."""
+    rng = np.random.default_rng(0)
+    points = rng.standard_normal((100_000, 2))
+    return pd.DataFrame(
+        {
+            "x": points[:, 0],
+            "y": points[:, 1],
+            "size": rng.uniform(1, 10, 100_000),
+            "region": np.array(["Norte", "Centro", "Sul"], dtype=object)[
+                rng.integers(0, 3, 100_000)
+            ],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
 def sample_multiregion_data():
     """Sample data with multiple regions for coloring."""
     return [
@@ -50,45 +92,64 @@ def sample_multiregion_data():
     ]
 
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestPlotIndicator:
     """Tests for plot_indicator function."""
 
-    def test_plot_indicator_line(self, sample_data):
-        """Test creating a line chart."""
-        fig = plot_indicator(sample_data, title="Test Indicator", chart_type="line")
+    @pytest.mark.parametrize(
+        "chart_type, trace_type",
+        [("line", "scatter"), ("bar", "bar"), ("area", "scatter"), ("scatter", "scatter")],
+    )
+    def test_plot_indicator_chart_types(self, sample_data, chart_type, trace_type):
+        """Test creating each chart type."""
+        fig = plot_indicator(sample_data, title="Test Indicator", chart_type=chart_type)
 
         assert fig is not None
         assert isinstance(fig, go.Figure)
         assert fig.layout.title.text == "Test Indicator"
+        assert fig.data[0].type == trace_type
 
-    def test_plot_indicator_bar(self, sample_data):
-        """Test creating a bar chart."""
-        fig = plot_indicator(sample_data, title="Test Indicator", chart_type="bar")
+    def test_plot_indicator_with_dataframe(self, sample_dataframe):
+        """Test plot_indicator with DataFrame input."""
+        fig = plot_indicator(sample_dataframe, title="Test", chart_type="line")
 
         assert fig is not None
         assert isinstance(fig, go.Figure)
 
-    def test_plot_indicator_area(self, sample_data):
-        """Test creating an area chart."""
-        fig = plot_indicator(sample_data, title="Test Indicator", chart_type="area")
+    @pytest.mark.parametrize("chart_type", ["line", "bar", "area", "scatter"])
+    def test_plot_indicator_reads_dataframe_view(self, sample_dataframe, chart_type, mocker):
+        """Test a DataFrame view is plotted as is, without the chart copying it."""
+        view = sample_dataframe.iloc[1:]
+        copy = mocker.spy(pd.DataFrame, "copy")
 
-        assert fig is not None
-        assert isinstance(fig, go.Figure)
+        fig = plot_indicator(view, chart_type=chart_type)
 
-    def test_plot_indicator_scatter(self, sample_data):
-        """Test creating a scatter chart."""
-        fig = plot_indicator(sample_data, title="Test Indicator", chart_type="scatter")
+        assert copy.call_count == 0
+        assert list(fig.data[0].y) == [110, 120, 132]
 
-        assert fig is not None
-        assert isinstance(fig, go.Figure)
+    @pytest.mark.parametrize("chart_type", ["line", "bar", "area", "scatter"])
+    def test_plot_indicator_keeps_datetime_periods(self, sample_dataframe, chart_type):
+        """Test datetime periods reach the figure as datetimes rather than strings."""
+        fig = plot_indicator(sample_dataframe, chart_type=chart_type)
 
-    def test_plot_indicator_with_dataframe(self, sample_dataframe):
-        """Test plot_indicator with DataFrame input."""
-        fig = plot_indicator(sample_dataframe, title="Test", chart_type="line")
+        assert np.issubdtype(np.asarray(fig.data[0].x).dtype, np.datetime64)
 
-        assert fig is not None
-        assert isinstance(fig, go.Figure)
+    def test_plot_indicator_leaves_dataframe_untouched(self, sample_dataframe):
+        """Test that charts read the caller's DataFrame without modifying it."""
+        expected = sample_dataframe.copy()
+
+        for chart_type in ("line", "bar", "area", "scatter"):
+            plot_indicator(sample_dataframe, chart_type=chart_type, color_column="region")
+
+        pd.testing.assert_frame_equal(sample_dataframe, expected)
+
+    def test_plot_indicator_leaves_records_untouched(self, sample_multiregion_data):
+        """Test that charts read the caller's records without modifying them."""
+        expected = [row.copy() for row in sample_multiregion_data]
+
+        for chart_type in ("line", "bar", "area", "scatter"):
+            plot_indicator(sample_multiregion_data, chart_type=chart_type, color_column="region")
+
+        assert sample_multiregion_data == expected
 
     def test_plot_indicator_invalid_chart_type(self, sample_data):
         """Test plot_indicator with invalid chart type."""
@@ -96,10 +157,16 @@ class TestPlotIndicator:
             plot_indicator(sample_data, chart_type="invalid")
 
     def test_plot_indicator_empty_data(self):
-        """Test plot_indicator with empty data."""
+        """Test plot_indicator with empty data gives a styled figure without traces."""
         fig = plot_indicator([], title="Empty")
+        other = plot_indicator(pd.DataFrame(), title="Empty")
 
-        assert fig is None
+        assert isinstance(fig, go.Figure)
+        assert len(fig.data) == 0
+        assert fig.layout.title.text == "Empty"
+        assert fig.layout.plot_bgcolor == "rgba(240, 240, 240, 0.5)"
+        assert fig.layout.uirevision == "Empty"
+        assert other is not fig
 
     def test_plot_indicator_with_color_column(self, sample_multiregion_data):
         """Test plot_indicator with color column."""
@@ -113,8 +180,56 @@ class TestPlotIndicator:
         assert fig is not None
         assert isinstance(fig, go.Figure)
 
+    @pytest.mark.parametrize("chart_type", ["line", "bar", "area", "scatter"])
+    def test_color_groups_added_in_one_batch(self, chart_type, mocker):
+        """Test every colour group becomes a trace without per-trace add_trace calls."""
+        data = [
+            {"Period": str(year), "value": year + i, "region": f"R{i}"}
+            for i in range(12)
+            for year in (2021, 2022)
+        ]
+        add_trace = mocker.spy(go.Figure, "add_trace")
+
+        fig = plot_indicator(data, chart_type=chart_type, color_column="region")
+
+        assert add_trace.call_count == 0
+        assert [trace.name for trace in fig.data] == [f"R{i}" for i in range(12)]
+        assert fig.layout.plot_bgcolor == "rgba(240, 240, 240, 0.5)"
+
+    @pytest.mark.parametrize("chart_type", ["line", "bar", "area", "scatter"])
+    def test_text_color_column_passed_as_categorical(self, chart_type, mocker):
+        """Test a text colour column reaches plotly express as categorical, legend order kept."""
+        import plotly.express
+
+        df = pd.DataFrame(
+            {
+                "Period": ["2021", "2021", "2021", "2022", "2022"],
+                "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+                "region": ["Norte", "Centro", None, "Norte", "Centro"],
+            }
+        )
+        px_function = mocker.spy(plotly.express, chart_type)
+
+        fig = plot_indicator(df, chart_type=chart_type, color_column="region")
+
+        plotted = px_function.call_args.args[0]
+        assert isinstance(plotted["region"].dtype, pd.CategoricalDtype)
+        assert list(plotted["region"].cat.categories) == ["Norte", "Centro"]
+        assert [trace.name for trace in fig.data] == ["Norte", "Centro"]
+        assert df["region"].dtype != "category"
+
+    def test_numeric_color_column_unchanged(self, mocker):
+        """Test a numeric colour column keeps its dtype (plotly draws it with a colour scale)."""
+        import plotly.express
+
+        df = pd.DataFrame({"Period": ["2021", "2022"], "value": [1.0, 2.0], "size": [3, 4]})
+        scatter = mocker.spy(plotly.express, "scatter")
+
+        plot_indicator(df, chart_type="scatter", color_column="size")
+
+        assert scatter.call_args.args[0] is df
+
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestLineChart:
     """Tests for plot_line_chart function."""
 
@@ -149,7 +264,6 @@ class TestLineChart:
         assert isinstance(fig, go.Figure)
 
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestBarChart:
     """Tests for plot_bar_chart function."""
 
@@ -171,7 +285,6 @@ class TestBarChart:
         assert isinstance(fig, go.Figure)
 
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestAreaChart:
     """Tests for plot_area_chart function."""
 
@@ -193,7 +306,6 @@ class TestAreaChart:
         assert isinstance(fig, go.Figure)
 
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestScatterChart:
     """Tests for plot_scatter_chart function."""
 
@@ -225,8 +337,22 @@ class TestScatterChart:
 
         assert isinstance(fig, go.Figure)
 
+    def test_large_scatter_with_size_uses_webgl(self, scatter_large):
+        """Test sized and coloured large scatters keep every point in WebGL traces."""
+        fig = plot_scatter_chart(
+            scatter_large,
+            x_column="x",
+            y_column="y",
+            color_column="region",
+            size_column="size",
+        )
+
+        assert [trace.type for trace in fig.data] == ["scattergl"] * 3
+        assert sum(len(trace.x) for trace in fig.data) == 100_000
+        for trace in fig.data:
+            assert len(trace.marker.size) == len(trace.x)
+
 
-@pytest.mark.skipif(not PLOTLY_AVAILABLE, reason="plotly not installed")
 class TestChartLayout:
     """Tests for chart layout and styling."""
 
@@ -239,6 +365,41 @@ class TestChartLayout:
         assert fig.layout.paper_bgcolor is not None
         assert fig.layout.font is not None
 
+    @pytest.mark.parametrize(
+        "chart_type, hovermode",
+        [("line", "x unified"), ("bar", "x"), ("area", "x unified"), ("scatter", "closest")],
+    )
+    def test_styling_matches_validated_layout(self, sample_data, chart_type, hovermode):
+        """Test the unvalidated layout update gives what update_layout() would."""
+        fig = plot_indicator(sample_data, chart_type=chart_type)
+        expected = go.Figure(fig)
+        expected.update_layout(
+            plot_bgcolor="rgba(240, 240, 240, 0.5)",
+            paper_bgcolor="white",
+            font={"family": "Arial, sans-serif", "size": 12},
+            hovermode=hovermode,
+            uirevision="Indicator Data",
+        )
+
+        assert fig.to_dict()["layout"] == expected.to_dict()["layout"]
+        assert fig.layout.hovermode == hovermode
+
+    @pytest.mark.parametrize("chart_type", ["line", "bar", "area", "scatter"])
+    def test_chart_has_uirevision(self, sample_data, chart_type):
+        """Test uirevision follows the title, so redraws keep the user's zoom and pan."""
+        fig = plot_indicator(sample_data, title="Population", chart_type=chart_type)
+        custom = plot_indicator(sample_data, chart_type=chart_type, uirevision="fixed")
+
+        assert fig.layout.uirevision == "Population"
+        assert custom.layout.uirevision == "fixed"
+
+    def test_figures_do_not_share_layout(self, sample_data):
+        """Test editing one chart's layout leaves later charts unchanged."""
+        fig = plot_line_chart(sample_data)
+        fig.layout.font.size = 20
+
+        assert plot_line_chart(sample_data).layout.font.size == 12
+
     def test_chart_title_formatting(self, sample_data):
         """Test that chart titles are properly formatted."""
         title = "Population Growth 2020-2023"
@@ -255,3 +416,116 @@ class TestChartLayout:
         assert line_fig.layout.hovermode == "x unified"
         # Bar chart should have standard hover mode
         assert bar_fig.layout.hovermode == "x"
+
+
+@pytest.mark.parametrize("chart_function", [plot_line_chart, plot_scatter_chart])
+class TestRenderMode:
+    """Tests for WebGL rendering of large line and scatter charts."""
+
+    def test_large_data_uses_webgl(self, chart_function, large_timeseries):
+        """Test large series are drawn with Scattergl traces."""
+        fig = chart_function(large_timeseries)
+
+        assert fig.data[0].type == "scattergl"
+        assert len(fig.data[0].y) == 50_000
+
+    def test_small_data_uses_svg(self, chart_function, large_timeseries):
+        """Test series up to the threshold keep SVG scatter traces."""
+        fig = chart_function(large_timeseries.head(1000))
+
+        assert fig.data[0].type == "scatter"
+
+    def test_render_mode_override(self, chart_function, large_timeseries):
+        """Test an explicit render_mode takes precedence."""
+        fig = chart_function(large_timeseries, render_mode="svg")
+
+        assert fig.data[0].type == "scatter"
+
+
+def test_plotly_imported_on_first_chart():
+    """Test importing pyptine does not load plotly until a chart is created."""
+    code = (
+        "import sys, pyptine, pyptine.visualization\n"
+        "assert 'plotly' not in sys.modules\n"
+        "from pyptine.visualization import plot_line_chart\n"
+        "assert 'plotly' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestDownsampling:
+    """Tests for M4 downsampling of line and area charts."""
+
+    @pytest.mark.parametrize("chart_function", [plot_line_chart, plot_area_chart])
+    def test_points_bounded_by_width(self, chart_function, huge_series):
+        """Test a long series is cut to at most 4 points per pixel, keeping its shape."""
+        fig = chart_function(huge_series, title="M4", pixel_width=1000)
+        trace = fig.data[0]
+
+        assert len(trace.x) <= 4000
+        assert list(trace.x) == sorted(trace.x)
+        assert (trace.x[0], trace.x[-1]) == (0, 499_999)
+        assert min(trace.y) == huge_series["value"].min()
+        assert max(trace.y) == huge_series["value"].max()
+
+    def test_extremes_kept_per_bucket(self):
+        """Test each bucket keeps its first, last, minimum and maximum rows."""
+        df = pd.DataFrame({"Period": np.arange(12), "value": [5, 9, 1, 4, 2, 3, 8, 0, 7, 6, 6, 6]})
+
+        fig = plot_line_chart(df, pixel_width=2, markers=False)
+
+        assert list(fig.data[0].x) == [0, 1, 2, 5, 6, 7, 11]
+
+    def test_each_colour_group_downsampled(self, huge_series):
+        """Test every line of a coloured chart is reduced separately."""
+        df = huge_series.assign(region=np.where(huge_series["Period"] % 2 == 0, "A", "B"))
+
+        fig = plot_line_chart(df, color_column="region", pixel_width=100)
+
+        assert [trace.name for trace in fig.data] == ["A", "B"]
+        assert all(len(trace.x) <= 400 for trace in fig.data)
+
+    def test_colour_groups_reduced_together(self):
+        """Test reducing all lines at once matches reducing each line on its own."""
+        rng = np.random.default_rng(2)
+        regions = np.array(["Norte", "Centro", "Sul", "Ilhas"], dtype=object)
+        df = pd.DataFrame(
+            {
+                "Period": rng.permutation(20_000) % 5_000,
+                "value": np.where(rng.random(20_000) < 0.05, np.nan, rng.standard_normal(20_000)),
+                "region": regions[rng.integers(0, 3, 20_000)],
+            }
+        )
+        # A line short enough to be kept whole, in its original order
+        df.loc[[5, 3, 8], "region"] = "Ilhas"
+
+        reduced = _downsample_lines(df, "Period", "value", "region", 50)
+
+        expected = pd.concat(
+            [
+                _m4_downsample(group, "Period", "value", 50)
+                for _, group in df.groupby("region", sort=False)
+            ]
+        )
+        assert list(reduced.index) == list(expected.index)
+        assert list(reduced.loc[reduced["region"] == "Ilhas"].index) == [3, 5, 8]
+
+    def test_labels_bucketed_by_position(self):
+        """Test non-numeric periods are bucketed by row position."""
+        df = pd.DataFrame({"Period": [f"P{i}" for i in range(1000)], "value": np.arange(1000.0)})
+
+        fig = plot_line_chart(df, pixel_width=10)
+
+        assert len(fig.data[0].x) == 20
+        assert (fig.data[0].x[0], fig.data[0].x[-1]) == ("P0", "P999")
+
+    def test_small_data_unchanged(self, sample_data):
+        """Test data already within the limit is plotted as is."""
+        fig = plot_line_chart(sample_data, pixel_width=1)
+
+        assert len(fig.data[0].x) == 4
+
+    def test_invalid_pixel_width(self, sample_data):
+        """Test a non-positive width is rejected."""
+        with pytest.raises(ValueError, match="pixel_width"):
+            plot_line_chart(sample_data, pixel_width=0)